@@ -1,12 +1,83 @@
 import cmd2
 from datetime import datetime
 from cli.common.base_tool import BaseTool
-from cli.common.util.server_utils import save_to_server
+from cli.common.util.history_shipper import get_history_shipper
+
+# cmd2가 get_names()에서 찾는 접두사 (인스턴스에 동적으로 추가되는 명령/도움말/자동완성)
+_DYNAMIC_PREFIXES = ("do_", "help_", "complete_")
+
+# 클래스별 (dir(cls) 결과, do_* 명령 이름 집합) 캐시. 클래스 정의는 실행 중 바뀌지 않으므로 한 번만 계산
+_class_registry = {}
+
+
+def _get_class_registry(cls):
+    entry = _class_registry.get(cls)
+    if entry is None:
+        names = tuple(dir(cls))
+        commands = frozenset(
+            name[3:] for name in names
+            if name.startswith("do_") and callable(getattr(cls, name, None))
+        )
+        entry = (names, commands)
+        _class_registry[cls] = entry
+    return entry
+
 
 class BaseCLI(cmd2.Cmd, BaseTool):
     def __init__(self):
         super().__init__()
         self.debug = True
+        self.history_shipper = get_history_shipper()
+
+    # ---------- 명령 레지스트리 ----------
+    def _get_command_registry(self):
+        """
+        (get_names 결과, do_* 명령 이름 집합)을 반환합니다.
+        클래스 부분은 클래스별로 한 번만, 인스턴스에 동적으로 추가된 명령은
+        refresh_command_registry() 호출 시에만 다시 계산
+        """
+        registry = self.__dict__.get("_command_registry")
+        if registry is None:
+            class_names, class_commands = _get_class_registry(type(self))
+            class_name_set = set(class_names)
+            extra = [
+                name for name in vars(self)
+                if name.startswith(_DYNAMIC_PREFIXES) and name not in class_name_set
+            ]
+            names = sorted(class_names + tuple(extra)) if extra else list(class_names)
+            commands = class_commands | {
+                name[3:] for name in extra
+                if name.startswith("do_") and callable(getattr(self, name, None))
+            }
+            registry = (names, commands)
+            self.__dict__["_command_registry"] = registry
+        return registry
+
+    def refresh_command_registry(self):
+        """명령을 동적으로 추가/삭제한 뒤 호출"""
+        self.__dict__.pop("_command_registry", None)
+
+    def register_command_set(self, *args, **kwargs):
+        super().register_command_set(*args, **kwargs)
+        self.refresh_command_registry()
+
+    def unregister_command_set(self, *args, **kwargs):
+        super().unregister_command_set(*args, **kwargs)
+        self.refresh_command_registry()
+
+    def get_names(self):
+        return list(self._get_command_registry()[0])
+
+    def is_command(self, name: str) -> bool:
+        """do_<name> 명령이 있는지 여부 ('-'는 '_'로 취급)"""
+        return name.replace("-", "_") in self._get_command_registry()[1]
+
+    def get_command_func(self, name: str):
+        """명령 이름('-' 허용)에 해당하는 do_* 메서드를 반환 (없으면 None)"""
+        name = name.replace("-", "_")
+        if name not in self._get_command_registry()[1]:
+            return None
+        return getattr(self, f"do_{name}", None)
 
     def onecmd_plus_hooks(self, line, *args, **kwargs):
         line = line.strip()
@@ -38,14 +109,7 @@ class BaseCLI(cmd2.Cmd, BaseTool):
                 pass
 
         # 커맨드 로그 기록
-        is_do_command = (
-            command_name in {
-                name[3:] for name in dir(self)
-                if name.startswith("do_")
-                and name != "do_exit"
-                and callable(getattr(self, name))
-            }
-        )
+        is_do_command = command_name != "exit" and self.is_command(command_name)
 
         if is_do_command and not getattr(self, "_logging_in_progress", False): ## 외부 호출일때만 실행
             self._logging_in_progress = True ## True로 되면 내부호출로 인식 if문을 타지 않음 -> 로그 기록 x
@@ -55,13 +119,8 @@ class BaseCLI(cmd2.Cmd, BaseTool):
                 result_str = "RESULT: OK" if status is True else "RESULT: NOK"
                 line_log = f"{timestamp} | {prompt} | {line} | {result_str}\n"
 
-                # 로그 저장용 임시 파일 생성
-                temp_log_path = "/tmp/command_history.log"
-                with open(temp_log_path, "w", encoding="utf-8") as f:
-                    f.write(line_log)
-
-                # 서버에 로그 파일 저장 요청
-                save_to_server(self, output_path=temp_log_path, purpose="log")
+                # 이력 버퍼에 추가 (서버 전송은 백그라운드에서 묶어서 처리)
+                self.history_shipper.record(line_log)
 
                 if is_semicolon:
                     self.poutput(result_str)
@@ -72,6 +131,7 @@ class BaseCLI(cmd2.Cmd, BaseTool):
                 self._logging_in_progress = False
 
         if command_name == "exit":
+            self.history_shipper.flush()
             return result
         return False
 
@@ -1,6 +1,5 @@
 import os
 import re
-import openpyxl
 import json
 import xml.etree.ElementTree as ET
 from cli.settings import is_debug
@@ -57,6 +56,7 @@ class BaseTool():
             return
 
         try:
+            import openpyxl  # 무거운 모듈이므로 사용 시점에 import (시작 시간 단축)
             wb = openpyxl.load_workbook(excel_path, data_only=True)
             sheet = wb["Parameter List"]
         except KeyError:
@@ -165,6 +165,7 @@ class BaseTool():
             return
 
         try:
+            import openpyxl
             wb = openpyxl.load_workbook(excel_path, data_only=True)
             sheet = wb["Parameter List"]
         except KeyError:
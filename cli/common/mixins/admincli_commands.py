@@ -7,6 +7,8 @@ from cli.settings import grpc_stub
 from cli.settings import is_debug
 
 from cli.common.util.server_utils import load_from_server
+from cli.common.util.job_utils import run_job
+from cli.common.util.ref_cache import load_cached
 
 class AdminCliCommandMixin:
     def _next_request_id(self) -> int:
@@ -133,7 +135,7 @@ class AdminCliCommandMixin:
         if is_debug:
             print("self.bts_id : ", self.bts_id)
         request = message_pb2.Request(command="generateScf", payload=self.bts_id)
-        response = grpc_stub.SendCommand(request)
+        response = run_job(self, request)
         if response.success:
             self.config.set("cmd_status", True)
             if is_debug:
@@ -184,7 +186,7 @@ class AdminCliCommandMixin:
                 self.perror("[오류] prodCodePlanned 값이 없습니다.")
                 return
             
-            data = load_from_server("PRODMAPTBL.json", "json", "prodmap")
+            data = load_cached("PRODMAPTBL.json", "json", "prodmap")
             prod_dict = data.get("PRODMAPTBL", {}).get("value", {}) if data else {}
             if not prod_dict:
                 self.perror("[오류] 서버에서 PRODMAPTBL.json 데이터를 가져오지 못했습니다.")
@@ -238,6 +240,7 @@ class AdminCliCommandMixin:
         parser.add_argument("filename")
         parser.add_argument("--skip", type=bool, default=False)
         parser.add_argument("--activate", type=bool, default=False)
+        parser.add_argument("--detach", action="store_true", help="서버 작업으로 등록만 하고 바로 프롬프트로 돌아옴")
         args = parser.parse_args(shlex.split(arg))
 
         payload = json.dumps({
@@ -251,7 +254,7 @@ class AdminCliCommandMixin:
         request = message_pb2.Request(command="commission", payload=payload)
         if is_debug:
             print("raw payload:", request.payload)
-        response = grpc_stub.SendCommand(request)
+        response = run_job(self, request, detach=args.detach)
         if response.success:
             self.config.set("cmd_status", True)
             if is_debug:
@@ -266,6 +269,7 @@ class AdminCliCommandMixin:
         parser.add_argument("filename")
         parser.add_argument("--skip", action="store_true", help="스킵 여부")
         parser.add_argument("--activate", action="store_true", help="활성화 여부")
+        parser.add_argument("--detach", action="store_true", help="서버 작업으로 등록만 하고 바로 프롬프트로 돌아옴")
         args = parser.parse_args(shlex.split(arg))
 
         payload = json.dumps({
@@ -275,7 +279,7 @@ class AdminCliCommandMixin:
             "activate": args.activate
         })
         request = message_pb2.Request(command="recommission", payload=payload)
-        response = grpc_stub.SendCommand(request)
+        response = run_job(self, request, detach=args.detach)
         if response.success:
             self.config.set("cmd_status", True)
             if is_debug:
@@ -301,7 +305,7 @@ class AdminCliCommandMixin:
                 "activate": False
             })
             request = message_pb2.Request(command="commission", payload=payload)
-            response = grpc_stub.SendCommand(request)
+            response = run_job(self, request)
             if response.success:
                 self.config.set("cmd_status", True)
                 self.poutput(f"[서버 응답] {response.result}")
@@ -329,7 +333,7 @@ class AdminCliCommandMixin:
                 "activate": True
             })
             request = message_pb2.Request(command="commission", payload=payload)
-            response = grpc_stub.SendCommand(request)
+            response = run_job(self, request)
             if response.success:
                 self.config.set("cmd_status", True)
                 self.poutput(f"[서버 응답] {response.result}")
@@ -367,7 +371,7 @@ class AdminCliCommandMixin:
                 "activate": False
             })
             request = message_pb2.Request(command=command_name, payload=payload)
-            response = grpc_stub.SendCommand(request)
+            response = run_job(self, request)
 
             if response.success:
                 self.config.set("cmd_status", True)
@@ -398,7 +402,7 @@ class AdminCliCommandMixin:
                 "activate": False
             })
             request = message_pb2.Request(command="recommission", payload=payload)
-            response = grpc_stub.SendCommand(request)
+            response = run_job(self, request)
             if response.success:
                 self.config.set("cmd_status", True)
                 self.poutput(f"[서버 응답] {response.result}")
@@ -441,7 +445,7 @@ class AdminCliCommandMixin:
                 "activate": True
             })
             request = message_pb2.Request(command=command_name, payload=payload)
-            response = grpc_stub.SendCommand(request)
+            response = run_job(self, request)
 
             if response.success:
                 self.config.set("cmd_status", True)
@@ -469,7 +473,7 @@ class AdminCliCommandMixin:
                 "activate": True
             })
             request = message_pb2.Request(command="recommission", payload=payload)
-            response = grpc_stub.SendCommand(request)
+            response = run_job(self, request)
             if response.success:
                 self.config.set("cmd_status", True)
                 self.poutput(f"[서버 응답] {response.result}")
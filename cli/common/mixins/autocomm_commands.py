@@ -1,8 +1,7 @@
-import base64
+import argparse
 import os
 import shlex
 import json
-import openpyxl
 import re
 import cli.core.config_x.constants as constans
 from io import BytesIO
@@ -11,7 +10,8 @@ from datetime import datetime
 from cli.settings import is_debug
 from collections import OrderedDict
 from cli.common.util.tmpl_utils import load_cablink_blocks, load_prod_code_maps
-from cli.common.util.server_utils import load_from_server, save_to_server, delete_from_server
+from cli.common.util.server_utils import load_from_server, save_to_server, delete_from_server, upload_file, download_file
+from cli.common.util.job_utils import run_job
 from proto import message_pb2
 from cli.settings import grpc_stub
 from cli.common.util.path_utils import get_path
@@ -101,7 +101,7 @@ class AutocommCommandMixin:
                     continue
 
                 cmd = tokens[0]
-                cmd_func = getattr(self, f"do_{cmd.replace('-', '_')}", None)
+                cmd_func = self.get_command_func(cmd)
 
                 if is_debug:
                     print("cmd       :", cmd)
@@ -219,6 +219,7 @@ class AutocommCommandMixin:
             return
 
         try:
+            import openpyxl  # 무거운 모듈이므로 사용 시점에 import (시작 시간 단축)
             wb = openpyxl.load_workbook(BytesIO(excel_bytes), data_only=True)
 
             # "INITBTS" 포함 시트 찾기
@@ -1670,6 +1671,7 @@ class AutocommCommandMixin:
                 self.perror(f"서버에서 엑셀 파일을 불러오지 못했습니다: {excel_filename}")
                 return
 
+            import openpyxl
             wb = openpyxl.load_workbook(BytesIO(excel_bytes), data_only=True)
             ws_bts = None
             for sheet_name in wb.sheetnames:
@@ -1691,7 +1693,7 @@ class AutocommCommandMixin:
         request = message_pb2.Request(command="init-sw-ver", payload=payload)
 
         try:
-            response = grpc_stub.SendCommand(request)
+            response = run_job(self, request)
             if response.success:
                 try:
                     result_list = json.loads(response.result)
@@ -1733,6 +1735,113 @@ class AutocommCommandMixin:
             self.perror(f"gRPC 오류: {e}")
 
 
+    def do_fleet_commission(self, arg):
+        """
+        여러 BTS에 커밋된 SCF를 서버에서 병렬로 commission + activatePlan 합니다.
+        사용법: fleet-commission <BTS_ID ...> | --list <목록파일>
+                [--parallel N] [--retries N] [--backoff 초] [--recommission] [--no-activate] [--skip] [--detach]
+        - 목록 파일: 한 줄에 "BTS_ID [SCF파일명] [IP]" (#은 주석)
+        - SCF 파일명 생략 시 서버 data/received/<BTS_ID>/의 최근 커밋 파일, IP 생략 시 na_query 조회
+        - 결과 보고서(JSON/Excel)는 autocomm/<오늘> 폴더에 저장
+        """
+        parser = argparse.ArgumentParser(prog="fleet-commission", add_help=False)
+        parser.add_argument("bts_ids", nargs="*")
+        parser.add_argument("--list", dest="list_file")
+        parser.add_argument("--parallel", type=int, default=4)
+        parser.add_argument("--retries", type=int, default=2)
+        parser.add_argument("--backoff", type=float, default=10.0)
+        parser.add_argument("--recommission", action="store_true")
+        parser.add_argument("--no-activate", action="store_true")
+        parser.add_argument("--skip", action="store_true")
+        parser.add_argument("--detach", action="store_true")
+        usage = "사용법: fleet-commission <BTS_ID ...> | --list <목록파일> [--parallel N] [--retries N] [--backoff 초] [--recommission] [--no-activate] [--skip] [--detach]"
+
+        try:
+            args = parser.parse_args(shlex.split(arg))
+        except SystemExit:
+            self.perror(usage)
+            return
+
+        entries = [{"bts_id": bts_id} for bts_id in args.bts_ids]
+        if args.list_file:
+            try:
+                with open(args.list_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        tokens = line.split("#", 1)[0].replace(",", " ").split()
+                        if tokens:
+                            entry = {"bts_id": tokens[0]}
+                            if len(tokens) > 1:
+                                entry["file"] = tokens[1]
+                            if len(tokens) > 2:
+                                entry["ip"] = tokens[2]
+                            entries.append(entry)
+            except OSError as e:
+                self.perror(f"목록 파일을 읽을 수 없습니다: {e}")
+                return
+        if not entries:
+            self.perror(usage)
+            return
+
+        payload = json.dumps({
+            "entries": entries,
+            "options": {
+                "max_parallel": args.parallel,
+                "retries": args.retries,
+                "backoff": args.backoff,
+                "skip": args.skip,
+                "activate": not args.no_activate,
+                "recommission": args.recommission,
+            },
+        })
+        request = message_pb2.Request(command="fleet-commission", payload=payload)
+
+        try:
+            response = run_job(self, request, detach=args.detach)
+        except Exception as e:
+            self.config.set("cmd_status", False)
+            self.perror(f"gRPC 오류: {e}")
+            return
+
+        if args.detach:
+            self.config.set("cmd_status", response.success)
+            self.poutput(response.result)
+            return
+
+        try:
+            # 취소된 작업은 결과 앞에 안내 문구가 붙음
+            report = json.loads(response.result[max(response.result.find("{"), 0):])
+        except json.JSONDecodeError:
+            self.config.set("cmd_status", False)
+            self.perror(f"실패: {response.result}")
+            return
+
+        self.config.set("cmd_status", response.success)
+        results = report.get("results", [])
+        self.poutput(f"\n{'BTS':<10}{'IP':<16}{'상태':<10}{'시도':>4}  메시지")
+        for row in results:
+            line = f"{row.get('bts_id', ''):<10}{row.get('ip', ''):<16}{row.get('status', ''):<10}{row.get('attempts', 0):>4}  {row.get('message', '')}"
+            if row.get("status") in ("success", "skipped"):
+                self.poutput(line)
+            else:
+                self.perror(line)
+        summary = report.get("summary", {})
+        self.poutput(f"\n총 {len(results)}건: " + ", ".join(f"{k} {v}건" for k, v in summary.items()))
+
+        # 서버 보고서를 로컬 autocomm/<오늘> 폴더로 받아옴
+        output_dir = get_path(self.env_type, "autocomm", datetime.now().strftime("%Y%m%d"))
+        os.makedirs(output_dir, exist_ok=True)
+        for filename in report.get("report", {}).values():
+            local_path = os.path.join(output_dir, filename)
+            try:
+                with open(local_path, "wb") as f:
+                    ok, message, _ = download_file("autocomm", filename, f)
+                if ok:
+                    self.poutput(f"[보고서] {local_path}")
+                else:
+                    self.perror(f"[보고서 다운로드 실패] {filename}: {message}")
+            except Exception as e:
+                self.perror(f"[보고서 다운로드 실패] {filename}: {e}")
+
     def _extract_bts_sw_entries(self, ws_bts):
         """
         INITBTS 시트에서 MRBTS id와 Radio Version 값을 추출합니다.
@@ -1809,6 +1918,7 @@ class AutocommCommandMixin:
             if not excel_bytes:
                 self.perror(f"[오류] 서버에서 엑셀 파일을 불러오지 못했습니다: {excel_filename}")
                 return
+            import openpyxl
             wb = openpyxl.load_workbook(BytesIO(excel_bytes), data_only=True)
             
             ws_bts = None
@@ -1866,6 +1976,7 @@ class AutocommCommandMixin:
         self.poutput("-" * 35)
 
         seen_bts_ids = set()
+        targets = []
 
         for row_idx in range(data_start_row_idx, data_end_row_idx):
             row = [ws_bts.cell(row=row_idx, column=c + 1).value for c in range(max_col)]
@@ -1881,7 +1992,16 @@ class AutocommCommandMixin:
             if bts_id_str in seen_bts_ids:
                 continue
             seen_bts_ids.add(bts_id_str)
+            targets.append((bts_id_str, target_version))
+
+        # 전체 BTS IP를 서버에서 한 번에 병렬 조회해 두면 아래 dest-bts는 서버 캐시에서 바로 응답
+        if targets:
+            response = grpc_stub.SendCommand(message_pb2.Request(
+                command="resolve-bts-ip", payload=" ".join(bts_id for bts_id, _ in targets)))
+            if is_debug:
+                print(f"[DEBUG] resolve-bts-ip: {response.success} {response.result}")
 
+        for bts_id_str, target_version in targets:
             try:
                 self.do_dest_bts(bts_id_str)
                 self.do_dnload_bts_cfg_raw("")
@@ -1929,11 +2049,7 @@ class AutocommCommandMixin:
         server_path = os.path.join(server_dir, file_name)  # "temp/CLI 개통탬플릿.xlsx"처럼 조합
 
         with open(local_path, "rb") as f:
-            encoded = base64.b64encode(f.read()).decode("utf-8")
-
-        payload = f"autocomm||{server_path}||{encoded}"
-        req = message_pb2.Request(command="saveFile", payload=payload)
-        resp = grpc_stub.SendCommand(req)
+            resp = upload_file("autocomm", server_path, f)
 
         if resp.success:
             self.poutput(f"[copy-ac-tmpl] 업로드 성공: {server_path}")
@@ -1,19 +1,136 @@
 from datetime import datetime
 import traceback
 import argparse
-import base64
 import copy
 import os
 import shlex
 import xml.etree.ElementTree as ET
-from cli.common.util.commit_utils import generate_translated_tree, warn_missing_required_params, generate_cli_script_from_xml
+from concurrent.futures import ThreadPoolExecutor
+from cli.common.util.commit_utils import generate_translated_tree, warn_missing_required_params, generate_cli_script_from_tree
 from cli.common.prettify_utils import prettify_xml
-from cli.settings import grpc_stub
-from proto import message_pb2
+from cli.common.util.server_utils import send_commit
 from cli.settings import is_debug
 from cli.common.util.path_utils import get_path
 
 class CommitCommandMixin:
+    @staticmethod
+    def _shallow_copy_mo(mo: ET.Element) -> ET.Element:
+        """
+        managedObject의 속성만 복사하고 자식(p/list)은 원본 element를 공유합니다.
+        commit 결과 트리는 직렬화/번역(새 트리 생성)에만 쓰이므로 자식을 깊은 복사할 필요가 없음
+        """
+        new_mo = mo.makeelement(mo.tag, dict(mo.attrib))
+        new_mo.text = mo.text
+        new_mo.tail = mo.tail
+        new_mo.extend(list(mo))
+        return new_mo
+
+    def _finalize_commit(self, command_type: str, filename: str, message: str, translate_mode: str,
+                         output_path: str, xml_str: str, out_root: ET.Element,
+                         cli_path: str, cli_filename: str) -> dict:
+        """
+        commit 마무리 단계를 동시에 수행합니다.
+        - CLI 스크립트를 먼저 생성하고 (실패하면 아무것도 기록/전송하지 않음)
+          XML 파일 기록 / commit 전송 / CLI 스크립트 기록 / commit-cli 전송을 스레드 풀에서 병렬 처리
+        - 출력(poutput/perror)은 모든 작업이 끝난 뒤 메인 스레드에서만 수행
+        반환: {"ok": XML 기록·CLI 생성·commit 모두 성공 여부, "response": ..., "response_cli": ...}
+        """
+        def write_text(path, text):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+
+        result = {"ok": False, "response": None, "response_cli": None}
+
+        # CLI 스크립트는 방금 직렬화한 트리에서 바로 생성 (XML 파일 재파싱 없음)
+        try:
+            cli_text = generate_cli_script_from_tree(out_root)
+        except Exception as e:
+            self.perror(f"[클라] CLI 스크립트 생성 실패: {e}")
+            return result
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            f_xml = pool.submit(write_text, output_path, xml_str)
+            f_commit = pool.submit(send_commit, command_type, filename, message,
+                                   translate_mode, xml_str.encode("utf-8"))
+            f_cli_write = pool.submit(write_text, cli_path, cli_text)
+            f_cli_send = pool.submit(send_commit, "commit-cli", cli_filename, "", "",
+                                     cli_text.encode("utf-8"))
+
+        xml_ok = cli_ok = commit_ok = False
+        try:
+            f_xml.result()
+            xml_ok = True
+            if is_debug:
+                self.poutput(f"[클라] XML 저장 완료: {output_path}")
+        except Exception as e:
+            self.perror(f"[클라] XML 저장 실패: {e}")
+
+        try:
+            f_cli_write.result()
+            cli_ok = True
+            if is_debug:
+                self.poutput(f"[클라] CLI 스크립트 저장 완료: {cli_path}")
+        except Exception as e:
+            self.perror(f"[클라] CLI 스크립트 저장 실패: {e}")
+
+        try:
+            response = f_commit.result()
+            result["response"] = response
+            if response.success:
+                commit_ok = True
+                if is_debug:
+                    self.poutput(f"[서버 응답] {response.result}")
+            else:
+                self.perror(f"[서버 오류] {response.result}")
+        except Exception as e:
+            self.perror(f"[서버 오류] commit 전송 실패: {e}")
+
+        # commit-cli 실패는 경고만 출력 (기존과 동일하게 cmd_status에 반영하지 않음)
+        try:
+            response_cli = f_cli_send.result()
+            result["response_cli"] = response_cli
+            if response_cli.success:
+                if is_debug:
+                    self.poutput(f"[서버 응답] CLI 저장 완료: {response_cli.result}")
+            else:
+                self.perror(f"[서버 오류] CLI 저장 실패: {response_cli.result}")
+        except Exception as e:
+            self.perror(f"[서버 오류] CLI 전송 실패: {e}")
+
+        result["ok"] = xml_ok and cli_ok and commit_ok
+        return result
+
+    def _get_commit_journal(self, full_scan: bool = False):
+        """
+        commit-diff 비교 대상을 변경된 MO로 제한할 변경 내역(MoJournal)을 반환합니다.
+        full_scan이거나 변경 내역을 신뢰할 수 없으면(xml_tree 교체 등) None → 전체 비교
+        """
+        if full_scan:
+            return None
+        mo_index = getattr(self, "mo_index", None)
+        if mo_index is None or not mo_index.is_for(self.xml_tree) or mo_index.journal is None:
+            if is_debug:
+                self.poutput("[디버그] 변경 내역 없음 → 전체 MO 비교")
+            return None
+        if is_debug:
+            self.poutput(f"[디버그] 변경된 MO {len(mo_index.journal)}개만 비교")
+        return mo_index.journal
+
+    def _print_commit_summary(self, output_path: str, cli_path: str, result: dict):
+        if not getattr(self, "_last_command_had_semicolon", False):
+            return
+        response = result.get("response")
+        response_cli = result.get("response_cli")
+        self.poutput("")
+        self.poutput("──────────── 저장 정보 ────────────")
+        self.poutput(f"[XML] {output_path}")
+        self.poutput(f"[CLI] {cli_path}")
+        if response is not None and response.success and response.result:
+            self.poutput(f"[서버 XML] {response.result}")
+            if response_cli is not None:
+                self.poutput(f"[서버 CLI] {response_cli.result}")
+        self.poutput("──────────────────────────────────")
+
     def do_commit(self, arg):
         """
         최종 커밋을 수행합니다.
@@ -56,7 +173,7 @@ class CommitCommandMixin:
             if not hasattr(self, "task_key"):
                 self.perror("현재 task_key가 설정되지 않았습니다. 먼저 tgt-bts 명령어를 실행하세요.")
                 return
-            warnings = warn_missing_required_params(self.xml_tree, self.mo_param_dict)
+            warnings = warn_missing_required_params(self.xml_tree, self._get_mo_schema())
             for line in warnings:
                 self.poutput(line)
 
@@ -64,11 +181,7 @@ class CommitCommandMixin:
                 self.perror("XML이 아직 로드되지 않았습니다.")
                 return
 
-            root = copy.deepcopy(self.xml_tree.getroot())
-            for elem in root.iter():
-                if '}' in elem.tag:
-                    elem.tag = elem.tag.split('}', 1)[1]
-            self.xml_tree = ET.ElementTree(root)
+            # 네임스페이스는 트리 로드 시(set-cfg-scf) 한 번만 정리되므로 여기서 복사/정리하지 않음
 
             # 날짜별 디렉토리 (PROD 전용)
             if self.env_type == "PROD":
@@ -102,11 +215,8 @@ class CommitCommandMixin:
                 self.last_commit_file = filename
                 output_path = os.path.join(generated_dir, filename)
                 translated_tree = generate_translated_tree(self.xml_tree, param_dict_formula, mode=mode)
-                xml_str = prettify_xml(translated_tree.getroot())
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(xml_str)
-                if is_debug:
-                    self.poutput(f"[클라] translated 저장 완료: {output_path}")
+                out_root = translated_tree.getroot()
+                xml_str = prettify_xml(out_root)
             else:
                 filename = f"{basename}__commit_{timestamp}__{task_key}.xml"
                 self.last_commit_file = filename
@@ -121,62 +231,18 @@ class CommitCommandMixin:
                     })
                     cmdata.insert(0, header)
 
-                xml_str = prettify_xml(self.xml_tree.getroot())
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(xml_str)
-                if is_debug:
-                    self.poutput(f"[클라] 기본 XML 저장 완료: {output_path}")
+                out_root = self.xml_tree.getroot()
+                xml_str = prettify_xml(out_root)
 
-            # CLI 스크립트 생성 및 저장 (task_key 포함)
+            # XML/CLI 저장 및 서버 전송 (병렬)
             cli_filename = filename.replace(".xml", ".cli")
             cli_path = os.path.join(scripts_dir, cli_filename)
-            try:
-                generate_cli_script_from_xml(output_path, cli_path)
-                if is_debug:
-                    self.poutput(f"[클라] CLI 스크립트 저장 완료: {cli_path}")
-            except Exception as e:
-                self.perror(f"[클라] CLI 스크립트 생성 실패: {e}")
-                return
-
-            # 서버 전송 (XML)
-            xml_encoded = base64.b64encode(xml_str.encode("utf-8")).decode("utf-8")
-            translate_flag = "1" if args.translate else "0"
             translate_mode = mode if args.translate else ""
-            payload = f"commit||{filename}||{args.message}||{translate_flag}||{translate_mode}||{xml_encoded}"
-            request = message_pb2.Request(command="commit", payload=payload)
-            response = grpc_stub.SendCommand(request)
-            if response.success:
-                self.config.set("cmd_status", True)
-                if is_debug:
-                    self.poutput(f"[서버 응답] {response.result}")
-            else:
-                self.config.set("cmd_status", False)
-                self.perror(f"[서버 오류] {response.result}")
+            result = self._finalize_commit("commit", filename, args.message, translate_mode,
+                                           output_path, xml_str, out_root, cli_path, cli_filename)
+            self.config.set("cmd_status", result["ok"])
 
-            # 서버 전송 (CLI)
-            try:
-                with open(cli_path, "r", encoding="utf-8") as f:
-                    cli_encoded = base64.b64encode(f.read().encode("utf-8")).decode("utf-8")
-                payload_cli = f"commit-cli||{cli_filename}||{cli_encoded}"
-                request_cli = message_pb2.Request(command="commit-cli", payload=payload_cli)
-                response_cli = grpc_stub.SendCommand(request_cli)
-                if response_cli.success:
-                    if is_debug:
-                        self.poutput(f"[서버 응답] CLI 저장 완료: {response_cli.result}")
-                else:
-                    self.perror(f"[서버 오류] CLI 저장 실패: {response_cli.result}")
-            except Exception as e:
-                self.perror(f"[서버 오류] CLI 전송 실패: {e}")
-
-            if getattr(self, "_last_command_had_semicolon", False):
-                self.poutput("")
-                self.poutput("──────────── 저장 정보 ────────────")
-                self.poutput(f"[XML] {output_path}")
-                self.poutput(f"[CLI] {cli_path}")
-                if response.success and response.result:
-                    self.poutput(f"[서버 XML] {response.result}")
-                    self.poutput(f"[서버 CLI] {response_cli.result}")
-                self.poutput("──────────────────────────────────")
+            self._print_commit_summary(output_path, cli_path, result)
 
         except SystemExit:
             self.perror("사용법: commit-all [-m 설명] [-t 1|2|r]")
@@ -191,6 +257,8 @@ class CommitCommandMixin:
         parser.add_argument("-m", "--message", type=str, default="(cellcommit)", help="설명 메시지")
         parser.add_argument("-t", "--translate", choices=["1", "2", "r"],
                             help="translated 저장 방식 (1=1회, 2=2회, r=역공식)")
+        parser.add_argument("-f", "--full-scan", action="store_true",
+                            help="변경 내역과 무관하게 전체 MO를 비교 (검증용)")
 
         try:
             args = parser.parse_args(shlex.split(arg))
@@ -210,15 +278,11 @@ class CommitCommandMixin:
                 self.config.set("cmd_status", False)
                 return
             
-            warnings = warn_missing_required_params(self.xml_tree, self.mo_param_dict)
+            warnings = warn_missing_required_params(self.xml_tree, self._get_mo_schema())
             for line in warnings:
                 self.poutput(line)
 
-            root = copy.deepcopy(self.xml_tree.getroot())
-            for elem in root.iter():
-                if '}' in elem.tag:
-                    elem.tag = elem.tag.split('}', 1)[1]
-            self.xml_tree = ET.ElementTree(root)
+            # 네임스페이스는 트리 로드 시(set-cfg-scf) 한 번만 정리되므로 여기서 복사/정리하지 않음
 
             # generated / scripts 경로 준비
             generated_dir = get_path(self.env_type, "commit")
@@ -241,6 +305,8 @@ class CommitCommandMixin:
                     if dist_name:
                         ref_distnames.add(dist_name)
 
+            journal = self._get_commit_journal(args.full_scan)
+
             new_root = ET.Element("raml", {"version": "2.0"})
             cm_data = ET.SubElement(new_root, "cmData", {"type": "plan"})
             current_cmdata = self.xml_tree.find(".//{*}cmData")
@@ -251,11 +317,15 @@ class CommitCommandMixin:
 
                     # 조건 1: 삭제 처리된 MO는 무조건 포함 (ref에 있어도 상관없음)
                     if op == "delete":
-                        cm_data.append(copy.deepcopy(mo))
+                        cm_data.append(self._shallow_copy_mo(mo))
+
+                    # 변경 내역에 없는 MO는 ref와 동일하므로 비교 생략
+                    elif journal is not None and not journal.is_dirty(dist_name):
+                        continue
 
                     # 조건 2: ref에 없는 MO는 생성 대상
                     elif dist_name and dist_name not in ref_distnames:
-                        new_mo = copy.deepcopy(mo)
+                        new_mo = self._shallow_copy_mo(mo)
                         new_mo.set("operation", "create")
                         cm_data.append(new_mo)
 
@@ -280,76 +350,25 @@ class CommitCommandMixin:
                 filename = f"{basename}__cellcommit_{timestamp}_translated__{task_key}.xml"
                 output_path = os.path.join(generated_dir, filename)
                 translated_tree = generate_translated_tree(new_root, param_dict_formula, mode=mode)
-                xml_str = prettify_xml(translated_tree.getroot())
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(xml_str)
-                if is_debug:
-                    self.poutput(f"[클라] translated 저장 완료: {output_path}")
+                out_root = translated_tree.getroot()
+                xml_str = prettify_xml(out_root)
             else:
                 filename = f"{basename}__cellcommit_{timestamp}__{task_key}.xml"
                 output_path = os.path.join(generated_dir, filename)
-                xml_str = prettify_xml(new_root)
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(xml_str)
-                if is_debug:
-                    self.poutput(f"[클라] 기본 XML 저장 완료: {output_path}")
+                out_root = new_root
+                xml_str = prettify_xml(out_root)
 
             self.last_commit_file = filename
 
-            # CLI 스크립트 생성 및 저장
+            # XML/CLI 저장 및 서버 전송 (병렬)
             cli_filename = filename.replace(".xml", ".cli")
             cli_path = os.path.join(scripts_dir, cli_filename)
-            try:
-                generate_cli_script_from_xml(output_path, cli_path)
-                if is_debug:
-                    self.poutput(f"[클라] CLI 스크립트 저장 완료: {cli_path}")
-            except Exception as e:
-                self.perror(f"[클라] CLI 스크립트 생성 실패: {e}")
-                self.config.set("cmd_status", False)
-                return
-
-            # 서버 전송 (XML)
-            command_type = "commit-diff"
-            translate_flag = "1" if args.translate else "0"
             translate_mode = mode if args.translate else ""
-            xml_encoded = base64.b64encode(xml_str.encode("utf-8")).decode("utf-8")
-            payload = f"{command_type}||{filename}||{args.message}||{translate_flag}||{translate_mode}||{xml_encoded}"
-            request = message_pb2.Request(command="commit", payload=payload)
-            response = grpc_stub.SendCommand(request)
-            if response.success:
-                if is_debug:
-                    self.poutput(f"[서버 응답] {response.result}")
-            else:
-                self.perror(f"[서버 오류] {response.result}")
-                self.config.set("cmd_status", False)
-                return
+            result = self._finalize_commit("commit-diff", filename, args.message, translate_mode,
+                                           output_path, xml_str, out_root, cli_path, cli_filename)
+            self.config.set("cmd_status", result["ok"])
 
-            # 서버 전송 (CLI)
-            try:
-                with open(cli_path, "r", encoding="utf-8") as f:
-                    cli_encoded = base64.b64encode(f.read().encode("utf-8")).decode("utf-8")
-                payload_cli = f"commit-cli||{cli_filename}||{cli_encoded}"
-                request_cli = message_pb2.Request(command="commit-cli", payload=payload_cli)
-                response_cli = grpc_stub.SendCommand(request_cli)
-                if response_cli.success:
-                    if is_debug:
-                        self.poutput(f"[서버 응답] CLI 저장 완료: {response_cli.result}")
-                else:
-                    self.perror(f"[서버 오류] CLI 저장 실패: {response_cli.result}")
-            except Exception as e:
-                self.perror(f"[서버 오류] CLI 전송 실패: {e}")
-
-            self.config.set("cmd_status", True)
-
-            if getattr(self, "_last_command_had_semicolon", False):
-                self.poutput("")
-                self.poutput("──────────── 저장 정보 ────────────")
-                self.poutput(f"[XML] {output_path}")
-                self.poutput(f"[CLI] {cli_path}")
-                if response.success and response.result:
-                    self.poutput(f"[서버 XML] {response.result}")
-                    self.poutput(f"[서버 CLI] {response_cli.result}")
-                self.poutput("──────────────────────────────────")
+            self._print_commit_summary(output_path, cli_path, result)
 
         except SystemExit:
             self.config.set("cmd_status", False)
@@ -413,6 +432,8 @@ class CommitCommandMixin:
             parser.add_argument("-m", "--message", type=str, default="(cellcommit)", help="설명 메시지")
             parser.add_argument("-t", "--translate", choices=["1", "2", "r"],
                                 help="translated 저장 방식 (1=1회, 2=2회, r=역공식)")
+            parser.add_argument("-f", "--full-scan", action="store_true",
+                                help="변경 내역과 무관하게 전체 MO를 비교 (검증용)")
             args = parser.parse_args(shlex.split(arg))
 
             if not hasattr(self, "task_key"):
@@ -433,19 +454,13 @@ class CommitCommandMixin:
             # 0) 필수 파라미터 경고
             stage = "warn_missing_required_params"
             try:
-                warnings = warn_missing_required_params(self.xml_tree, self.mo_param_dict)
+                warnings = warn_missing_required_params(self.xml_tree, self._get_mo_schema())
                 for line in warnings:
                     self.poutput(line)
             except Exception as e:
                 self.perror(f"[warn] 필수 파라미터 점검 중 오류: {type(e).__name__}: {e}")
 
-            # 1) 네임스페이스 정제
-            stage = "strip_namespaces"
-            root = copy.deepcopy(self.xml_tree.getroot())
-            for elem in root.iter():
-                if '}' in elem.tag:
-                    elem.tag = elem.tag.split('}', 1)[1]
-            self.xml_tree = ET.ElementTree(root)
+            # 1) 네임스페이스는 트리 로드 시(set-cfg-scf) 한 번만 정리되므로 여기서 복사/정리하지 않음
 
             # 2) 경로/파일명 준비
             stage = "prepare_paths"
@@ -461,8 +476,9 @@ class CommitCommandMixin:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             task_key = self.task_key
 
-            # 3) 참조 XML distName별 p/list 맵 구성
+            # 3) 참조 XML distName별 p/list 맵 구성 (변경 내역이 있으면 변경된 MO만)
             stage = "build_ref_maps"
+            journal = self._get_commit_journal(args.full_scan)
             ref_param_map = {}
             ref_list_map = {}
             ref_cmdata = self.ref_tree.getroot().find(".//{*}cmData")
@@ -471,6 +487,8 @@ class CommitCommandMixin:
                     dist = mo.attrib.get("distName")
                     if not dist:
                         continue
+                    if journal is not None and not journal.is_dirty(dist):
+                        continue
                     ref_param_map[dist] = _collect_p_map(mo)
                     ref_list_map[dist] = _normalize_list_for_compare(_collect_list_map(mo))
 
@@ -495,9 +513,14 @@ class CommitCommandMixin:
                             })
                             cm_data.append(new_mo)
                             continue
+
+                        # 변경 내역에 없는 MO는 ref와 동일하므로 비교 생략
+                        if journal is not None and not journal.is_dirty(current_dist):
+                            continue
+
                         # 신규 MO → create
                         if current_dist not in ref_param_map:
-                            new_mo = copy.deepcopy(mo)
+                            new_mo = self._shallow_copy_mo(mo)
                             new_mo.set("operation", "create")
                             cm_data.append(new_mo)
                             continue
@@ -518,7 +541,11 @@ class CommitCommandMixin:
                         )
 
                         if p_changed or list_names_changed or list_content_changed:
-                            new_mo = copy.deepcopy(mo)
+                            # 하위에 managedObject가 중첩된 경우에만 속성을 지우므로 깊은 복사
+                            if mo.find(".//managedObject") is not None:
+                                new_mo = copy.deepcopy(mo)
+                            else:
+                                new_mo = self._shallow_copy_mo(mo)
                             new_mo.set("operation", "update")
                             for child in new_mo.findall(".//managedObject"):
                                 if "operation" in child.attrib:
@@ -568,68 +595,23 @@ class CommitCommandMixin:
                     return
 
                 stage = "prettify_translated"
-                xml_str = prettify_xml(translated_tree.getroot())
+                out_root = translated_tree.getroot()
+                xml_str = prettify_xml(out_root)
             else:
                 stage = "prettify_xml"
-                xml_str = prettify_xml(new_root)
+                out_root = new_root
+                xml_str = prettify_xml(out_root)
 
-            stage = "write_xml"
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(xml_str)
             self.last_commit_file = filename
 
-            # 6) CLI 스크립트 생성
-            stage = "generate_cli"
-            try:
-                cli_filename = filename.replace(".xml", ".cli")
-                cli_path = os.path.join(scripts_dir, cli_filename)
-                generate_cli_script_from_xml(output_path, cli_path)
-                if is_debug:
-                    self.poutput(f"[클라] CLI 스크립트 저장 완료: {cli_path}")
-            except KeyError as ke:
-                self.perror(f"[CLI 변환] KeyError: 누락 키={ke}. XML → CLI 매핑에서 해당 키가 필요한지 확인.")
-                self.perror(traceback.format_exc())
-                self.config.set("cmd_status", False)
-                return
-            except Exception as e:
-                self.perror(f"[클라] CLI 스크립트 생성 실패: {e}\n{traceback.format_exc()}")
-                self.config.set("cmd_status", False)
-                return
-
-            # 7) 서버 전송 (XML)
-            stage = "send_xml"
-            command_type = "commit-diff-para"
-            translate_flag = "1" if args.translate else "0"
+            # 6) XML/CLI 저장 및 서버 전송 (병렬)
+            stage = "finalize"
+            cli_filename = filename.replace(".xml", ".cli")
+            cli_path = os.path.join(scripts_dir, cli_filename)
             translate_mode = mode if args.translate else ""
-            xml_encoded = base64.b64encode(xml_str.encode("utf-8")).decode("utf-8")
-            payload = f"{command_type}||{filename}||{args.message}||{translate_flag}||{translate_mode}||{xml_encoded}"
-            request = message_pb2.Request(command="commit", payload=payload)
-            response = grpc_stub.SendCommand(request)
-            if response.success:
-                if is_debug:
-                    self.poutput(f"[서버 응답] {response.result}")
-            else:
-                self.perror(f"[서버 오류] {response.result}")
-                self.config.set("cmd_status", False)
-                return
-
-            # 8) 서버 전송 (CLI)
-            stage = "send_cli"
-            try:
-                with open(cli_path, "r", encoding="utf-8") as f:
-                    cli_encoded = base64.b64encode(f.read().encode("utf-8")).decode("utf-8")
-                payload_cli = f"commit-cli||{cli_filename}||{cli_encoded}"
-                request_cli = message_pb2.Request(command="commit-cli", payload=payload_cli)
-                response_cli = grpc_stub.SendCommand(request_cli)
-                if response_cli.success:
-                    if is_debug:
-                        self.poutput(f"[서버 응답] CLI 저장 완료: {response_cli.result}")
-                else:
-                    self.perror(f"[서버 오류] CLI 저장 실패: {response_cli.result}")
-            except Exception as e:
-                self.perror(f"[서버 오류] CLI 전송 실패: {e}\n{traceback.format_exc()}")
-
-            self.config.set("cmd_status", True)
+            result = self._finalize_commit("commit-diff-para", filename, args.message, translate_mode,
+                                           output_path, xml_str, out_root, cli_path, cli_filename)
+            self.config.set("cmd_status", result["ok"])
 
         except SystemExit:
             self.config.set("cmd_status", False)
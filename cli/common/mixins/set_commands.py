@@ -10,7 +10,10 @@ from cli.settings import grpc_stub
 from cli.common.util.commit_utils import load_mo_param_dict
 from cli.common.util.tmpl_utils import apply_class_based_mapping, load_cli_template_as_rule
 from cli.common.util.xml_utils import strip_namespace
+from cli.common.util.mo_index import MoIndex
+from cli.common.util.mo_schema import compile_mo_schema
 from cli.common.util.server_utils import load_from_server, save_to_server
+from cli.common.util.ref_cache import load_cached
 from cli.settings import is_debug
 from cli.common.util.path_utils import get_path
 
@@ -44,6 +47,8 @@ class SetCommandMixin:
                 # 트리 설정
                 self.xml_tree = tree
                 self.ref_tree = copy.deepcopy(tree)
+                # ref_tree와 같은 상태에서 시작하므로 이후 변경 MO를 기록 (commit-diff 비교 대상)
+                self.mo_index = MoIndex(tree, track_changes=True)
 
                 # bts_id 추출
                 #cmdata = self.xml_tree.getroot().find(".//{*}cmData")
@@ -87,8 +92,12 @@ class SetCommandMixin:
             return
         
         self.du_type = args.du_type.upper()
+        # rulebook / mo_param_dict를 동시에 받기 시작 (아래 로드는 각자 자기 파일만 기다림)
+        if hasattr(self, "_prefetch_session_data"):
+            self._prefetch_session_data()
         self.rulebook_param_dict = self._load_rulebook()
         self.mo_param_dict = load_mo_param_dict(self, self.rat_type, self.mo_version, self.du_type)
+        self.mo_schema = compile_mo_schema(self.mo_param_dict)
         if is_debug:
             self.poutput(f"[성공] DU 타입이 '{self.du_type}'으로 설정되었습니다.")
 
@@ -113,8 +122,8 @@ class SetCommandMixin:
 
         # 유효성 체크 (PROD/RMOD)
         try:
-            prod_data = load_from_server("PRODMAPTBL.json", "json", purpose="prodmap")
-            rmod_data = load_from_server("RMODPRODMAPTBL.json", "json", purpose="prodmap")
+            prod_data = load_cached("PRODMAPTBL.json", "json", purpose="prodmap")
+            rmod_data = load_cached("RMODPRODMAPTBL.json", "json", purpose="prodmap")
             prod_dict = list(prod_data.values())[0]["value"]
             rmod_dict = list(rmod_data.values())[0]["value"]
         except Exception as e:
@@ -160,7 +169,7 @@ class SetCommandMixin:
             tmpl_name += ".cli"
 
             try:
-                tmpl_text = load_from_server(tmpl_name, "text", purpose="ruTemplate")
+                tmpl_text = load_cached(tmpl_name, "text", purpose="ruTemplate")
                 with tempfile.NamedTemporaryFile(delete=False, mode="w", encoding="utf-8", suffix=".cli") as tmp:
                     tmp.write(tmpl_text)
                     tmpl_file = tmp.name
@@ -216,7 +225,7 @@ class SetCommandMixin:
         tmpl_name = f"nok_5G_{self.du_type}_ru_{cell_type}.cli"
 
         try:
-            tmpl_text = load_from_server(tmpl_name, "text", purpose="ruTemplate")
+            tmpl_text = load_cached(tmpl_name, "text", purpose="ruTemplate")
             print("tmpl_text = ", tmpl_text)
             with tempfile.NamedTemporaryFile(delete=False, mode="w", encoding="utf-8", suffix=".cli") as tmp:
                 tmp.write(tmpl_text)
@@ -2,9 +2,12 @@ import argparse
 import json
 import os
 import shlex
+import time
+from datetime import datetime
 from proto import message_pb2
 from cli.settings import grpc_stub
 from cli.settings import is_debug
+from cli.common.util.job_utils import run_job, watch_job, cancel_job, list_jobs
 
 class SetupCommandMixin:
     def _next_request_id(self) -> int:
@@ -164,6 +167,7 @@ class SetupCommandMixin:
         parser.add_argument("--file", required=True, help="업데이트할 파일 이름 (예: swfile.zip)")
         parser.add_argument("--no-activate", action="store_true", help="업데이트 후 활성화 생략")
         parser.add_argument("--no-override", action="store_true", help="RU SW 무시 생략")
+        parser.add_argument("--detach", action="store_true", help="서버 작업으로 등록만 하고 바로 프롬프트로 돌아옴")
 
         try:
             args = parser.parse_args(shlex.split(arg))
@@ -177,7 +181,7 @@ class SetupCommandMixin:
 
             payload_json = json.dumps(payload_dict)
             request = message_pb2.Request(command="update-sw-ver", payload=payload_json)
-            response = grpc_stub.SendCommand(request)
+            response = run_job(self, request, detach=args.detach)
 
             if response.success:
                 if hasattr(self, "config"):
@@ -189,7 +193,7 @@ class SetupCommandMixin:
                 self.perror(f"[서버 오류]\n{response.result}")
 
         except SystemExit:
-            self.perror("사용법: update-sw-ver <bts_id> --file <파일명> [--no-activate] [--no-override]")
+            self.perror("사용법: update-sw-ver <bts_id> --file <파일명> [--no-activate] [--no-override] [--detach]")
 
     def do_check_soam(self, arg):
         """미구현"""
@@ -235,4 +239,200 @@ class SetupCommandMixin:
                 self.perror(f"[서버 오류] {response.result}")
 
         except SystemExit:
-            self.perror("사용법: check-ssh <bts_id>")
\ No newline at end of file
+            self.perror("사용법: check-ssh <bts_id>")
+
+    def do_sweep(self, arg):
+        """
+        여러 BTS의 ping/SSH 연결 상태를 서버에서 동시에 확인합니다. (결과는 BTS가 끝날 때마다 표시)
+        사용법: sweep <BTS_ID ...> | --excel <autocomm 엑셀파일명> | --list <목록파일>
+                [--no-ping] [--no-ssh] [--parallel N] [--timeout 초] [--user 계정] [--detach]
+        - 목록 파일: 한 줄에 "BTS_ID [IP]" (#은 주석), IP 생략 시 서버에서 na_query로 조회
+        - --excel: 서버 autocomm 폴더의 엑셀 INITBTS 시트 MRBTS id 전체
+        """
+        parser = argparse.ArgumentParser(prog="sweep", add_help=False)
+        parser.add_argument("bts_ids", nargs="*")
+        parser.add_argument("--excel", dest="workbook")
+        parser.add_argument("--list", dest="list_file")
+        parser.add_argument("--no-ping", action="store_true")
+        parser.add_argument("--no-ssh", action="store_true")
+        parser.add_argument("--parallel", type=int, default=32)
+        parser.add_argument("--timeout", type=float, default=3.0)
+        parser.add_argument("--user")
+        parser.add_argument("--detach", action="store_true")
+        usage = ("사용법: sweep <BTS_ID ...> | --excel <엑셀파일명> | --list <목록파일> "
+                 "[--no-ping] [--no-ssh] [--parallel N] [--timeout 초] [--user 계정] [--detach]")
+
+        try:
+            args = parser.parse_args(shlex.split(arg))
+        except SystemExit:
+            self.perror(usage)
+            return
+
+        entries = [{"bts_id": bts_id} for bts_id in args.bts_ids]
+        if args.list_file:
+            try:
+                with open(args.list_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        tokens = line.split("#", 1)[0].replace(",", " ").split()
+                        if tokens:
+                            entry = {"bts_id": tokens[0]}
+                            if len(tokens) > 1:
+                                entry["ip"] = tokens[1]
+                            entries.append(entry)
+            except OSError as e:
+                self.perror(f"목록 파일을 읽을 수 없습니다: {e}")
+                return
+        if not entries and not args.workbook:
+            self.perror(usage)
+            return
+        if args.no_ping and args.no_ssh:
+            self.perror("--no-ping과 --no-ssh를 함께 쓸 수 없습니다.")
+            return
+
+        options = {"ping": not args.no_ping, "ssh": not args.no_ssh,
+                   "max_parallel": args.parallel, "timeout": args.timeout}
+        if args.user:
+            options["user"] = args.user
+        payload = json.dumps({"entries": entries, "workbook": args.workbook or "", "options": options})
+        request = message_pb2.Request(command="sweep", payload=payload)
+
+        try:
+            response = run_job(self, request, detach=args.detach)
+        except Exception as e:
+            if hasattr(self, "config"):
+                self.config.set("cmd_status", False)
+            self.perror(f"gRPC 오류: {e}")
+            return
+
+        if hasattr(self, "config"):
+            self.config.set("cmd_status", response.success)
+        if args.detach:
+            self.poutput(response.result)
+            return
+
+        try:
+            # 취소된 작업은 결과 앞에 안내 문구가 붙음
+            report = json.loads(response.result[max(response.result.find("{"), 0):])
+        except json.JSONDecodeError:
+            self.perror(f"[서버 오류] {response.result}")
+            return
+
+        results = report.get("results", [])
+        self.poutput(f"\n{'BTS':<10}{'IP':<16}{'ping':<12}{'ssh':<6}{'상태':<12}메시지")
+        for row in results:
+            ping = row.get("ping", "")
+            if row.get("ping_ms") is not None:
+                ping = f"{ping} {row['ping_ms']}ms"
+            line = (f"{row.get('bts_id', ''):<10}{row.get('ip', ''):<16}{ping:<12}{row.get('ssh', ''):<6}"
+                    f"{row.get('status', ''):<12}{row.get('message', '')}")
+            if row.get("status") == "reachable":
+                self.poutput(line)
+            else:
+                self.perror(line)
+        summary = report.get("summary", {})
+        self.poutput(f"\n총 {len(results)}건 ({report.get('elapsed_s', 0)}s): "
+                     + ", ".join(f"{k} {v}건" for k, v in summary.items()))
+
+    def do_server_stats(self, arg):
+        """
+        서버 명령별 호출 수/실패 수/처리 시간 통계와 파일 캐시 상태를 출력합니다.
+        사용법: server-stats [--json] [--reset]
+        """
+        parser = argparse.ArgumentParser(prog="server-stats", add_help=False)
+        group = parser.add_mutually_exclusive_group()
+        group.add_argument("--json", action="store_true", help="통계를 JSON으로 출력")
+        group.add_argument("--reset", action="store_true", help="서버 통계 초기화")
+
+        try:
+            args = parser.parse_args(shlex.split(arg))
+        except SystemExit:
+            self.perror("사용법: server-stats [--json] [--reset]")
+            return
+
+        payload = "reset" if args.reset else "json" if args.json else ""
+        request = message_pb2.Request(command="server-stats", payload=payload)
+        response = grpc_stub.SendCommand(request)
+        if response.success:
+            if hasattr(self, "config"):
+                self.config.set("cmd_status", True)
+            self.poutput(response.result)
+        else:
+            if hasattr(self, "config"):
+                self.config.set("cmd_status", False)
+            self.perror(f"[서버 오류] {response.result}")
+
+    def do_job_list(self, arg):
+        """
+        서버 백그라운드 작업(commission/recommission/generateScf/update-sw-ver) 목록을 출력합니다.
+        사용법: job-list [--all]   (--all: 다른 클라이언트가 등록한 작업 포함)
+        """
+        parser = argparse.ArgumentParser(prog="job-list", add_help=False)
+        parser.add_argument("--all", action="store_true", help="모든 세션의 작업 표시")
+        try:
+            args = parser.parse_args(shlex.split(arg))
+        except SystemExit:
+            self.perror("사용법: job-list [--all]")
+            return
+
+        try:
+            jobs = list_jobs(all_sessions=args.all)
+        except Exception as e:
+            if hasattr(self, "config"):
+                self.config.set("cmd_status", False)
+            self.perror(f"[서버 오류] 작업 목록 조회 실패: {e}")
+            return
+
+        if hasattr(self, "config"):
+            self.config.set("cmd_status", True)
+        if not jobs:
+            self.poutput("등록된 작업이 없습니다.")
+            return
+
+        now = time.time()
+        self.poutput(f"{'job_id':<14}{'command':<15}{'bts_id':<12}{'state':<11}{'elapsed':>9}  등록 시각")
+        for job in jobs:
+            end = job.finished_at or now
+            elapsed = f"{end - job.started_at:.1f}s" if job.started_at else "-"
+            created = datetime.fromtimestamp(job.created_at).strftime("%H:%M:%S")
+            self.poutput(f"{job.job_id:<14}{job.command:<15}{job.bts_id or '-':<12}{job.state:<11}{elapsed:>9}  {created}")
+
+    def do_job_watch(self, arg):
+        """
+        서버 백그라운드 작업의 출력을 처음부터 다시 받아 끝날 때까지 표시합니다.
+        사용법: job-watch <job_id>   (Ctrl+C: 작업 취소 요청)
+        """
+        tokens = shlex.split(arg)
+        if len(tokens) != 1:
+            self.perror("사용법: job-watch <job_id>")
+            return
+
+        response = watch_job(self, tokens[0])
+        if response.success:
+            if hasattr(self, "config"):
+                self.config.set("cmd_status", True)
+            self.poutput(f"[작업 완료] {tokens[0]}")
+        else:
+            if hasattr(self, "config"):
+                self.config.set("cmd_status", False)
+            self.perror(f"[작업 실패] {tokens[0]}\n{response.result}")
+
+    def do_job_cancel(self, arg):
+        """
+        서버 백그라운드 작업을 취소합니다. (실행 중이면 서버가 admin-cli를 종료)
+        사용법: job-cancel <job_id>
+        """
+        tokens = shlex.split(arg)
+        if len(tokens) != 1:
+            self.perror("사용법: job-cancel <job_id>")
+            return
+
+        info = cancel_job(tokens[0])
+        if info.state == "rejected":
+            if hasattr(self, "config"):
+                self.config.set("cmd_status", False)
+            self.perror(f"[서버 오류] {info.result}")
+            return
+
+        if hasattr(self, "config"):
+            self.config.set("cmd_status", True)
+        self.poutput(f"[작업 취소 요청] {info.job_id} ({info.command}) 현재 상태: {info.state}")
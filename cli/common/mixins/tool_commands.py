@@ -4,7 +4,6 @@ import shlex
 from datetime import datetime
 import xml.etree.ElementTree as ET
 from cli.common.util.commit_utils import generate_cli_script_from_xml, load_param_dict, reverse_formula
-import openpyxl
 import json
 from cli.settings import is_debug
 from dotenv import load_dotenv
@@ -52,7 +51,7 @@ class ToolCommandMixin:
                     continue
 
                 cmd = tokens[0]
-                cmd_func = getattr(self, f"do_{cmd.replace('-', '_')}", None)
+                cmd_func = self.get_command_func(cmd)
 
                 if is_debug:
                     print("cmd       :", cmd)
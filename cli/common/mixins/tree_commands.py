@@ -3,6 +3,8 @@ import os
 import re
 import shlex
 from cli.common.util.commit_utils import load_ru_dict
+from cli.common.util.mo_index import MoIndex
+from cli.common.util.mo_schema import compile_mo_schema
 from xml.etree import ElementTree as ET
 from cli.settings import is_debug
 from cli.core.config.ru_template_map import ru_template_map
@@ -76,12 +78,13 @@ class TreeCommandMixin:
                 return
 
             parent_mo = self.mo_class
-            if parent_mo not in self.mo_param_dict:
+            schema = self._get_mo_schema()
+            parent_spec = schema.get(parent_mo)
+            if parent_spec is None:
                 self.perror(f"[오류] '{parent_mo}'는 사전에 정의된 MO가 아닙니다.")
                 return
 
-            children = self.mo_param_dict[parent_mo].get("children", [])
-            if mo_class not in children:
+            if mo_class not in parent_spec.children:
                 self.perror(f"[오류] '{parent_mo}' 아래에는 '{mo_class}'를 생성할 수 없습니다.")
                 return
 
@@ -90,35 +93,24 @@ class TreeCommandMixin:
                 self.poutput(f"[INFO] '{mo_class} 000' → '{mo_class} {self.bts_id}' 으로 치환됨")
                 mo_id = self.bts_id
 
-            # param의 range로부터 ID 유효성 검사
-            mo_id_param = mo_class.lower() + "Id"
-            param_info = self.mo_param_dict.get(mo_class, {}).get("params", {}).get(mo_id_param)
+            # param의 range로부터 ID 유효성 검사 (range는 스키마 컴파일 시 파싱됨)
+            mo_spec = schema.get(mo_class)
 
             ## TOPP의 임시 id부여를 위해서
-            if mo_class != "TOPP" and param_info and "range" in param_info and param_info["range"]:
-                match = re.match(r"^(\d+)\.\.\.(\d+), step (\d+)$", param_info["range"])
-                if match:
-                    min_val, max_val, step = map(int, match.groups())
-                    if is_debug:
-                        print(f"[디버그] ID 범위 검사 진입: {mo_class}.{mo_id_param} = {mo_id}, 허용 범위 = {min_val}~{max_val}, step {step}")
-                    try:
-                        id_val = int(mo_id)
-                        if id_val < min_val or id_val > max_val or (id_val - min_val) % step != 0:
-                            self.perror(f"[오류] '{mo_class}'의 ID는 {min_val}~{max_val} 범위이며 step {step}이어야 합니다.")
-                            return
-                    except ValueError:
-                        self.perror(f"[오류] '{mo_class}'의 ID '{mo_id}'는 숫자가 아닙니다.")
-                        return
+            if mo_class != "TOPP" and mo_spec is not None and mo_spec.id_range:
+                if is_debug:
+                    min_val, max_val, step = mo_spec.id_range
+                    print(f"[디버그] ID 범위 검사 진입: {mo_class} = {mo_id}, 허용 범위 = {min_val}~{max_val}, step {step}")
+                error = mo_spec.check_id(mo_id)
+                if error:
+                    self.perror(error)
+                    return
 
             self.match_tail += f"/{mo_class}-{mo_id}"
             self.prompt_stack.append(f"{mo_class.lower()}({mo_id})")
 
         # MO 존재 여부 확인 후 생성 또는 이동
-        cmdata = self.xml_tree.find(".//{*}cmData")
-        found = any(
-            mo.attrib.get("distName") == self.match_tail
-            for mo in cmdata.findall("{*}managedObject")
-        )
+        found = self.match_tail in self._get_mo_index()
 
         if not found:
             self._create_managed_object(mo_class, mo_id)
@@ -142,7 +134,8 @@ class TreeCommandMixin:
             self.perror(f"[오류] {e}")
             return
 
-        cmdata = self.xml_tree.find(".//{*}cmData")
+        mo_index = self._get_mo_index()
+        cmdata = mo_index.cmdata
 
         # class value
         if mo_class == "MRBTS":
@@ -160,12 +153,14 @@ class TreeCommandMixin:
         if mo_class == "RMOD" and self.rat_type.upper() == "5G" and getattr(self, "ru_type", None) == "APHA":
             actual_mo_class = "ASIRMOD"
 
-        ET.SubElement(cmdata, "managedObject", {
+        new_mo = ET.SubElement(cmdata, "managedObject", {
             "class": class_value.replace(f":{mo_class}", f":{actual_mo_class}"),
             "distName": self.match_tail.replace(f"/{mo_class}-", f"/{actual_mo_class}-"),
             "version": self._resolve_version(mo_class),
             "operation": "create"
         })
+        mo_index.add(new_mo)
+        mo_index.mark_dirty(new_mo.attrib["distName"], "MO-CREATE")
 
         self.mo_class = mo_class 
         self.prompt = self._build_prompt().replace(mo_class.lower(), actual_mo_class.lower())
@@ -287,8 +282,7 @@ class TreeCommandMixin:
     # 헬퍼: 리스트/그룹 유틸
     # =========================
     def _next_index(self, dn: str, list_name: str) -> int:
-        cmdata = self.xml_tree.find(".//{*}cmData")
-        mo = cmdata.find(f".//{{*}}managedObject[@distName='{dn}']")
+        mo = self._get_mo_index().get(dn)
         if mo is None:
             return 1
         lst = mo.find(f"./{{*}}list[@name='{list_name}']")
@@ -300,8 +294,7 @@ class TreeCommandMixin:
         return len(lst.findall("./{*}p")) + 1
 
     def _list_has_p_value(self, dn: str, list_name: str, value: str) -> bool:
-        cmdata = self.xml_tree.find(".//{*}cmData")
-        mo = cmdata.find(f".//{{*}}managedObject[@distName='{dn}']")
+        mo = self._get_mo_index().get(dn)
         if mo is None:
             return False
         lst = mo.find(f"./{{*}}list[@name='{list_name}']")
@@ -313,8 +306,7 @@ class TreeCommandMixin:
         return False
 
     def _lbps_item_exists(self, dn: str, list_name: str, nr_cell_id: str) -> bool:
-        cmdata = self.xml_tree.find(".//{*}cmData")
-        mo = cmdata.find(f".//{{*}}managedObject[@distName='{dn}']")
+        mo = self._get_mo_index().get(dn)
         if mo is None:
             return False
         lst = mo.find(f"./{{*}}list[@name='{list_name}']")
@@ -419,8 +411,7 @@ class TreeCommandMixin:
 
         # ===== NRDU-1.refNrCellGroup에 gid 추가 =====
         nrdu_dn = f"{nrbts_prefix}/NRDU-1"
-        cmdata = self.xml_tree.find(".//{*}cmData")
-        nrdu_elem = cmdata.find(f".//{{*}}managedObject[@distName='{nrdu_dn}']")
+        nrdu_elem = self._get_mo_index().get(nrdu_dn)
         if nrdu_elem is not None:
             # 중복이면 스킵
             if not self._list_has_p_value(nrdu_dn, "refNrCellGroup", gid):
@@ -456,29 +447,31 @@ class TreeCommandMixin:
     ##PA생성
     def _set_param(self, key: str, value: str):
         #self.poutput(f"[DEBUG] key={key}, value={value}")
-        if self.mo_class not in self.mo_param_dict:
+        mo_spec = self._get_mo_schema().get(self.mo_class)
+        if mo_spec is None:
             self.perror(f"[오류] 알 수 없는 MO: {self.mo_class}")
             return
 
-        mo_info = self.mo_param_dict[self.mo_class]
-        if "params" not in mo_info or key not in mo_info["params"]:
+        param_spec = mo_spec.params.get(key)
+        if param_spec is None:
             self.perror(f"[오류] '{self.mo_class}'에는 파라미터 '{key}'를 설정할 수 없습니다.")
             return
 
-        for mo in self.xml_tree.findall(".//{*}managedObject"):
-            if mo.attrib.get("class", "").split(":")[-1] == self.mo_class and mo.attrib.get("distName", "").endswith(self.match_tail):
-                for p in mo.findall("{*}p"):
-                    if p.attrib.get("name") == key:
-                        p.text = value
-                        if is_debug:
-                            self.poutput(f"[DEBUG] {key} 갱신: {value}")
-                        self.user_inputs.append(("SET", self.match_tail, key, value))
-                        return
-                ET.SubElement(mo, "p", name=key).text = value
-                if is_debug:
-                    self.poutput(f"[DEBUG] {key} 추가됨: {value}")
-                self.user_inputs.append(("SET", self.match_tail, key, value))
-                return
+        # rulebook/템플릿 값(TEMP_, distName 참조 등)도 거치므로 range 위반은 경고만 출력
+        if is_debug:
+            warning = param_spec.validate(value)
+            if warning:
+                self.poutput(f"[DEBUG] [경고] {warning}")
+
+        mo_index = self._get_mo_index()
+        mo = mo_index.get(self.match_tail)
+        if mo is not None and mo.attrib.get("class", "").split(":")[-1] == self.mo_class:
+            created = mo_index.params_of(mo).set_p(key, value)
+            mo_index.mark_dirty(self.match_tail, "SET")
+            if is_debug:
+                self.poutput(f"[DEBUG] {key} {'추가됨' if created else '갱신'}: {value}")
+            self.user_inputs.append(("SET", self.match_tail, key, value))
+            return
 
         self.perror("현재 MO를 찾을 수 없습니다.")
     
@@ -486,6 +479,36 @@ class TreeCommandMixin:
         root = ET.Element("raml", {"version": "2.0"})
         cmdata = ET.SubElement(root, "cmData", {"type": "plan"})
         return ET.ElementTree(root)
+
+    def _get_mo_index(self) -> MoIndex:
+        """
+        현재 xml_tree에 대한 distName 인덱스를 반환합니다.
+        xml_tree가 다른 객체로 교체되었으면 한 번만 재구성합니다.
+        """
+        mo_index = getattr(self, "mo_index", None)
+        if mo_index is None or not mo_index.is_for(self.xml_tree):
+            mo_index = MoIndex(self.xml_tree)
+            self.mo_index = mo_index
+        return mo_index
+
+    def _reset_mo_index(self, track_changes: bool = False):
+        """
+        xml_tree를 새로 지정했을 때 호출합니다.
+        track_changes는 xml_tree가 ref_tree와 같은 상태일 때만 True로 지정합니다.
+        """
+        self.mo_index = MoIndex(self.xml_tree, track_changes=track_changes)
+
+    def _get_mo_schema(self):
+        """
+        mo_param_dict를 컴파일한 스키마를 반환합니다.
+        mo_param_dict가 다른 dict로 교체되었으면 다시 컴파일합니다.
+        """
+        raw = getattr(self, "mo_param_dict", None)
+        schema = getattr(self, "mo_schema", None)
+        if schema is None or schema.source is not raw:
+            schema = compile_mo_schema(raw)
+            self.mo_schema = schema
+        return schema
     
     ##LIST
     def _set_list_param(self, list_name: str, index: str, param_dict: dict):
@@ -499,72 +522,59 @@ class TreeCommandMixin:
             self.poutput(f"[DEBUG] match_tail: {self.match_tail}")
             
         # 1. 리스트 이름 유효성 검사
-        if self.mo_class not in self.mo_param_dict:
+        mo_spec = self._get_mo_schema().get(self.mo_class)
+        if mo_spec is None:
             self.perror(f"[오류] 알 수 없는 MO: {self.mo_class}")
             return
 
-        mo_info = self.mo_param_dict[self.mo_class]
-        if list_name not in mo_info["params"]:
+        list_spec = mo_spec.params.get(list_name)
+        if list_spec is None:
             self.perror(f"[오류] '{self.mo_class}'에는 리스트 '{list_name}'를 설정할 수 없습니다.")
             return
-        list_def = mo_info["params"][list_name]
-        if list_def.get("type") != "list" or "children" not in list_def:
+        if not list_spec.is_list:
             self.perror(f"[오류] '{list_name}'는 리스트 파라미터가 아닙니다.")
             return
 
         # 2. 자식 파라미터 유효성 검사 (val 제외)
-        for k in param_dict.keys():
-            if k != "val" and k not in list_def["children"]:
+        for k, v in param_dict.items():
+            if k == "val":
+                continue
+            child_spec = list_spec.children.get(k)
+            if child_spec is None:
                 self.perror(f"[오류] 리스트 '{list_name}'에는 파라미터 '{k}'를 설정할 수 없습니다.")
                 return
+            if is_debug:
+                warning = child_spec.validate(v)
+                if warning:
+                    self.poutput(f"[DEBUG] [경고] {warning}")
 
         # 3. XML 반영
-        for mo in self.xml_tree.findall(".//{*}managedObject"):
-            class_name = mo.attrib.get("class", "").split(":")[-1]
-            dist_name = mo.attrib.get("distName", "")
-            if class_name == self.mo_class and dist_name.endswith(self.match_tail):
-                list_node = None
-                for lst in mo.findall("{*}list"):
-                    if lst.attrib.get("name") == list_name:
-                        list_node = lst
-                        break
-                if list_node is None:
-                    list_node = ET.SubElement(mo, "list", name=list_name)
-
-                idx = int(index) - 1
-
-                if "val" in param_dict:  # <p> 단일 항목 케이스
-                    p_nodes = list_node.findall("{*}p")
-                    while len(p_nodes) <= idx:
-                        ET.SubElement(list_node, "p")
-                        p_nodes = list_node.findall("{*}p")
-                    p_node = p_nodes[idx]
-                    p_node.attrib.clear()  # name 속성 제거
-                    p_node.text = param_dict["val"]
-                    self.user_inputs.append(("SET-LIST", self.match_tail, list_name, index, "val", param_dict["val"]))
-                    return
+        mo_index = self._get_mo_index()
+        mo = mo_index.get(self.match_tail)
+        if mo is not None and mo.attrib.get("class", "").split(":")[-1] == self.mo_class:
+            mo_params = mo_index.params_of(mo)
+            mo_params.get_or_create_list(list_name)
+            mo_index.mark_dirty(self.match_tail, "SET-LIST")
+
+            idx = int(index) - 1
+
+            if "val" in param_dict:  # <p> 단일 항목 케이스
+                p_node = mo_params.list_p(list_name, idx)
+                p_node.attrib.clear()  # name 속성 제거
+                p_node.text = param_dict["val"]
+                self.user_inputs.append(("SET-LIST", self.match_tail, list_name, index, "val", param_dict["val"]))
+                return
 
-                # <item><p name="...">...</p></item> 구조
-                item_nodes = list_node.findall("{*}item")
-                while len(item_nodes) <= idx:
-                    ET.SubElement(list_node, "item")
-                    item_nodes = list_node.findall("{*}item")
-                item = item_nodes[idx]
-
-                for k, v in param_dict.items():
-                    updated = False
-                    for p in item.findall("{*}p"):
-                        if p.attrib.get("name") == k:
-                            p.text = v
-                            updated = True
-                            break
-                    if not updated:
-                        ET.SubElement(item, "p", name=k).text = v
-                    self.user_inputs.append(("SET-LIST", self.match_tail, list_name, index, k, v))
+            # <item><p name="...">...</p></item> 구조
+            item = mo_params.list_item(list_name, idx)
 
-                if is_debug:
-                    self.poutput(f"[DEBUG] 리스트 {list_name}[{index}] 수정됨")
-                return
+            for k, v in param_dict.items():
+                mo_params.set_item_p(item, k, v)
+                self.user_inputs.append(("SET-LIST", self.match_tail, list_name, index, k, v))
+
+            if is_debug:
+                self.poutput(f"[DEBUG] 리스트 {list_name}[{index}] 수정됨")
+            return
 
         self.perror("현재 MO를 찾을 수 없습니다.")
 
@@ -749,8 +759,11 @@ class TreeCommandMixin:
             self.perror(f"{target_key} 를 포함한 MO를 찾을 수 없습니다.")
             return
 
+        mo_index = self._get_mo_index()
         for mo, dist in delete_targets:
             cmdata.remove(mo)
+            mo_index.remove(mo)
+            mo_index.mark_dirty(dist, "MO-DELETE")
             self.poutput(f"[INFO] {dist} 제거됨 (트리에서 삭제됨)")
 
 
@@ -774,11 +787,14 @@ class TreeCommandMixin:
         cmdata = self.xml_tree.find(".//{*}cmData")
         found = False
 
+        mo_index = self._get_mo_index()
         keyword = f"/{mo_class}-{mo_id}"
         for mo in list(cmdata.findall("{*}managedObject")):
             dist = mo.attrib.get("distName", "")
             if keyword in dist:
                 cmdata.remove(mo)
+                mo_index.remove(mo)
+                mo_index.mark_dirty(dist, "MO-DELETE")
                 self._append_delete_operation(mo_class, dist)
                 self.poutput(f"[INFO] {dist} 삭제 예약됨 (operation=delete)")
                 found = True
@@ -800,12 +816,15 @@ class TreeCommandMixin:
         else:
             class_value = f"com.nokia.srbts.{branch}:{mo_class}"
 
-        ET.SubElement(cmdata, "managedObject", {
+        delete_mo = ET.SubElement(cmdata, "managedObject", {
             "class": class_value,
             "distName": dist_name,
             "version": self._resolve_version(mo_class),
             "operation": "delete"
         })
+        mo_index = self._get_mo_index()
+        mo_index.add(delete_mo)
+        mo_index.mark_dirty(dist_name, "MO-DELETE-SCF")
 
 
     def do_no_pa(self, arg):
@@ -826,23 +845,18 @@ class TreeCommandMixin:
             self.perror("현재 위치한 MO가 없습니다.")
             return
 
-        target_mo = None
-        for mo in self.xml_tree.findall(".//{*}managedObject"):
-            if mo.attrib.get("distName", "") == self.match_tail:
-                target_mo = mo
-                break
+        mo_index = self._get_mo_index()
+        target_mo = mo_index.get(self.match_tail)
 
-        if not target_mo:
+        if target_mo is None:
             self.perror("현재 MO에 해당하는 XML 객체를 찾을 수 없습니다.")
             return
 
-        found = False
-        for p in target_mo.findall("{*}p"):
-            if p.attrib.get("name") == param_name:
-                target_mo.remove(p)
-                found = True
-                self.poutput(f"[INFO] '{param_name}' 파라미터가 삭제되었습니다.")
-                break
+        found = mo_index.params_of(target_mo).remove_p(param_name)
+        if found:
+            mo_index.mark_dirty(self.match_tail, "NO-PA")
+        if found:
+            self.poutput(f"[INFO] '{param_name}' 파라미터가 삭제되었습니다.")
 
         if not found:
             self.poutput(f"[INFO] '{param_name}' 파라미터는 현재 MO에 존재하지 않습니다.")
@@ -867,10 +881,15 @@ class TreeCommandMixin:
             return
 
         target_mo = self._find_current_mo()
-        if not target_mo:
+        if target_mo is None:
             self.perror("현재 MO를 찾을 수 없습니다.")
             return
 
+        # 리스트 구조를 직접 수정하므로 파라미터 인덱스는 다음 접근 시 재구성
+        mo_index = self._get_mo_index()
+        mo_index.invalidate(target_mo)
+        mo_index.mark_dirty(self.match_tail, "NO-LIST")
+
         # 1) 전체 리스트 삭제
         if len(tokens) == 1:
             list_name = tokens[0]
@@ -1011,10 +1030,7 @@ class TreeCommandMixin:
         """현재 match_tail 기준으로 XML에서 해당 MO를 반환"""
         if not self.mo_class or not self.match_tail:
             return None
-        for mo in self.xml_tree.findall(".//{*}managedObject"):
-            if mo.attrib.get("distName", "") == self.match_tail:
-                return mo
-        return None
+        return self._get_mo_index().get(self.match_tail)
     
     def do_add_auto_pa(self, arg):
         """
@@ -1039,15 +1055,13 @@ class TreeCommandMixin:
             return
 
         # 현재 XML에서 해당 MO 객체 찾기
-        for mo in self.xml_tree.findall(".//{*}managedObject"):
-            dist = mo.attrib.get("distName", "")
-            if dist == self.match_tail:
-                target_mo = mo
-                break
+        mo_index = self._get_mo_index()
+        target_mo = mo_index.get(self.match_tail)
 
         if target_mo is None:
             self.perror("현재 MO에 해당하는 XML 객체를 찾을 수 없습니다.")
             return
+        mo_params = mo_index.params_of(target_mo)
 
         added_count = 0
         for key, info in params.items():
@@ -1055,14 +1069,15 @@ class TreeCommandMixin:
                 continue
 
             # 이미 존재하는지 확인
-            if any(p.attrib.get("name") == key for p in target_mo.findall("{*}p")):
+            if mo_params.get_p(key) is not None:
                 continue
 
             value = info.get("default")
             if value is None or str(value).lower() == "null":
                 value = f"TEMP_{key}"
 
-            ET.SubElement(target_mo, "p", name=key).text = value
+            mo_params.set_p(key, value)
+            mo_index.mark_dirty(self.match_tail, "SET")
             added_count += 1
             if is_debug:
                 self.poutput(f"[DEBUG] '{key}' 추가됨: {value}")
@@ -1701,13 +1716,19 @@ class TreeCommandMixin:
         new_str = f"{self.mo_class}-{new_id}"
         changed_count = 0
 
+        mo_index = self._get_mo_index()
         for mo in self.xml_tree.iter("managedObject"):
             dist = mo.attrib.get("distName", "")
             if dist.startswith(self.match_tail):
                 new_dist = dist.replace(old_str, new_str)
                 mo.attrib["distName"] = new_dist
+                mo_index.mark_dirty(dist, "CHG-MO-ID")
+                mo_index.mark_dirty(new_dist, "CHG-MO-ID")
                 changed_count += 1
 
+        # distName이 바뀌었으므로 인덱스 재구성 (변경 내역은 유지)
+        mo_index.rebuild(self.xml_tree)
+
         # self.match_tail도 갱신
         self.match_tail = self.match_tail.replace(old_str, new_str)
 
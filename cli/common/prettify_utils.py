@@ -1,8 +1,109 @@
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
 
-def prettify_xml(elem: ET.Element) -> str:
-    """ElementTree Element를 들여쓰기 적용된 문자열(XML)로 변환"""
+# minidom.toprettyxml(indent="  ")과 동일한 출력을 DOM 생성 없이 바로 만들어내는 writer
+# - 요소/속성/텍스트를 순서대로 한 번만 순회하며 문자열 조각(chunk)을 생성
+# - 네임스페이스가 남아있는 트리 등 동일 출력을 보장할 수 없는 경우에만 minidom으로 처리
+
+XML_DECLARATION = '<?xml version="1.0" ?>\n'
+
+
+def _escape(data: str) -> str:
+    # minidom._write_data와 동일한 이스케이프 (텍스트/속성 공통)
+    if "&" in data:
+        data = data.replace("&", "&amp;")
+    if "<" in data:
+        data = data.replace("<", "&lt;")
+    if "\"" in data:
+        data = data.replace("\"", "&quot;")
+    if ">" in data:
+        data = data.replace(">", "&gt;")
+    return data
+
+
+def _normalize_text(text: str) -> str:
+    # XML 파서의 줄바꿈 정규화(\r\n, \r → \n)를 그대로 반영
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _can_stream(elem: ET.Element) -> bool:
+    for e in elem.iter():
+        tag = e.tag
+        if tag is ET.Comment:
+            continue
+        if not isinstance(tag, str) or "}" in tag:
+            return False
+        if any("}" in k for k in e.attrib):
+            return False
+    return True
+
+
+def _iter_element(elem: ET.Element, indent: str, addindent: str):
+    tag = elem.tag
+    if tag is ET.Comment:
+        yield f"{indent}<!--{elem.text or ''}-->\n"
+        return
+
+    head = [indent, "<", tag]
+    for name, value in elem.attrib.items():
+        head.append(f' {name}="{_escape(value)}"')
+
+    text = _normalize_text(elem.text) if elem.text else ""
+    children = list(elem)
+
+    if not children:
+        if text:
+            # 텍스트 노드 하나만 있는 경우 한 줄로 출력
+            yield "".join(head) + f">{_escape(text)}</{tag}>\n"
+        else:
+            yield "".join(head) + "/>\n"
+        return
+
+    head.append(">\n")
+    yield "".join(head)
+
+    child_indent = indent + addindent
+    if text:
+        yield _escape(f"{child_indent}{text}\n")
+    for child in children:
+        yield from _iter_element(child, child_indent, addindent)
+        if child.tail:
+            yield _escape(f"{child_indent}{_normalize_text(child.tail)}\n")
+
+    yield f"{indent}</{tag}>\n"
+
+
+def iter_pretty_xml(elem: ET.Element, indent: str = "  ", chunk_size: int = 64 * 1024):
+    """
+    들여쓰기 적용된 XML을 chunk_size 내외의 문자열 조각으로 순서대로 생성
+    (prettify_xml과 동일한 내용)
+    """
+    if not _can_stream(elem):
+        yield _prettify_with_minidom(elem, indent)
+        return
+
+    buf = [XML_DECLARATION]
+    size = len(XML_DECLARATION)
+    for piece in _iter_element(elem, "", indent):
+        buf.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield "".join(buf)
+            buf = []
+            size = 0
+    if buf:
+        yield "".join(buf)
+
+
+def _prettify_with_minidom(elem: ET.Element, indent: str = "  ") -> str:
+    import xml.dom.minidom as minidom
+
     rough_string = ET.tostring(elem, 'utf-8')
     reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ")
\ No newline at end of file
+    return reparsed.toprettyxml(indent=indent)
+
+
+def prettify_xml(elem: ET.Element) -> str:
+    """ElementTree Element를 들여쓰기 적용된 문자열(XML)로 변환"""
+    return "".join(iter_pretty_xml(elem))
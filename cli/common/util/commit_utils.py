@@ -3,48 +3,124 @@ import json
 import xml.etree.ElementTree as ET
 import re
 import copy
-from cli.settings import is_debug
-from cli.common.util.server_utils import load_from_server
+import math
+from cli.settings import is_debug, TRANSLATE_BATCH, TRANSLATE_VERIFY
+from cli.common.util.ref_cache import load_cached
+from cli.common.util.mo_schema import MoClassSpec
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 batch 변환은 순수 Python으로 처리
+    np = None
 
 def load_param_dict(self, rat_type: str, version_code: str):
     filename = f"{version_code}_formula_param_dict.json"
     try:
-        raw_dict = load_from_server(filename, "json", purpose="dict")
+        raw_dict = load_cached(filename, "json", purpose="dict")
         return {tuple(k.split("::")): v for k, v in raw_dict.items()}
     except Exception as e:
         self.perror(f"[오류] param_dict 로드 실패: {e}")
         return {}
 
+def mo_param_dict_filename(version_code: str, du_type: str):
+    return f"{du_type.upper()}_{version_code}_mo_param_dict.json"
+
 def load_mo_param_dict(self, rat_type: str, version_code: str, du_type: str):
-    filename = f"{du_type.upper()}_{version_code}_mo_param_dict.json"
+    filename = mo_param_dict_filename(version_code, du_type)
     try:
-        raw_dict = load_from_server(filename, "json", purpose="dict")
+        raw_dict = load_cached(filename, "json", purpose="dict")
         return raw_dict
     except Exception as e:
         self.perror(f"[오류] mo_param_dict 로드 실패: {e}")
         return {}
 
-def load_ru_dict(self, rat_type):
+def ru_dict_filename(rat_type):
     if rat_type.upper() == "4G":
-        filename = "ru_info_for_antl.json"
+        return "ru_info_for_antl.json"
     elif rat_type.upper() == "5G":
-        filename = "ru_info_for_phyant.json"
-    else:
+        return "ru_info_for_phyant.json"
+    return None
+
+def load_ru_dict(self, rat_type):
+    filename = ru_dict_filename(rat_type)
+    if filename is None:
         self.perror(f"[오류] 지원되지 않는 RAT 타입입니다: {rat_type}")
         return {}
     try:
         print("filename = ",filename)
-        raw_dict = load_from_server(filename, "json", purpose="dict")
+        raw_dict = load_cached(filename, "json", purpose="dict")
         return raw_dict
     except Exception as e:
         self.perror(f"[오류] RU 정보 로드 실패: {e}")
         return {}
 
+# (UI_VALUE ± a) * m / d 형태의 선형 공식
+_LINEAR_FORMULA_RE = re.compile(
+    r"^\s*\(\s*UI_VALUE\s*([\+\-])\s*([0-9\.]+)\s*\)\s*\*\s*(-?[0-9\.]+)\s*/\s*(-?[0-9\.]+)\s*$"
+)
+
+_FORMULA_CACHE = {}
+
+
+class CompiledFormula:
+    """
+    공식 문자열 하나를 컴파일한 결과.
+    - linear: (op, offset, mul, div). 선형 공식이 아니면 None
+    - forward(x): 공식 적용 결과 (float, 반올림 전)
+    - inverse(y): 선형 공식의 역함수. 선형이 아니면 ValueError
+    """
+    __slots__ = ("formula", "linear", "_code", "_error")
+
+    def __init__(self, formula: str):
+        self.formula = formula
+        self.linear = None
+        self._code = None
+        self._error = None
+
+        match = _LINEAR_FORMULA_RE.match(formula or "")
+        if match:
+            op, offset, mul, div = match.groups()
+            self.linear = (op, float(offset), float(mul), float(div))
+            return
+
+        try:
+            self._code = compile(formula, "<formula>", "eval")
+        except Exception as e:
+            self._error = e
+
+    def forward(self, x: float) -> float:
+        if self.linear is not None:
+            op, offset, mul, div = self.linear
+            # eval과 동일한 연산 순서를 유지해야 반올림 결과가 같음
+            if op == "+":
+                return (x + offset) * mul / div
+            return (x - offset) * mul / div
+        if self._error is not None:
+            raise self._error
+        return eval(self._code, {"__builtins__": {}}, {"UI_VALUE": x})
+
+    def inverse(self, y: float) -> float:
+        if self.linear is None:
+            raise ValueError("지원되지 않는 공식 형식")
+        op, offset, mul, div = self.linear
+        # 정방향: ((UI ± offset) * mul / div) = encoded
+        if op == "+":
+            return (y * div / mul) - offset
+        return (y * div / mul) + offset
+
+
+def compile_formula(formula: str) -> CompiledFormula:
+    """공식 문자열을 컴파일하여 캐시에 보관하고 반환"""
+    compiled = _FORMULA_CACHE.get(formula)
+    if compiled is None:
+        compiled = CompiledFormula(formula)
+        _FORMULA_CACHE[formula] = compiled
+    return compiled
+
+
 def apply_formula_once(original_value, formula):
     try:
-        eval_globals = {"__builtins__": {}}
-        eval_locals = {"UI_VALUE": float(original_value)}
-        result = eval(formula, eval_globals, eval_locals)
+        result = compile_formula(formula).forward(float(original_value))
         int_result = int(round(result))
 
         if is_debug:
@@ -57,14 +133,12 @@ def apply_formula_once(original_value, formula):
 
 def apply_formula_twice(original_value, formula):
     try:
+        compiled = compile_formula(formula)
         # 1차 적용
-        eval_globals = {"__builtins__": {}}
-        eval_locals = {"UI_VALUE": float(original_value)}
-        intermediate = eval(formula, eval_globals, eval_locals)
+        intermediate = compiled.forward(float(original_value))
 
         # 2차 적용
-        eval_locals = {"UI_VALUE": float(intermediate)}
-        final_result = eval(formula, eval_globals, eval_locals)
+        final_result = compiled.forward(float(intermediate))
         int_result = int(round(final_result))
         if is_debug:
            print(f"[디버그] apply_formula_twice: original={original_value}, formula='{formula}', result={int_result}")
@@ -77,24 +151,7 @@ def apply_formula_twice(original_value, formula):
 def reverse_formula(encoded_value, formula):
     try:
         encoded_value = float(encoded_value)
-
-        # 정규식 기반 단순 선형 공식 해석
-        match = re.match(r"\(UI_VALUE\s*([\+\-\*/])\s*([0-9\.]+)\)\s*\*\s*([0-9\.]+)\s*/\s*([0-9\.]+)", formula)
-        if not match:
-            raise ValueError("지원되지 않는 공식 형식")
-
-        op, offset, mul, div = match.groups()
-        offset = float(offset)
-        mul = float(mul)
-        div = float(div)
-
-        # 정방향: ((UI ± offset) * mul / div) = encoded
-        if op == "+":
-            ui_value = (encoded_value * div / mul) - offset
-        elif op == "-":
-            ui_value = (encoded_value * div / mul) + offset
-        else:
-            raise ValueError("지원되지 않는 연산자")
+        ui_value = compile_formula(formula).inverse(encoded_value)
 
         #int_result = int(round(ui_value))
         if is_debug:
@@ -105,91 +162,224 @@ def reverse_formula(encoded_value, formula):
             print(f"[디버그] reverse_formula 에러: encoded={encoded_value}, formula='{formula}', 에러={e}")
         return str(encoded_value)
 
-def generate_translated_tree(xml_tree, param_dict, mode="once"):
+def _translate_value(value, formula, mode):
+    if mode == "once":
+        return apply_formula_once(value, formula)
+    if mode == "twice":
+        return apply_formula_twice(value, formula)
+    if mode == "reverse":
+        return reverse_formula(value, formula)
+    if is_debug:
+        print(f"[디버그] 지원되지 않는 mode: {mode}")
+    return value  # fallback
+
+def _collect_translatable(mo, mo_class, param_dict):
+    """
+    managedObject 하나에서 변환 대상 (p, mo_class, entry, value, in_list) 목록을 반환
+    - 대상: MO 직속 <p>, <list> 하위 <item>의 직속 <p>
     """
-    XML 트리를 변환합니다.
+    targets = []
+    candidates = [(p, False) for p in mo.findall("{*}p")]
+    for lst in mo.findall("{*}list"):
+        for item in lst.findall(".//{*}item"):
+            candidates.extend((p, True) for p in item.findall("./{*}p"))
+
+    for p, in_list in candidates:
+        param_name = p.attrib.get("name")
+        if param_name is None:
+            continue
+        entry = param_dict.get((mo_class, param_name))
+        if entry is None:
+            continue
+        value = (p.text or "").strip()
+        if not value:
+            continue
+        targets.append((p, mo_class, entry, value, in_list))
+    return targets
+
+def _clone_translatable(xml_tree, param_dict):
+    """
+    원본 트리는 수정하지 않고 출력용 트리를 MO 단위로 새로 구성하여
+    (새 트리, 변환 대상 목록)을 반환합니다.
+    - MO 단위로 복사하며, 변환 대상이 없는 MO는 복사본 대신 원본 element를 공유
+    - 반환된 트리는 직렬화 용도로만 사용해야 함 (공유 MO 수정 금지)
+    """
+    src_root = xml_tree.getroot() if isinstance(xml_tree, ET.ElementTree) else xml_tree
+    src_cmdata = src_root.find(".//{*}cmData")
+    if src_cmdata is None:
+        return ET.ElementTree(copy.deepcopy(src_root)), []
+
+    targets = []
+
+    def shallow(elem):
+        new = elem.makeelement(elem.tag, dict(elem.attrib))
+        new.text = elem.text
+        new.tail = elem.tail
+        return new
+
+    def contains_cmdata(elem):
+        return elem is src_cmdata or any(contains_cmdata(c) for c in elem)
+
+    def clone(elem):
+        new = shallow(elem)
+        for child in elem:
+            if child is src_cmdata:
+                new.append(clone_cmdata(child))
+            elif contains_cmdata(child):
+                new.append(clone(child))
+            else:
+                new.append(copy.deepcopy(child))
+        return new
+
+    def clone_cmdata(cmdata):
+        new_cmdata = shallow(cmdata)
+        for child in cmdata:
+            if not isinstance(child.tag, str) or child.tag.rsplit("}", 1)[-1] != "managedObject":
+                new_cmdata.append(copy.deepcopy(child))
+                continue
+
+            mo_class = child.attrib.get("class")
+            mo_class = mo_class.split(':')[1] if ':' in mo_class else mo_class
+            new_mo = copy.deepcopy(child)
+            mo_targets = _collect_translatable(new_mo, mo_class, param_dict)
+            if mo_targets:
+                targets.extend(mo_targets)
+                new_cmdata.append(new_mo)
+            else:
+                new_cmdata.append(child)
+        return new_cmdata
+
+    return ET.ElementTree(clone(src_root)), targets
+
+def _translate_scalar(targets, mode):
+    """값 하나씩 공식을 적용하는 기존 방식"""
+    for p, mo_class, entry, value, in_list in targets:
+        formula = entry.get("formula")
+        try:
+            new_value = _translate_value(value, formula, mode)
+        except Exception as e:
+            default_value = entry.get("default")
+            if is_debug:
+                where = " (list 내)" if in_list else ", 기본값 사용"
+                print(f"[디버그] 공식 실패{where}: {mo_class}::{p.attrib.get('name')} = {default_value} (에러: {e})")
+            new_value = default_value or value
+
+        p.text = new_value
+
+def _batch_convert(compiled, values, mode):
+    """
+    선형 공식 하나에 속한 값들을 한 번에 변환.
+    변환할 수 없는 값(숫자 아님, inf/nan 등)은 scalar 경로와 동일하게 원본 문자열 유지
+    """
+    op, offset, mul, div = compiled.linear
+    sign_offset = offset if op == "+" else -offset
+
+    parsed_idx, parsed = [], []
+    results = list(values)
+    for i, v in enumerate(values):
+        try:
+            parsed.append(float(v))
+            parsed_idx.append(i)
+        except ValueError:
+            pass
+    if not parsed:
+        return results
+
+    if np is not None:
+        arr = np.asarray(parsed, dtype=np.float64)
+        with np.errstate(all="ignore"):
+            if mode == "reverse":
+                out = arr * div / mul - sign_offset
+            else:
+                out = (arr + sign_offset) * mul / div
+                if mode == "twice":
+                    out = (out + sign_offset) * mul / div
+                # round()와 동일한 half-to-even 반올림
+                out = np.rint(out)
+        out = out.tolist()
+    else:
+        if mode == "reverse":
+            out = [x * div / mul - sign_offset for x in parsed]
+        else:
+            out = [(x + sign_offset) * mul / div for x in parsed]
+            if mode == "twice":
+                out = [(x + sign_offset) * mul / div for x in out]
+            out = [round(x) if math.isfinite(x) else x for x in out]
+
+    for i, x in zip(parsed_idx, out):
+        if mode == "reverse":
+            results[i] = str(x)
+        elif math.isfinite(x):
+            results[i] = str(int(x))
+    return results
+
+def _translate_batch(targets, mode):
+    """
+    변환 대상을 공식별로 묶어 한 번에 변환한 뒤 일괄 반영.
+    NumPy가 있으면 배열 연산을 사용하고, 선형이 아닌 공식은 scalar 경로로 처리
+    """
+    groups = {}
+    for p, mo_class, entry, value, in_list in targets:
+        groups.setdefault(entry.get("formula"), []).append((p, value))
+
+    updates = []
+    for formula, pairs in groups.items():
+        compiled = compile_formula(formula)
+        values = [v for _, v in pairs]
+        linear = compiled.linear
+        if mode in ("once", "twice", "reverse") and linear and linear[2] != 0 and linear[3] != 0:
+            new_values = _batch_convert(compiled, values, mode)
+        else:
+            new_values = [_translate_value(v, formula, mode) for v in values]
+        updates.extend(zip((p for p, _ in pairs), new_values))
+
+    for p, new_value in updates:
+        p.text = new_value
+
+def generate_translated_tree(xml_tree, param_dict, mode="once", batch=None, verify=None):
+    """
+    XML 트리를 변환한 새 트리를 반환합니다. (원본 트리는 수정하지 않음)
 
     mode:
     - 'once'    : 공식 1회 적용
     - 'twice'   : 공식 2회 중첩 적용
     - 'reverse' : 공식 역방향 적용
+
+    batch  : 공식별 일괄 변환 사용 여부 (None이면 TRANSLATE_BATCH 설정)
+    verify : batch 결과를 scalar 결과와 비교 (None이면 TRANSLATE_VERIFY 설정)
+             불일치가 있으면 경고를 출력하고 scalar 결과를 반환
     """
+    if batch is None:
+        batch = TRANSLATE_BATCH
+    if verify is None:
+        verify = TRANSLATE_VERIFY
     if is_debug:
-        print(f"[디버그] generate_translated_tree mode = {mode}")
-    new_tree = copy.deepcopy(xml_tree)
-    cmdata = new_tree.find(".//{*}cmData")
-
-    for mo in cmdata.findall("{*}managedObject"):
-        mo_class = mo.attrib.get("class")
-        mo_class = mo_class.split(':')[1] if ':' in mo_class else mo_class
-
-        # 일반 파라미터 처리
-        for p in mo.findall("{*}p"):
-            param_name = p.attrib.get("name")
-            if param_name is None:
-                continue
-            key = (mo_class, param_name)
-            if key in param_dict:
-                entry = param_dict[key]
-                formula = entry.get("formula")
-                default_value = entry.get("default")
-                value = (p.text or "").strip()
-
-                if not value:
-                    continue
-
-                try:
-                    if mode == "once":
-                        new_value = apply_formula_once(value, formula)
-                    elif mode == "twice":
-                        new_value = apply_formula_twice(value, formula)
-                    elif mode == "reverse":
-                        new_value = reverse_formula(value, formula)
-                    else:
-                        if is_debug:
-                            print(f"[디버그] 지원되지 않는 mode: {mode}")
-                        new_value = value  # fallback
-
-                except Exception as e:
-                    if is_debug:
-                        print(f"[디버그] 공식 실패, 기본값 사용: {mo_class}::{param_name} = {default_value} (에러: {e})")
-                    new_value = default_value or value
-
-                p.text = new_value
-
-        # 리스트 내부 파라미터 처리
-        for lst in mo.findall("{*}list"):
-            for item in lst.findall(".//{*}item"):
-                for p in item.findall("./{*}p"):
-                    param_name = p.attrib.get("name")
-                    if param_name is None:
-                        continue
-                    key = (mo_class, param_name)
-                    if key in param_dict:
-                        entry = param_dict[key]
-                        formula = entry.get("formula")
-                        default_value = entry.get("default")
-                        value = (p.text or "").strip()
-
-                        if not value:
-                            continue
-
-                        try:
-                            if mode == "once":
-                                new_value = apply_formula_once(value, formula)
-                            elif mode == "twice":
-                                new_value = apply_formula_twice(value, formula)
-                            elif mode == "reverse":
-                                new_value = reverse_formula(value, formula)
-                            else:
-                                new_value = value  # fallback
-
-                        except Exception as e:
-                            if is_debug:
-                                print(f"[디버그] 공식 실패 (list 내): {mo_class}::{param_name} = {default_value} (에러: {e})")
-                            new_value = default_value or value
-
-                        p.text = new_value
+        print(f"[디버그] generate_translated_tree mode = {mode}, batch = {batch}, numpy = {np is not None}")
+
+    # 원본은 그대로 두고, 복사와 대상 수집을 한 번의 순회로 처리
+    new_tree, targets = _clone_translatable(xml_tree, param_dict)
+
+    if not batch:
+        _translate_scalar(targets, mode)
+        return new_tree
+
+    _translate_batch(targets, mode)
+
+    if verify:
+        scalar_tree, scalar_targets = _clone_translatable(xml_tree, param_dict)
+        _translate_scalar(scalar_targets, mode)
+        mismatches = [
+            (a.attrib.get("name"), a.text, b.text)
+            for a, b in zip(new_tree.iter(), scalar_tree.iter())
+            if a.text != b.text
+        ]
+        if mismatches:
+            print(f"[경고] batch 변환 결과가 scalar 결과와 {len(mismatches)}건 다릅니다. scalar 결과를 사용합니다.")
+            for name, batch_value, scalar_value in mismatches[:20]:
+                print(f"  - {name}: batch={batch_value}, scalar={scalar_value}")
+            return scalar_tree
+        if is_debug:
+            print("[디버그] batch 변환 결과가 scalar 결과와 일치합니다.")
 
     return new_tree
 
@@ -205,7 +395,7 @@ def warn_missing_required_params(xml_tree, mo_param_dict):
     """
     필수 파라미터 누락 여부를 검사하여 경고를 출력합니다.
     - xml_tree: ElementTree 객체
-    - mo_param_dict: MO 구조 dict
+    - mo_param_dict: MO 구조 dict 또는 컴파일된 MoSchema
     """
     cmdata = xml_tree.find(".//{*}cmData")
     if not cmdata:
@@ -220,8 +410,11 @@ def warn_missing_required_params(xml_tree, mo_param_dict):
         if not mo_info:
             continue
 
-        defined_params = mo_info.get("params", {})
-        required_keys = {k for k, v in defined_params.items() if v.get("required")}
+        if isinstance(mo_info, MoClassSpec):
+            required_keys = mo_info.required
+        else:
+            defined_params = mo_info.get("params", {})
+            required_keys = {k for k, v in defined_params.items() if v.get("required")}
 
         existing_keys = {p.attrib.get("name") for p in mo.findall("{*}p")}
         missing_keys = required_keys - existing_keys
@@ -232,16 +425,17 @@ def warn_missing_required_params(xml_tree, mo_param_dict):
 
     return warnings
 
-def generate_cli_script_from_xml(xml_path: str, output_path: str):
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+def generate_cli_commands(root: ET.Element) -> list:
+    """
+    cmData 하위 managedObject를 distName 순으로 정렬하여 CLI 명령 목록으로 변환
+    (generate_cli_script_from_xml / _from_xml_string / _from_tree 공통 로직)
+    """
     cmdata = root.find(".//{*}cmData")
     if cmdata is None:
         raise ValueError("cmData가 없음")
 
     commands = []
     last_path = []
-
     mos = sorted(cmdata.findall("{*}managedObject"), key=lambda mo: mo.attrib.get("distName", ""))
 
     for mo in mos:
@@ -250,6 +444,8 @@ def generate_cli_script_from_xml(xml_path: str, output_path: str):
             continue
 
         path = distname.split("/")
+
+        # 공통 prefix 계산
         common = 0
         for i in range(min(len(path), len(last_path))):
             if path[i] == last_path[i]:
@@ -289,9 +485,22 @@ def generate_cli_script_from_xml(xml_path: str, output_path: str):
     for _ in range(len(last_path) - 1):
         commands.append("exit")
 
+    return commands
+
+def generate_cli_script_from_tree(root: ET.Element) -> str:
+    """
+    메모리 상의 트리에서 바로 CLI 스크립트 텍스트를 생성 (파일 재파싱 없음)
+    반환 문자열은 generate_cli_script_from_xml이 기록하는 파일 내용과 동일
+    """
+    if isinstance(root, ET.ElementTree):
+        root = root.getroot()
+    return "".join(cmd + "\n" for cmd in generate_cli_commands(root))
+
+def generate_cli_script_from_xml(xml_path: str, output_path: str):
+    tree = ET.parse(xml_path)
+    cli_text = generate_cli_script_from_tree(tree.getroot())
     with open(output_path, "w", encoding="utf-8") as f:
-        for cmd in commands:
-            f.write(cmd + "\n")
+        f.write(cli_text)
 
 def generate_cli_script_from_xml_string(xml_str: str) -> str:
     try:
@@ -299,59 +508,4 @@ def generate_cli_script_from_xml_string(xml_str: str) -> str:
     except ET.ParseError as e:
         raise ValueError(f"XML 파싱 실패: {e}")
 
-    cmdata = root.find(".//{*}cmData")
-    if cmdata is None:
-        raise ValueError("cmData가 없음")
-
-    commands = []
-    last_path = []
-    mos = sorted(cmdata.findall("{*}managedObject"), key=lambda mo: mo.attrib.get("distName", ""))
-
-    for mo in mos:
-        distname = mo.attrib.get("distName")
-        if not distname:
-            continue
-
-        path = distname.split("/")
-
-        # 공통 prefix 계산
-        common = 0
-        for i in range(min(len(path), len(last_path))):
-            if path[i] == last_path[i]:
-                common += 1
-            else:
-                break
-
-        for _ in range(len(last_path) - common):
-            commands.append("exit")
-
-        for part in path[common:]:
-            if "-" in part:
-                cls, id = part.split("-", 1)
-                if cls != "MRBTS":
-                    commands.append(f"{cls} {id}")
-
-        for p in mo.findall("{*}p"):
-            key = p.attrib.get("name")
-            value = (p.text or "").strip()
-            if " " in value:
-                value = f'"{value}"'
-            commands.append(f"{key} {value}")
-
-        for lst in mo.findall("{*}list"):
-            list_name = lst.attrib.get("name")
-            items = lst.findall("{*}item")
-            for idx, item in enumerate(items, start=1):
-                for p in item.findall("{*}p"):
-                    key = p.attrib.get("name")
-                    value = (p.text or "").strip()
-                    if " " in value:
-                        value = f'"{value}"'
-                    commands.append(f"list {list_name} {idx} {key} {value}")
-
-        last_path = path
-
-    for _ in range(len(last_path) - 1):
-        commands.append("exit")
-
-    return "\n".join(commands)
+    return "\n".join(generate_cli_commands(root))
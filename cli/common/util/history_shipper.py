@@ -0,0 +1,152 @@
+import atexit
+import io
+import os
+import threading
+import time
+
+from cli.settings import is_debug, HISTORY_BATCH_SIZE, HISTORY_FLUSH_INTERVAL
+from cli.common.util.server_utils import upload_file
+
+# 명령어 이력(command_history.log)을 모아서 서버로 전송하는 백그라운드 전송기
+# - record()는 메모리 버퍼에 한 줄 추가만 하고 바로 반환 (명령 실행 중 RPC 없음)
+# - 버퍼가 batch_size에 도달하거나 flush_interval이 지나면 백그라운드 스레드가 한 번에 전송
+# - 전송 실패분은 spool 파일에 보관하고 다음 전송 때 먼저 보냄 (서버 장애/프로그램 재시작에도 유지)
+#   실패가 이어지면 재시도 간격을 늘려가며(최대 MAX_RETRY_DELAY초) 그동안은 spool에만 기록
+# - 프로그램 종료 시(atexit) 남은 이력을 전송
+
+HISTORY_FILENAME = "command_history.log"
+SPOOL_PATH = "/tmp/command_history.spool"
+MAX_RETRY_DELAY = 60.0
+
+
+class HistoryShipper:
+    def __init__(self, batch_size: int = 200, flush_interval: float = 2.0,
+                 spool_path: str = SPOOL_PATH, filename: str = HISTORY_FILENAME):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.spool_path = spool_path
+        self.filename = filename
+
+        self._buffer = []
+        self._cond = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._closed = False
+        self._retry_delay = 0.0
+        self._retry_at = 0.0
+        self._thread = threading.Thread(target=self._run, name="history-shipper", daemon=True)
+        self._thread.start()
+
+    def record(self, line: str):
+        """이력 한 줄을 버퍼에 추가 (line은 줄바꿈 포함)"""
+        with self._cond:
+            if self._closed:
+                self._append_spool([line])
+                return
+            self._buffer.append(line)
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify()
+
+    def flush(self) -> bool:
+        """버퍼와 spool에 남은 이력을 지금 전송. 모두 전송했으면 True"""
+        with self._cond:
+            batch, self._buffer = self._buffer, []
+        return self._ship(batch)
+
+    def close(self):
+        """백그라운드 스레드를 멈추고 남은 이력을 전송 (여러 번 호출해도 안전)"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    # ---------- 내부 ----------
+    def _run(self):
+        while True:
+            with self._cond:
+                deadline = time.monotonic() + self.flush_interval
+                while not self._closed and len(self._buffer) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed:
+                    return
+                batch, self._buffer = self._buffer, []
+
+            if time.monotonic() < self._retry_at:
+                # 직전 전송 실패 후 대기 중 → 전송 시도 없이 spool에만 기록
+                if batch:
+                    with self._send_lock:
+                        self._append_spool(batch)
+            elif batch or self._has_spool():
+                self._ship(batch)
+
+    def _ship(self, batch) -> bool:
+        with self._send_lock:
+            pending = self._read_spool() + batch
+            if not pending:
+                return True
+            try:
+                data = "".join(pending).encode("utf-8")
+                response = upload_file("log", self.filename, io.BytesIO(data), compress=len(data) > 4096)
+                ok = bool(response.success)
+                if not ok and is_debug:
+                    print(f"[디버그] 명령어 이력 전송 실패: {response.result}")
+            except Exception as e:
+                ok = False
+                if is_debug:
+                    print(f"[디버그] 명령어 이력 전송 실패: {e}")
+
+            if ok:
+                self._clear_spool()
+                self._retry_delay = 0.0
+                self._retry_at = 0.0
+            else:
+                # spool에 있던 내용은 그대로 두고 이번 batch만 이어 붙임
+                if batch:
+                    self._append_spool(batch)
+                self._retry_delay = min(MAX_RETRY_DELAY, max(self.flush_interval, self._retry_delay * 2))
+                self._retry_at = time.monotonic() + self._retry_delay
+            return ok
+
+    def _has_spool(self) -> bool:
+        try:
+            return os.path.getsize(self.spool_path) > 0
+        except OSError:
+            return False
+
+    def _read_spool(self):
+        if not self._has_spool():
+            return []
+        with open(self.spool_path, "r", encoding="utf-8") as f:
+            return f.readlines()
+
+    def _append_spool(self, lines):
+        try:
+            with open(self.spool_path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+        except OSError as e:
+            print(f"[클라 경고] 명령어 이력 spool 저장 실패: {e}")
+
+    def _clear_spool(self):
+        try:
+            os.remove(self.spool_path)
+        except FileNotFoundError:
+            pass
+
+
+_shipper = None
+_shipper_lock = threading.Lock()
+
+
+def get_history_shipper() -> HistoryShipper:
+    """프로세스 전체에서 하나의 전송기를 공유 (처음 호출 시 생성, 종료 시 자동 flush)"""
+    global _shipper
+    with _shipper_lock:
+        if _shipper is None:
+            _shipper = HistoryShipper(batch_size=HISTORY_BATCH_SIZE, flush_interval=HISTORY_FLUSH_INTERVAL)
+            atexit.register(_shipper.close)
+        return _shipper
@@ -0,0 +1,125 @@
+import time
+from cli.settings import grpc_stub, is_debug
+from cli.common.util.lazy_import import lazy_import
+from cli.common.util.server_utils import _unsupported_rpcs, _is_unimplemented
+from proto import message_pb2
+
+grpc = lazy_import("grpc")
+
+# 서버 백그라운드 작업(job) 실행/조회
+# - commission/recommission/generateScf/update-sw-ver는 SubmitJob으로 등록하고 PollJob(long-poll)으로 출력을 이어서 표시
+#   (PollJob 한 번은 서버에서 최대 JOB_POLL_WAIT초만 대기 → 서버 gRPC 스레드를 작업이 끝날 때까지 붙잡지 않음)
+# - PollJob 미지원 서버는 WatchJob 스트림으로 수신 (스트림 동안 서버 gRPC 스레드 하나 사용)
+# - 수신 중 Ctrl+C: 작업 취소 요청 (서버가 admin-cli 종료), 한 번 더 Ctrl+C: 작업은 두고 출력 수신만 중단
+# - 구버전 서버(SubmitJob 미지원)는 기존처럼 SendCommand로 끝날 때까지 대기
+
+FINAL_STATES = ("succeeded", "failed", "cancelled")
+
+
+def run_job(self, request, detach: bool = False):
+    """
+    request(message_pb2.Request)를 백그라운드 작업으로 실행하고 끝날 때까지 출력을 표시
+    detach=True면 등록만 하고 바로 반환
+    반환: message_pb2.Response (기존 SendCommand 응답과 같은 형태)
+    """
+    if "SubmitJob" not in _unsupported_rpcs:
+        try:
+            info = grpc_stub.SubmitJob(request)
+        except grpc.RpcError as e:
+            if not _is_unimplemented(e, "SubmitJob"):
+                raise
+        else:
+            if info.state == "rejected":
+                return message_pb2.Response(success=False, result=info.result)
+            target = f" BTS {info.bts_id}" if info.bts_id else ""
+            if detach:
+                self.poutput(f"[작업 등록] {info.job_id} ({info.command}{target})")
+                return message_pb2.Response(
+                    success=True, result=f"작업 {info.job_id} 등록됨 (job-watch {info.job_id}로 진행 확인)")
+            self.poutput(f"[작업 등록] {info.job_id} ({info.command}{target}) - Ctrl+C: 작업 취소")
+            return watch_job(self, info.job_id)
+
+    return grpc_stub.SendCommand(request)
+
+
+def watch_job(self, job_id: str, from_seq: int = 0):
+    """
+    작업 출력/상태를 끝날 때까지 받아서 표시하고 최종 결과를 message_pb2.Response로 반환
+    Ctrl+C 한 번: 작업 취소 요청 후 계속 수신, 두 번: 수신만 중단 (작업은 서버에서 계속)
+    """
+    seq = from_seq
+    cancel_sent = False
+    while True:
+        call = None
+        try:
+            if "PollJob" not in _unsupported_rpcs:
+                try:
+                    polled = grpc_stub.PollJob(message_pb2.WatchJobRequest(job_id=job_id, from_seq=seq))
+                except grpc.RpcError as e:
+                    if not _is_unimplemented(e, "PollJob"):
+                        raise
+                    continue
+                for event in polled.events:
+                    seq = event.seq or seq
+                    response = _show_event(self, job_id, event)
+                    if response is not None:
+                        return response
+                if polled.done:
+                    return _no_final_state(job_id)
+                if polled.retry_after:
+                    time.sleep(polled.retry_after)
+                continue
+
+            call = grpc_stub.WatchJob(message_pb2.WatchJobRequest(job_id=job_id, from_seq=seq))
+            try:
+                for event in call:
+                    seq = event.seq
+                    response = _show_event(self, job_id, event)
+                    if response is not None:
+                        return response
+            except grpc.RpcError as e:
+                # 서버의 동시 스트림 수 제한 초과 → 잠시 후 받은 seq부터 다시 연결
+                if e.code() != grpc.StatusCode.RESOURCE_EXHAUSTED:
+                    raise
+                time.sleep(1)
+                continue
+            return _no_final_state(job_id)
+        except KeyboardInterrupt:
+            if call is not None:
+                call.cancel()
+            if cancel_sent:
+                return message_pb2.Response(
+                    success=False,
+                    result=f"출력 수신을 중단했습니다. 작업 {job_id}은 서버에서 계속 진행됩니다. (job-watch {job_id})")
+            cancel_sent = True
+            info = cancel_job(job_id)
+            self.poutput(f"[작업 취소 요청] {job_id} ({info.state}) - 한 번 더 Ctrl+C: 출력 수신만 중단")
+
+
+def _show_event(self, job_id: str, event):
+    """이벤트 하나 표시. 작업이 끝났거나(종료 상태) 작업이 없으면 최종 Response 반환, 아니면 None"""
+    if event.kind == "output":
+        self.poutput(event.line)
+    elif event.kind == "error":
+        return message_pb2.Response(success=False, result=event.line)
+    elif event.HasField("job"):
+        return message_pb2.Response(success=event.job.success, result=event.job.result)
+    elif event.state != "queued" or is_debug:
+        self.poutput(f"[작업 상태] {job_id}: {event.state}")
+    return None
+
+
+def _no_final_state(job_id: str):
+    return message_pb2.Response(
+        success=False,
+        result=f"작업 {job_id}의 종료 상태를 받지 못했습니다. job-watch {job_id}로 다시 확인하세요.")
+
+
+def cancel_job(job_id: str):
+    """작업 취소 요청 후 JobInfo 반환"""
+    return grpc_stub.CancelJob(message_pb2.JobRequest(job_id=job_id))
+
+
+def list_jobs(all_sessions: bool = False):
+    """작업 목록 (기본: 이 클라이언트 세션이 등록한 작업만)"""
+    return list(grpc_stub.ListJobs(message_pb2.ListJobsRequest(all_sessions=all_sessions)).jobs)
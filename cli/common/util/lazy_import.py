@@ -0,0 +1,27 @@
+import importlib
+import importlib.util
+import sys
+
+# 무거운 모듈을 이름만 등록해 두고, 실제 속성에 처음 접근할 때 로드
+# - `grpc = lazy_import("grpc")` 형태로 모듈 최상단에서 사용 (except grpc.RpcError 등도 그대로 동작)
+# - 이미 로드된 모듈이거나 지연 로드를 지원하지 않는 환경이면 바로 import
+
+
+def lazy_import(name: str):
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None or spec.loader is None:
+        return importlib.import_module(name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,208 @@
+import xml.etree.ElementTree as ET
+
+
+def _local_tag(elem: ET.Element) -> str:
+    return elem.tag.rsplit("}", 1)[-1]
+
+
+class MoParams:
+    """
+    managedObject 하나의 자식(<p>, <list>)을 이름 기준으로 관리하는 인덱스.
+    - _set_param / _set_list_param 에서 <p>, <list>, <item>을 매번 findall로 찾지 않기 위해 사용
+    - 이 클래스를 거치지 않고 MO를 직접 수정했다면 MoIndex.invalidate(mo)로 버려야 함
+    """
+
+    def __init__(self, mo: ET.Element):
+        self.mo = mo
+        self.p_by_name = {}
+        self.list_by_name = {}
+        self.list_ps = {}
+        self.list_items = {}
+        self.item_ps = {}
+
+        for child in mo:
+            tag = _local_tag(child)
+            name = child.attrib.get("name")
+            if tag == "p":
+                self.p_by_name.setdefault(name, child)
+            elif tag == "list" and name not in self.list_by_name:
+                self.list_by_name[name] = child
+                self.list_ps[name] = [c for c in child if _local_tag(c) == "p"]
+                self.list_items[name] = [c for c in child if _local_tag(c) == "item"]
+
+    # ---------- <p> ----------
+    def get_p(self, name: str):
+        return self.p_by_name.get(name)
+
+    def set_p(self, name: str, value: str) -> bool:
+        """<p name=...> 값을 설정. 새로 추가했으면 True, 기존 값을 갱신했으면 False"""
+        p = self.p_by_name.get(name)
+        if p is not None:
+            p.text = value
+            return False
+        p = ET.SubElement(self.mo, "p", name=name)
+        p.text = value
+        self.p_by_name[name] = p
+        return True
+
+    def remove_p(self, name: str) -> bool:
+        p = self.p_by_name.pop(name, None)
+        if p is None:
+            return False
+        self.mo.remove(p)
+        # 같은 이름의 <p>가 중복으로 더 있으면 다음 것을 대표로 사용
+        for child in self.mo:
+            if _local_tag(child) == "p" and child.attrib.get("name") == name:
+                self.p_by_name[name] = child
+                break
+        return True
+
+    # ---------- <list> ----------
+    def get_list(self, name: str):
+        return self.list_by_name.get(name)
+
+    def get_or_create_list(self, name: str) -> ET.Element:
+        lst = self.list_by_name.get(name)
+        if lst is None:
+            lst = ET.SubElement(self.mo, "list", name=name)
+            self.list_by_name[name] = lst
+            self.list_ps[name] = []
+            self.list_items[name] = []
+        return lst
+
+    def list_p(self, list_name: str, idx: int) -> ET.Element:
+        """리스트 바로 아래 idx번째(0-base) <p>를 반환. 부족하면 빈 <p>로 채움"""
+        lst = self.get_or_create_list(list_name)
+        p_nodes = self.list_ps[list_name]
+        while len(p_nodes) <= idx:
+            p_nodes.append(ET.SubElement(lst, "p"))
+        return p_nodes[idx]
+
+    def list_item(self, list_name: str, idx: int) -> ET.Element:
+        """리스트의 idx번째(0-base) <item>을 반환. 부족하면 빈 <item>으로 채움"""
+        lst = self.get_or_create_list(list_name)
+        item_nodes = self.list_items[list_name]
+        while len(item_nodes) <= idx:
+            item_nodes.append(ET.SubElement(lst, "item"))
+        return item_nodes[idx]
+
+    def set_item_p(self, item: ET.Element, name: str, value: str):
+        ps = self.item_ps.get(item)
+        if ps is None:
+            ps = {}
+            for c in item:
+                if _local_tag(c) == "p":
+                    ps.setdefault(c.attrib.get("name"), c)
+            self.item_ps[item] = ps
+        p = ps.get(name)
+        if p is None:
+            p = ET.SubElement(item, "p", name=name)
+            ps[name] = p
+        p.text = value
+
+
+class MoJournal:
+    """
+    참조 트리(ref_tree) 이후 변경된 MO를 distName 기준으로 기록하는 변경 내역.
+    - entries: {distName: [작업 종류, ...]} (작업 종류: MO-CREATE, SET, SET-LIST, NO-PA, ...)
+    - commit-diff 계열은 여기에 기록된 MO만 참조 트리와 비교
+    """
+
+    def __init__(self):
+        self.entries = {}
+
+    def mark(self, dist_name: str, op: str):
+        if not dist_name:
+            return
+        ops = self.entries.setdefault(dist_name, [])
+        if not ops or ops[-1] != op:
+            ops.append(op)
+
+    def is_dirty(self, dist_name: str) -> bool:
+        return dist_name in self.entries
+
+    def clear(self):
+        self.entries = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class MoIndex:
+    """
+    cmData 하위 managedObject를 distName 기준으로 관리하는 인덱스.
+    - xml_tree 전체를 findall로 순회하지 않고 현재 MO를 O(1)로 찾기 위해 사용
+    - 같은 distName이 여러 개 있으면 문서상 첫 번째 MO를 사용 (기존 findall 순회와 동일)
+    - track_changes=True이면 journal에 변경된 MO를 기록
+      (xml_tree가 ref_tree와 같은 상태에서 만들어진 경우에만 사용. 그 외에는 journal=None → 전체 비교)
+    """
+
+    def __init__(self, xml_tree: ET.ElementTree = None, track_changes: bool = False):
+        self.tree = None
+        self.cmdata = None
+        self.by_dist = {}
+        self.params = {}
+        self.journal = MoJournal() if track_changes else None
+        self.rebuild(xml_tree)
+
+    def rebuild(self, xml_tree: ET.ElementTree):
+        """xml_tree 전체를 한 번 순회하여 인덱스를 다시 구성 (journal은 유지)"""
+        self.tree = xml_tree
+        self.cmdata = None
+        self.by_dist = {}
+        self.params = {}
+
+        root = xml_tree.getroot() if xml_tree is not None else None
+        if root is None:
+            return
+
+        self.cmdata = root.find(".//{*}cmData")
+        if self.cmdata is None:
+            return
+
+        for mo in self.cmdata.findall("{*}managedObject"):
+            dist = mo.attrib.get("distName")
+            if dist:
+                self.by_dist.setdefault(dist, mo)
+
+    def is_for(self, xml_tree: ET.ElementTree) -> bool:
+        """현재 인덱스가 주어진 xml_tree 객체 기준으로 만들어졌는지 여부"""
+        return self.tree is xml_tree
+
+    def get(self, dist_name: str):
+        if not dist_name:
+            return None
+        return self.by_dist.get(dist_name)
+
+    def add(self, mo: ET.Element):
+        dist = mo.attrib.get("distName")
+        if dist:
+            self.by_dist.setdefault(dist, mo)
+
+    def remove(self, mo: ET.Element):
+        dist = mo.attrib.get("distName")
+        if dist and self.by_dist.get(dist) is mo:
+            del self.by_dist[dist]
+        self.params.pop(mo, None)
+
+    def params_of(self, mo: ET.Element) -> MoParams:
+        """MO의 파라미터 인덱스를 반환 (처음 접근 시 한 번만 구성)"""
+        mo_params = self.params.get(mo)
+        if mo_params is None:
+            mo_params = MoParams(mo)
+            self.params[mo] = mo_params
+        return mo_params
+
+    def invalidate(self, mo: ET.Element):
+        """MO 자식을 MoParams 밖에서 직접 수정한 경우 호출"""
+        self.params.pop(mo, None)
+
+    def mark_dirty(self, dist_name: str, op: str):
+        if self.journal is not None:
+            self.journal.mark(dist_name, op)
+
+    def __contains__(self, dist_name: str) -> bool:
+        return dist_name in self.by_dist
+
+    def __len__(self) -> int:
+        return len(self.by_dist)
@@ -0,0 +1,171 @@
+import re
+from types import MappingProxyType
+
+# range 문자열 패턴 (컴파일 시 한 번만 사용)
+_ID_RANGE_RE = re.compile(r"^(\d+)\.\.\.(\d+), step (\d+)$")
+_NUM_RANGE_RE = re.compile(r"^(-?\d+(?:\.\d+)?)\.\.\.(-?\d+(?:\.\d+)?), step (\d+(?:\.\d+)?)$")
+_STR_RANGE_RE = re.compile(r"^(\d+)\.\.\.(\d+) characters$")
+
+_BOOL_VALUES = frozenset({"0", "1", "true", "false"})
+
+
+class _Frozen:
+    """__slots__ 기반 불변 객체. 생성 이후 속성 변경 불가"""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} 객체는 변경할 수 없습니다.")
+
+    def _init(self, **fields):
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+
+class ParamSpec(_Frozen):
+    """
+    파라미터 하나의 정의.
+    - range 문자열은 컴파일 시 파싱하여 kind/bounds/choices로 보관
+    - 리스트 파라미터는 children에 하위 ParamSpec을 가짐
+    """
+    __slots__ = ("name", "type", "default", "required", "range",
+                 "is_list", "children", "kind", "bounds", "choices")
+
+    def __init__(self, name: str, info: dict):
+        ptype = info.get("type")
+        range_text = info.get("range")
+        is_list = ptype == "list"
+
+        kind, bounds, choices = None, None, None
+        if isinstance(range_text, str):
+            if ptype == "Number":
+                m = _NUM_RANGE_RE.match(range_text)
+                if m:
+                    kind = "number"
+                    bounds = tuple(float(g) for g in m.groups())
+            elif ptype == "Boolean":
+                kind = "bool"
+                choices = _BOOL_VALUES
+            elif ptype == "String":
+                m = _STR_RANGE_RE.match(range_text)
+                if m:
+                    kind = "string"
+                    bounds = (int(m.group(1)), int(m.group(2)))
+            elif ptype == "Enumeration":
+                keys = set()
+                for entry in range_text.split(";"):
+                    entry = entry.strip()
+                    if not entry:
+                        continue
+                    key, _, label = entry.partition(":")
+                    keys.add(key.strip())
+                    if label.strip():
+                        keys.add(label.strip())
+                if keys:
+                    kind = "enum"
+                    choices = frozenset(keys)
+
+        children = {}
+        if is_list:
+            children = {k: ParamSpec(k, v) for k, v in (info.get("children") or {}).items()}
+
+        self._init(
+            name=name,
+            type=ptype,
+            default=info.get("default"),
+            required=bool(info.get("required", False)),
+            range=range_text,
+            is_list=is_list,
+            children=MappingProxyType(children),
+            kind=kind,
+            bounds=bounds,
+            choices=choices,
+        )
+
+    def validate(self, value: str):
+        """값이 range에 맞지 않으면 오류 메시지를, 맞으면 None을 반환"""
+        if value is None or self.kind is None:
+            return None
+
+        if self.kind == "number":
+            lo, hi, step = self.bounds
+            try:
+                num = float(value)
+            except ValueError:
+                return f"'{self.name}' 값 '{value}'는 숫자가 아닙니다."
+            if num < lo or num > hi:
+                return f"'{self.name}' 값 {value}는 범위({self.range})를 벗어납니다."
+            if step and abs(round((num - lo) / step) * step - (num - lo)) > 1e-6:
+                return f"'{self.name}' 값 {value}는 step({self.range})에 맞지 않습니다."
+            return None
+
+        if self.kind == "string":
+            lo, hi = self.bounds
+            if not lo <= len(value) <= hi:
+                return f"'{self.name}' 길이 {len(value)}는 범위({self.range})를 벗어납니다."
+            return None
+
+        if value not in self.choices and value.lower() not in self.choices:
+            return f"'{self.name}' 값 '{value}'는 허용되지 않습니다."
+        return None
+
+
+class MoClassSpec(_Frozen):
+    """
+    MO 클래스 하나의 정의.
+    - children: 생성 가능한 하위 MO 클래스 집합
+    - id_range: <mo>Id 파라미터의 (min, max, step). 없으면 None
+    - required: 필수 파라미터 이름 집합
+    """
+    __slots__ = ("name", "children", "params", "required", "id_range")
+
+    def __init__(self, name: str, info: dict):
+        params = {k: ParamSpec(k, v) for k, v in (info.get("params") or {}).items()}
+
+        id_range = None
+        id_param = params.get(name.lower() + "Id")
+        if id_param is not None and isinstance(id_param.range, str):
+            m = _ID_RANGE_RE.match(id_param.range)
+            if m:
+                id_range = tuple(map(int, m.groups()))
+
+        self._init(
+            name=name,
+            children=frozenset(info.get("children") or ()),
+            params=MappingProxyType(params),
+            required=frozenset(k for k, p in params.items() if p.required),
+            id_range=id_range,
+        )
+
+    def check_id(self, mo_id: str):
+        """MO ID가 id_range에 맞지 않으면 오류 메시지를, 맞으면 None을 반환"""
+        if self.id_range is None:
+            return None
+        min_val, max_val, step = self.id_range
+        try:
+            id_val = int(mo_id)
+        except ValueError:
+            return f"[오류] '{self.name}'의 ID '{mo_id}'는 숫자가 아닙니다."
+        if id_val < min_val or id_val > max_val or (id_val - min_val) % step != 0:
+            return f"[오류] '{self.name}'의 ID는 {min_val}~{max_val} 범위이며 step {step}이어야 합니다."
+        return None
+
+
+class MoSchema(_Frozen):
+    """mo_param_dict(JSON)를 컴파일한 결과. source는 원본 dict 참조"""
+    __slots__ = ("source", "classes")
+
+    def __init__(self, mo_param_dict: dict):
+        self._init(
+            source=mo_param_dict,
+            classes=MappingProxyType({k: MoClassSpec(k, v) for k, v in (mo_param_dict or {}).items()}),
+        )
+
+    def get(self, mo_class: str):
+        return self.classes.get(mo_class)
+
+    def __contains__(self, mo_class: str) -> bool:
+        return mo_class in self.classes
+
+
+def compile_mo_schema(mo_param_dict: dict) -> MoSchema:
+    return MoSchema(mo_param_dict)
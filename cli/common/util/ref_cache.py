@@ -0,0 +1,202 @@
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from cli.settings import is_debug, REF_CACHE_TTL, REF_CACHE_DIR
+from cli.common.util.server_utils import download_file, parse_content, NOT_MODIFIED
+
+# 참조 데이터(dict/rulebook/prodmap 등) 클라이언트 캐시
+# - (purpose, filename) 단위로 원본 bytes와 파싱 결과를 프로세스 전체에서 공유
+# - 마지막 확인 후 REF_CACHE_TTL초 이내에는 서버 요청 없이 바로 반환
+# - TTL이 지나면 서버 etag(mtime/size)로 재확인 → 변경이 없으면 내용 전송 없이 그대로 사용
+# - REF_CACHE_DIR이 설정되면 디스크에도 보관하여 재시작 후에도 재확인만으로 사용
+# - prefetch(): 필요해질 파일을 백그라운드에서 미리 받아 둠. 같은 파일을 요청한 쪽은 그 파일만 기다림
+#   (항목별 lock으로 진행 중인 다운로드가 끝나면 캐시 hit)
+
+PREFETCH_WORKERS = 4
+
+
+class _Entry:
+    __slots__ = ("content", "etag", "checked_at", "parsed")
+
+    def __init__(self, content: bytes, etag: str, checked_at: float):
+        self.content = content
+        self.etag = etag
+        self.checked_at = checked_at
+        self.parsed = {}
+
+
+class RefDataCache:
+    def __init__(self, ttl: float = 60.0, disk_dir: str = ""):
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.entries = {}
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def load(self, filename: str, filetype: str = "json", purpose: str = "generic", shared: bool = True):
+        """
+        캐시를 거쳐 파일을 읽어 파싱합니다. (실패 시 None, load_from_server와 동일)
+        shared=True: 파싱 결과를 공유 (호출자는 수정하면 안 됨)
+        shared=False: 호출마다 원본 bytes에서 새로 파싱 (수정 가능한 사본이 필요한 경우)
+        """
+        key = (purpose, filename)
+        with self._key_lock(key):
+            entry = self._get_entry(key)
+            if entry is None:
+                return None
+            if not shared:
+                return parse_content(io.BytesIO(entry.content), filetype)
+            if filetype not in entry.parsed:
+                entry.parsed[filetype] = parse_content(io.BytesIO(entry.content), filetype)
+            return entry.parsed[filetype]
+
+    def warm(self, filename: str, purpose: str = "generic") -> bool:
+        """파싱 없이 원본만 받아 둠 (호출마다 사본을 파싱하는 shared=False 용도)"""
+        key = (purpose, filename)
+        with self._key_lock(key):
+            return self._get_entry(key) is not None
+
+    def invalidate(self, purpose: str = None, filename: str = None):
+        """purpose/filename에 맞는 항목을 메모리에서 제거 (둘 다 None이면 전체)"""
+        with self._lock:
+            for key in list(self.entries):
+                if (purpose is None or key[0] == purpose) and (filename is None or key[1] == filename):
+                    del self.entries[key]
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+        }
+
+    # ---------- 내부 ----------
+    def _key_lock(self, key):
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _get_entry(self, key):
+        purpose, filename = key
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self._load_disk(key)
+
+        now = time.monotonic()
+        if entry is not None and now - entry.checked_at < self.ttl:
+            self.hits += 1
+            return entry
+
+        buf = io.BytesIO()
+        try:
+            success, result, etag = download_file(
+                purpose, filename, buf, if_none_match=entry.etag if entry is not None else ""
+            )
+        except Exception as e:
+            success, result, etag = False, str(e), ""
+
+        if not success:
+            print(f"[서버 오류] {result}")
+            if entry is not None:
+                # 서버 확인 실패 → 가지고 있는 내용으로 계속 진행
+                if is_debug:
+                    print(f"[디버그] 참조 데이터 재확인 실패, 캐시 사용: {purpose}/{filename}")
+                self.entries[key] = entry
+                return entry
+            return None
+
+        if result == NOT_MODIFIED:
+            self.revalidated += 1
+            entry.checked_at = now
+        else:
+            self.misses += 1
+            entry = _Entry(buf.getvalue(), etag, now)
+            self._save_disk(key, entry)
+
+        self.entries[key] = entry
+        return entry
+
+    def _disk_path(self, key):
+        purpose, filename = key
+        return os.path.join(self.disk_dir, purpose or "generic", filename.replace("/", "__"))
+
+    def _load_disk(self, key):
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path + ".etag", "r", encoding="utf-8") as f:
+                etag = f.read().strip()
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        if not etag:
+            return None
+        # 디스크 사본은 항상 서버 재확인을 거치도록 checked_at을 과거로 둠
+        return _Entry(content, etag, float("-inf"))
+
+    def _save_disk(self, key, entry: _Entry):
+        if not self.disk_dir or not entry.etag:
+            return
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # etag를 먼저 지워 두어 중간에 실패해도 내용과 etag가 어긋난 사본이 남지 않게 함
+            if os.path.exists(path + ".etag"):
+                os.remove(path + ".etag")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(entry.content)
+            os.replace(tmp_path, path)
+            with open(path + ".etag", "w", encoding="utf-8") as f:
+                f.write(entry.etag)
+        except OSError as e:
+            if is_debug:
+                print(f"[디버그] 참조 데이터 디스크 캐시 저장 실패: {e}")
+
+
+_cache = RefDataCache(ttl=REF_CACHE_TTL, disk_dir=REF_CACHE_DIR)
+
+_prefetch_pool = None
+_prefetch_lock = threading.Lock()
+
+
+def get_ref_cache() -> RefDataCache:
+    return _cache
+
+
+def load_cached(filename: str, filetype: str = "json", purpose: str = "generic", shared: bool = True):
+    """load_from_server의 캐시 버전 (참조 데이터 전용)"""
+    if is_debug:
+        print("load(cache) = ", filename)
+        print("purpose = ", purpose)
+    return _cache.load(filename, filetype, purpose, shared=shared)
+
+
+def submit_prefetch(fn, *args, **kwargs):
+    """참조 데이터 로드 함수를 백그라운드 스레드에서 시작하고 Future를 반환"""
+    global _prefetch_pool
+    with _prefetch_lock:
+        if _prefetch_pool is None:
+            _prefetch_pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="ref-prefetch")
+    return _prefetch_pool.submit(fn, *args, **kwargs)
+
+
+def prefetch(filename: str, filetype: str = "json", purpose: str = "generic", parse: bool = True):
+    """
+    파일을 캐시에 미리 받아 둠 (parse=True면 공유 파싱 결과까지 준비)
+    이후 load_cached()는 진행 중인 prefetch가 끝나기를 기다렸다가 캐시에서 반환
+    """
+    if parse:
+        return submit_prefetch(_cache.load, filename, filetype, purpose)
+    return submit_prefetch(_cache.warm, filename, purpose)
@@ -1,18 +1,174 @@
+import io
 import os
 import base64
 import json
+import tempfile
 import xml.etree.ElementTree as ET
 from datetime import datetime
 
 from cli.settings import grpc_stub
+from cli.common.util.lazy_import import lazy_import
 from proto import message_pb2
-from cli.settings import is_debug
+from cli.settings import is_debug, TRANSFER_COMPRESS
+from cli.common.util.transfer_utils import ChunkReceiver, iter_file_chunks, DEFAULT_CHUNK_SIZE
+
+# grpc는 첫 RPC 호출 시점에 로드 (채널 생성과 함께)
+grpc = lazy_import("grpc")
+
+# 서버가 지원하지 않는 RPC 이름 (구버전 서버면 첫 호출에서 추가되고 이후 기존 경로 사용)
+_unsupported_rpcs = set()
+
+# 이미 압축된 형식은 gzip 전송하지 않음
+_COMPRESSED_EXTENSIONS = (".xlsx", ".xls", ".zip", ".gz", ".tgz")
+
+# 다운로드 내용이 이 크기를 넘으면 메모리 대신 임시 파일에 보관
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# download_file: if_none_match와 서버 etag가 같아 내용을 받지 않은 경우
+NOT_MODIFIED = "not-modified"
+
+
+def _is_unimplemented(e: "grpc.RpcError", rpc_name: str) -> bool:
+    if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+        return False
+    _unsupported_rpcs.add(rpc_name)
+    if is_debug:
+        print(f"[디버그] 서버가 {rpc_name} RPC를 지원하지 않음 → 기존 경로 사용")
+    return True
+
+
+def _call_typed(rpc_name: str, request, fallback):
+    """
+    전용 RPC(rpc_name)를 호출하고, 서버가 지원하지 않으면(UNIMPLEMENTED)
+    fallback()으로 기존 SendCommand 경로를 사용합니다.
+    """
+    if rpc_name not in _unsupported_rpcs:
+        try:
+            return getattr(grpc_stub, rpc_name)(request)
+        except grpc.RpcError as e:
+            if not _is_unimplemented(e, rpc_name):
+                raise
+    return fallback()
+
+
+def _should_compress(filename: str, compress=None) -> bool:
+    if compress is not None:
+        return compress
+    return TRANSFER_COMPRESS and not filename.lower().endswith(_COMPRESSED_EXTENSIONS)
+
+
+def download_file(purpose: str, filename: str, fp, compress=None, if_none_match: str = ""):
+    """
+    DownloadFile RPC로 파일을 chunk 단위로 받아 파일 객체(fp, 바이너리 쓰기)에 기록합니다.
+    if_none_match(etag)가 서버 파일과 같으면 아무것도 기록하지 않고 NOT_MODIFIED를 반환
+    반환: (성공 여부, 오류 메시지 / 수신 크기 문자열 / NOT_MODIFIED, 서버 etag)
+    """
+    if "DownloadFile" not in _unsupported_rpcs:
+        request = message_pb2.DownloadFileRequest(
+            purpose=purpose, filename=filename,
+            compress=_should_compress(filename, compress),
+            chunk_size=DEFAULT_CHUNK_SIZE,
+            if_none_match=if_none_match,
+        )
+        receiver = ChunkReceiver()
+        try:
+            for chunk in grpc_stub.DownloadFile(request):
+                receiver.feed(chunk, fp)
+        except grpc.RpcError as e:
+            # 아무것도 받기 전에 UNIMPLEMENTED면 기존 GetFile 경로로 재시도
+            if receiver.size or not _is_unimplemented(e, "DownloadFile"):
+                raise
+        else:
+            error = receiver.verify()
+            if error:
+                return False, error, ""
+            if receiver.not_modified:
+                return True, NOT_MODIFIED, receiver.etag
+            return True, f"{receiver.size} bytes", receiver.etag
+
+    # 구버전 서버: etag 없이 전체 내용을 받음
+    success, result, content = fetch_file(purpose, filename)
+    if not success:
+        return False, result, ""
+    fp.write(content)
+    return True, f"{len(content)} bytes", ""
+
+
+def upload_file(purpose: str, filename: str, fp, compress=None):
+    """
+    UploadFile RPC로 파일 객체(fp, 바이너리 읽기)의 내용을 chunk 단위로 전송하고 Response를 반환
+    """
+    if "UploadFile" not in _unsupported_rpcs:
+        chunks = iter_file_chunks(fp.read, purpose, filename,
+                                  compress=_should_compress(filename, compress))
+        try:
+            return grpc_stub.UploadFile(chunks)
+        except grpc.RpcError as e:
+            if not _is_unimplemented(e, "UploadFile"):
+                raise
+            fp.seek(0)
+
+    return send_file(purpose, filename, fp.read())
+
+
+def send_file(purpose: str, filename: str, content: bytes):
+    """SaveFile RPC로 파일 내용(bytes)을 전송하고 Response를 반환"""
+    def legacy():
+        encoded = base64.b64encode(content).decode("utf-8")
+        payload = f"{purpose}||{filename}||{encoded}"
+        return grpc_stub.SendCommand(message_pb2.Request(command="saveFile", payload=payload))
+
+    request = message_pb2.SaveFileRequest(purpose=purpose, filename=filename, content=content)
+    return _call_typed("SaveFile", request, legacy)
+
+
+def fetch_file(purpose: str, filename: str):
+    """
+    GetFile RPC로 파일을 받아옵니다.
+    반환: (성공 여부, 오류 메시지 또는 서버 경로, 내용 bytes)
+    """
+    def legacy():
+        request = message_pb2.Request(command="getFile", payload=f"{purpose}::{filename}")
+        response = grpc_stub.SendCommand(request)
+        if not response.success:
+            return message_pb2.FileResponse(success=False, result=response.result)
+        content = base64.b64decode(response.result.encode("utf-8"))
+        return message_pb2.FileResponse(success=True, content=content)
+
+    request = message_pb2.GetFileRequest(purpose=purpose, filename=filename)
+    response = _call_typed("GetFile", request, legacy)
+    return response.success, response.result, response.content
+
+
+def send_commit(command_type: str, filename: str, message: str, translate_mode: str, content: bytes):
+    """
+    Commit RPC로 commit 결과(XML 또는 CLI 스크립트)를 전송하고 Response를 반환
+    command_type이 "commit-cli"이면 서버는 CLI 스크립트로 저장
+    """
+    def legacy():
+        encoded = base64.b64encode(content).decode("utf-8")
+        if command_type == "commit-cli":
+            return grpc_stub.SendCommand(message_pb2.Request(
+                command="commit-cli", payload=f"commit-cli||{filename}||{encoded}"))
+        translate_flag = "1" if translate_mode else "0"
+        payload = f"{command_type}||{filename}||{message}||{translate_flag}||{translate_mode}||{encoded}"
+        return grpc_stub.SendCommand(message_pb2.Request(command="commit", payload=payload))
+
+    request = message_pb2.CommitRequest(
+        command_type=command_type,
+        filename=filename,
+        message=message or "",
+        translate_mode=translate_mode or "",
+        content=content,
+    )
+    return _call_typed("Commit", request, legacy)
+
 
 def save_to_server(self, output_path=None, content=None, filename=None, purpose=""):
     """
     서버에 파일 또는 문자열 데이터를 저장합니다.
-    - command는 항상 'saveFile'로 고정
-    - payload는 "purpose||filename||base64(content)" 형태
+    - UploadFile RPC로 chunk 단위 전송 (구버전 서버는 SaveFile / 'saveFile' 명령으로 전송)
+    - output_path가 주어지면 파일 전체를 메모리에 올리지 않고 바로 스트리밍
     """
     try:
         if output_path:
@@ -20,24 +176,21 @@ def save_to_server(self, output_path=None, content=None, filename=None, purpose=
                 self.perror(f"[오류] 저장할 파일이 존재하지 않습니다: {output_path}")
                 return
             filename = filename or os.path.basename(output_path)
-            with open(output_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            with open(output_path, "rb") as f:
+                response = upload_file(purpose, filename, f)
         elif content and filename:
-            pass
+            response = upload_file(purpose, filename, io.BytesIO(content.encode("utf-8")))
         else:
             self.perror("[오류] 저장할 파일(output_path) 또는 content+filename 조합이 필요합니다.")
             return
 
-        encoded = base64.b64encode(content.encode("utf-8")).decode("utf-8")
-        payload = f"{purpose}||{filename}||{encoded}"
-
         # if is_debug:
         #     print(f"[디버그] 서버 전송 준비 완료: purpose={purpose}, filename={filename}")
 
-        request = message_pb2.Request(command="saveFile", payload=payload)
-        response = grpc_stub.SendCommand(request)
-
         if response.success:
+            # 같은 파일을 참조 데이터 캐시에 들고 있으면 다음 조회 때 다시 받도록 제거
+            from cli.common.util.ref_cache import get_ref_cache
+            get_ref_cache().invalidate(purpose, filename)
             if is_debug:
                 self.poutput(f"[서버 저장 완료] ({purpose}) {filename} → {response.result}")
         else:
@@ -48,9 +201,24 @@ def save_to_server(self, output_path=None, content=None, filename=None, purpose=
 
 
 
+def parse_content(fp, filetype: str):
+    """바이너리 파일 객체(fp)의 내용을 filetype(json, xml, text, binary)에 맞게 파싱"""
+    if filetype == "json":
+        return json.load(fp)
+    elif filetype == "xml":
+        return ET.parse(fp)
+    elif filetype == "text":
+        return fp.read().decode("utf-8")
+    elif filetype == "binary":
+        return fp.read()
+    else:
+        print(f"[클라 경고] 지원하지 않는 파일 형식: {filetype}")
+        return None
+
+
 def load_from_server(filename: str, filetype: str = "json", purpose: str = "generic"):
     """
-    서버에서 특정 목적(purpose)에 따라 파일을 읽어 base64 decode 후 파싱합니다.
+    서버에서 특정 목적(purpose)에 따라 파일을 읽어 파싱합니다.
     filetype: json, xml, text, binary
     purpose: prodmap, template, cli, log 등 (서버가 해석)
     """
@@ -58,27 +226,15 @@ def load_from_server(filename: str, filetype: str = "json", purpose: str = "gene
         if is_debug:
             print("load = ", filename)
             print("purpose = ", purpose)
-        payload = f"{purpose}::{filename}"
-        request = message_pb2.Request(command="getFile", payload=payload)
-        response = grpc_stub.SendCommand(request)
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as buf:
+            success, result, _ = download_file(purpose, filename, buf)
 
-        if not response.success:
-            print(f"[서버 오류] {response.result}")
-            return None
-
-        decoded = base64.b64decode(response.result.encode("utf-8"))
-
-        if filetype == "json":
-            return json.loads(decoded.decode("utf-8"))
-        elif filetype == "xml":
-            return ET.ElementTree(ET.fromstring(decoded.decode("utf-8")))
-        elif filetype == "text":
-            return decoded.decode("utf-8")
-        elif filetype == "binary":
-            return decoded
-        else:
-            print(f"[클라 경고] 지원하지 않는 파일 형식: {filetype}")
-            return None
+            if not success:
+                print(f"[서버 오류] {result}")
+                return None
+
+            buf.seek(0)
+            return parse_content(buf, filetype)
     except Exception as e:
         print(f"[클라 오류] load_from_server 실패: {e}")
         return None
@@ -0,0 +1,42 @@
+import grpc
+
+# 모든 RPC 호출에 클라이언트 세션 ID를 gRPC metadata로 추가
+# - 서버는 이 값으로 클라이언트별 workspace(dest-bts로 지정한 BTS 등)를 구분
+# - 키는 서버 ws_manager.SESSION_METADATA_KEY와 같아야 함
+
+SESSION_METADATA_KEY = "x-nocli-session"
+
+
+class _CallDetails(grpc.ClientCallDetails):
+    def __init__(self, details, metadata):
+        self.method = details.method
+        self.timeout = details.timeout
+        self.metadata = metadata
+        self.credentials = details.credentials
+        self.wait_for_ready = getattr(details, "wait_for_ready", None)
+        self.compression = getattr(details, "compression", None)
+
+
+class SessionInterceptor(grpc.UnaryUnaryClientInterceptor,
+                         grpc.UnaryStreamClientInterceptor,
+                         grpc.StreamUnaryClientInterceptor,
+                         grpc.StreamStreamClientInterceptor):
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+
+    def _with_session(self, details):
+        metadata = list(details.metadata or [])
+        metadata.append((SESSION_METADATA_KEY, self.session_id))
+        return _CallDetails(details, metadata)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return continuation(self._with_session(client_call_details), request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return continuation(self._with_session(client_call_details), request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return continuation(self._with_session(client_call_details), request_iterator)
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        return continuation(self._with_session(client_call_details), request_iterator)
@@ -1,7 +1,7 @@
 import os
 from copy import deepcopy
 from cli.settings import is_debug
-from cli.common.util.server_utils import load_from_server
+from cli.common.util.ref_cache import load_cached
 
 def apply_class_based_mapping(cli_text, xml_tree):
     """
@@ -110,7 +110,7 @@ def load_cablink_blocks(file_path, cablink_ids):
     filename_only = os.path.basename(file_path)
 
     try:
-        cli_text = load_from_server(filename_only, filetype="text", purpose="cablink")
+        cli_text = load_cached(filename_only, filetype="text", purpose="cablink")
     except Exception as e:
         raise ValueError(f"[오류] CABLINK 템플릿 로드 실패: {e}")
 
@@ -136,13 +136,13 @@ def load_prod_code_maps():
     rmod_dict = {}
 
     try:
-        prod_data = load_from_server("PRODMAPTBL.json", filetype="json", purpose="prodmap")
+        prod_data = load_cached("PRODMAPTBL.json", filetype="json", purpose="prodmap")
         prod_dict = prod_data.get("PRODMAPTBL", {}).get("value", {})
     except Exception:
         pass
 
     try:
-        rmod_data = load_from_server("RMODPRODMAPTBL.json", filetype="json", purpose="prodmap")
+        rmod_data = load_cached("RMODPRODMAPTBL.json", filetype="json", purpose="prodmap")
         rmod_dict = rmod_data.get("RMODPRODMAPTBL", {}).get("value", {})
     except Exception:
         pass
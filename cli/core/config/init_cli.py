@@ -11,8 +11,10 @@ from cli.common.mixins.show_commands import ShowCommandMixin
 from cli.common.mixins.tool_commands import ToolCommandMixin
 from cli.common.mixins.tree_commands import TreeCommandMixin
 from cli.common.mixins.autocomm_commands import AutocommCommandMixin
-from cli.common.util.commit_utils import load_param_dict
+from cli.common.util.commit_utils import load_param_dict, ru_dict_filename, mo_param_dict_filename
+from cli.common.util.mo_index import MoIndex
 from cli.common.util.server_utils import load_from_server
+from cli.common.util.ref_cache import load_cached, prefetch, submit_prefetch
 from cli.settings import is_debug
 from dotenv import load_dotenv
 
@@ -49,6 +51,7 @@ class InitCLI(
         self.mo_class = None
         self.bts_id = None
         self.xml_tree = self._create_empty_xml()
+        self.mo_index = MoIndex(self.xml_tree, track_changes=True)
         self.ref_tree = self._create_empty_xml()
         self.cli_template_tree = self._create_empty_xml()
         self.prompt_stack = ["config"]
@@ -57,47 +60,83 @@ class InitCLI(
         self.user_inputs = []
         self.last_commit_file = None
 
-        self.param_dict = load_param_dict(self, self.rat_type, self.mo_version)
+        # 세션 참조 데이터는 백그라운드에서 미리 받음 (param_dict는 처음 사용할 때 결과를 기다림)
+        self._param_dict_future = submit_prefetch(load_param_dict, self, self.rat_type, self.mo_version)
+        self._prefetch_session_data()
         self.mo_param_dict = None
+        self.mo_schema = None
         self.rulebook_param_dict = None
 
         self.exec_script_errors = []
 
+    @property
+    def param_dict(self):
+        future = self.__dict__.pop("_param_dict_future", None)
+        if future is not None:
+            self.__dict__["_param_dict"] = future.result()
+        return self.__dict__.get("_param_dict")
+
+    @param_dict.setter
+    def param_dict(self, value):
+        self.__dict__.pop("_param_dict_future", None)
+        self.__dict__["_param_dict"] = value
+
+    def _prefetch_session_data(self):
+        """
+        (rat, version, du_type, mode)로 정해지는 참조 파일을 백그라운드에서 동시에 받아 둠
+        - du_type 설정 전: RU dict, PRODMAP 테이블
+        - du_type 설정 후: rulebook, mo_param_dict
+        실제 로드 함수(load_cached)는 해당 파일의 prefetch만 기다림
+        """
+        try:
+            ru_filename = ru_dict_filename(self.rat_type or "")
+            if ru_filename:
+                prefetch(ru_filename, "json", purpose="dict")
+            prefetch("PRODMAPTBL.json", "json", purpose="prodmap")
+            prefetch("RMODPRODMAPTBL.json", "json", purpose="prodmap")
+
+            if self.du_type:
+                rulebook_filename = self._rulebook_filename()
+                if rulebook_filename:
+                    prefetch(rulebook_filename, "json", purpose="rulebook", parse=False)
+                prefetch(mo_param_dict_filename(self.mo_version, self.du_type), "json", purpose="dict")
+        except Exception as e:
+            if is_debug:
+                print(f"[디버그] 참조 데이터 prefetch 시작 실패: {e}")
+
+    def _rulebook_filename(self):
+        """현재 mode/du_type/rat_type에 해당하는 rulebook 파일명 (지원되지 않는 조합이면 None)"""
+        du_type = (self.du_type or "").upper()
+        rat_type = (self.rat_type or "").upper()
+        if self.mode == "cell" and du_type == "DU10" and rat_type == "5G":
+            return f"{self.rat_type}_{self.mo_version}_rulebook_du10_cell.json"
+        elif self.mode == "bts" and du_type == "DU10" and rat_type == "5G":
+            return f"{self.rat_type}_{self.mo_version}_rulebook_du10_bts.json"
+        elif self.mode == "cell" and du_type == "DU20":
+            return f"{self.rat_type}_{self.mo_version}_rulebook_du20_cell.json"
+        elif self.mode == "bts" and du_type == "DU10":
+            return f"{self.rat_type}_{self.mo_version}_rulebook_du20_bts.json"
+        elif self.mode == "cell" and du_type == "FSMF" and rat_type == "4G":
+            return f"{self.rat_type}_{self.mo_version}_rulebook_FSMF_cell.json"
+        elif self.mode == "bts" and du_type == "FSMF" and rat_type == "4G":
+            return f"{self.rat_type}_{self.mo_version}_rulebook_FSMF_bts.json"
+        return None
+
     def _load_rulebook(self):
         print("rat_type =", self.rat_type)
         print("mo_version =", self.mo_version)
         print("mode =", self.mode)
         print("du_type =", self.du_type)
 
-        if self.mode == "cell" and self.du_type.upper() == "DU10" and self.rat_type.upper() == "5G":
-            if is_debug:
-                print(f"{self.rat_type}_{self.mo_version}_du10_cell 세팅")
-            filename = f"{self.rat_type}_{self.mo_version}_rulebook_du10_cell.json"
-        elif self.mode == "bts" and self.du_type.upper() == "DU10" and self.rat_type.upper() == "5G":
-            if is_debug:
-                print(f"{self.rat_type}_{self.mo_version}_du10_bts 세팅")
-            filename = f"{self.rat_type}_{self.mo_version}_rulebook_du10_bts.json"
-        elif self.mode == "cell" and self.du_type.upper() == "DU20":
-            if is_debug:
-                print(f"{self.rat_type}_{self.mo_version}_du20_cell 세팅")
-            filename = f"{self.rat_type}_{self.mo_version}_rulebook_du20_cell.json"
-        elif self.mode == "bts" and self.du_type.upper() == "DU10":
-            if is_debug:
-                print(f"{self.rat_type}_{self.mo_version}_du20_bts 세팅")
-            filename = f"{self.rat_type}_{self.mo_version}_rulebook_du20_bts.json"
-        elif self.mode == "cell" and self.du_type.upper() == "FSMF" and self.rat_type.upper() == "4G":
-            if is_debug:
-                print(f"{self.rat_type}_{self.mo_version}_FSMF_cell 세팅")
-            filename = f"{self.rat_type}_{self.mo_version}_rulebook_FSMF_cell.json"
-        elif self.mode == "bts" and self.du_type.upper() == "FSMF" and self.rat_type.upper() == "4G":
-            if is_debug:
-                print(f"{self.rat_type}_{self.mo_version}_FSMF_bts 세팅")
-            filename = f"{self.rat_type}_{self.mo_version}_rulebook_FSMF_bts.json"
-        else:
+        filename = self._rulebook_filename()
+        if filename is None:
             raise ValueError(f"지원되지 않는 mode/du_type 조합: {self.mode}/{self.du_type}")
+        if is_debug:
+            print(f"rulebook 세팅: {filename}")
 
         try:
-            rulebook_dict = load_from_server(filename, filetype="json", purpose="rulebook")
+            # rulebook은 템플릿 적용 시 수정되므로 공유 객체가 아닌 사본으로 받음
+            rulebook_dict = load_cached(filename, filetype="json", purpose="rulebook", shared=False)
             return rulebook_dict
         except Exception as e:
             print(f"[오류] rulebook 로드 실패: {e}")
@@ -167,6 +206,7 @@ class InitCLI(
             return
 
         self.xml_tree = self._create_empty_xml()
+        self._reset_mo_index()
         self.bts_id = None
         self.mo_class = None
         self.match_tail = None
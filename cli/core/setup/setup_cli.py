@@ -27,6 +27,11 @@ class SetupCLI(BaseCLI, SetupCommandMixin):
             "update_sw_ver",
             "check_soam",
             "check_ssh",
+            "sweep",
+            "server_stats",
+            "job_list",
+            "job_watch",
+            "job_cancel",
             "exit",
         }
         return [
@@ -44,6 +49,11 @@ class SetupCLI(BaseCLI, SetupCommandMixin):
             "do_update_sw_ver",
             "do_check_soam",
             "do_check_ssh",
+            "do_sweep",
+            "do_server_stats",
+            "do_job_list",
+            "do_job_watch",
+            "do_job_cancel",
             "do_exit",
         }
         return [n for n in super().get_names() if n in allowed_prefixes]
@@ -1,9 +1,11 @@
+from cli import startup_profile
+startup_profile.start()
+
 from cli.settings import is_debug
 
 from cli.common.base_cli import BaseCLI
-from cli.core.config.config_cli import ConfigCLI
-from cli.core.config_x.config_x_cli import ConfigXCLI
-from cli.core.setup.setup_cli import SetupCLI
+
+# 각 모드(config/config-x/setup)는 mixin/openpyxl 등 무거운 모듈을 포함하므로 진입 시점에 import
 
 class NoCli(BaseCLI):
     def __init__(self):
@@ -15,15 +17,19 @@ class NoCli(BaseCLI):
         if is_debug:
             self.poutput("Entering config mode...")
 
+        from cli.core.config.config_cli import ConfigCLI
+
         cli = ConfigCLI()
         cli.prompt = "config > "
         cli.cmdloop()
-    
+
     def do_config_x(self, args):
         """Enter config mode."""
         if is_debug:
             self.poutput("Entering config mode...")
 
+        from cli.core.config_x.config_x_cli import ConfigXCLI
+
         cli = ConfigXCLI()
         cli.prompt = "config-x > "
         cli.cmdloop()
@@ -33,6 +39,8 @@ class NoCli(BaseCLI):
         if is_debug:
             self.poutput("Entering setup mode...")
 
+        from cli.core.setup.setup_cli import SetupCLI
+
         cli = SetupCLI()
         cli.prompt = "setup > "
         cli.cmdloop()
@@ -52,4 +60,5 @@ class NoCli(BaseCLI):
 
 if __name__ == "__main__":
     app = NoCli()
+    startup_profile.report()
     app.cmdloop()
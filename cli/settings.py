@@ -2,12 +2,13 @@ from dotenv import load_dotenv
 import os
 import sys
 import argparse
-import grpc
-from proto import message_pb2_grpc
+import threading
+import uuid
 
 # ─── .env 파일 선택 ──────────────────────────
 parser = argparse.ArgumentParser()
 parser.add_argument("--env", type=str, help="불러올 환경설정 파일 경로")
+parser.add_argument("--startup-profile", action="store_true", help="시작 시 import 시간 분석 결과 출력")
 args, unknown = parser.parse_known_args()
 
 # exe 이름 확인 (PyInstaller 빌드 후 실행 파일 이름 기반)
@@ -35,6 +36,8 @@ else:
 env_file = os.path.join(ENV_DIR, env_file)
 load_dotenv(dotenv_path=env_file)
 
+STARTUP_PROFILE = args.startup_profile
+
 # cmd2 등에서 argv 충돌 방지
 sys.argv = [sys.argv[0]] + unknown
 
@@ -48,6 +51,16 @@ IS_PROD = ENV_TYPE == "PROD"
 is_debug = str2bool(os.getenv("IS_DEBUG", "False"))
 IS_LOCAL = str2bool(os.getenv("IS_LOCAL", "False"))
 USE_TLS = str2bool(os.getenv("USE_TLS", "True"))
+TRANSLATE_BATCH = str2bool(os.getenv("TRANSLATE_BATCH", "True"))
+TRANSLATE_VERIFY = str2bool(os.getenv("TRANSLATE_VERIFY", "False"))
+TRANSFER_COMPRESS = str2bool(os.getenv("TRANSFER_COMPRESS", "True"))
+HISTORY_BATCH_SIZE = int(os.getenv("HISTORY_BATCH_SIZE", "200"))
+HISTORY_FLUSH_INTERVAL = float(os.getenv("HISTORY_FLUSH_INTERVAL", "2.0"))
+REF_CACHE_TTL = float(os.getenv("REF_CACHE_TTL", "60"))
+REF_CACHE_DIR = os.getenv("REF_CACHE_DIR", "")
+
+# 서버가 클라이언트별 workspace를 구분하는 세션 ID (실행마다 새로 생성, 모든 RPC metadata에 포함)
+SESSION_ID = os.getenv("NOCLI_SESSION_ID") or uuid.uuid4().hex
 
 # ─── 주소/포트 설정 ──────────────────────────
 host = os.getenv("GRPC_HOST", "localhost")
@@ -62,14 +75,47 @@ cert_rel_path = get_env_path("CERT_PATH", "PROD_CERT_PATH")
 CERT_PATH = os.path.join(BASE_DIR, cert_rel_path)
 
 # ─── gRPC 채널 생성 ──────────────────────────
-if USE_TLS:
-    if not os.path.exists(CERT_PATH):
-        raise FileNotFoundError(f"[클라] 인증서 파일 없음: {CERT_PATH}")
-    with open(CERT_PATH, "rb") as f:
-        trusted_certs = f.read()
-    credentials = grpc.ssl_channel_credentials(root_certificates=trusted_certs)
-    channel = grpc.secure_channel(GRPC_TARGET, credentials)
-else:
-    channel = grpc.insecure_channel(GRPC_TARGET)
+# 시작 시간 단축을 위해 채널/stub은 첫 RPC 호출 시점에 생성 (grpc 모듈 로드, 인증서 읽기 포함)
+# 기존처럼 `from cli.settings import grpc_stub`로 가져다 쓰면 됨
+def _create_channel():
+    import grpc
+    from cli.common.util.session_interceptor import SessionInterceptor
+
+    if USE_TLS:
+        if not os.path.exists(CERT_PATH):
+            raise FileNotFoundError(f"[클라] 인증서 파일 없음: {CERT_PATH}")
+        with open(CERT_PATH, "rb") as f:
+            trusted_certs = f.read()
+        credentials = grpc.ssl_channel_credentials(root_certificates=trusted_certs)
+        channel = grpc.secure_channel(GRPC_TARGET, credentials)
+    else:
+        channel = grpc.insecure_channel(GRPC_TARGET)
+    return grpc.intercept_channel(channel, SessionInterceptor(SESSION_ID))
+
+
+class _LazyStub:
+    def __init__(self):
+        self._channel = None
+        self._stub = None
+        self._lock = threading.Lock()
+
+    def _get(self):
+        if self._stub is None:
+            with self._lock:
+                if self._stub is None:
+                    from proto import message_pb2_grpc
+
+                    self._channel = _create_channel()
+                    self._stub = message_pb2_grpc.CommandServiceStub(self._channel)
+        return self._stub
+
+    @property
+    def channel(self):
+        self._get()
+        return self._channel
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
 
-grpc_stub = message_pb2_grpc.CommandServiceStub(channel)
+grpc_stub = _LazyStub()
@@ -0,0 +1,74 @@
+import builtins
+import sys
+import time
+
+# --startup-profile: 시작 시 import 시간 분석
+# - main.py에서 가장 먼저 import하여 이후 모든 import를 측정 (python -X importtime과 유사, exe에서도 동작)
+# - 모듈별 self 시간(하위 import 제외)과 최상위 패키지별 합계, 첫 프롬프트까지 걸린 시간을 출력
+
+_T0 = time.perf_counter()
+ENABLED = "--startup-profile" in sys.argv
+
+_original_import = builtins.__import__
+_self_times = {}   # 모듈 이름 → 하위 import를 제외한 로드 시간
+_stack = []        # 진행 중인 import별 하위 import 누적 시간
+
+
+def _profiled_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level == 0 and name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    if level > 0 and globals:
+        package = globals.get("__package__") or ""
+        if level > 1:
+            package = package.rsplit(".", level - 1)[0]
+        fullname = f"{package}.{name}" if name else package
+    else:
+        fullname = name
+    already = fullname in sys.modules
+
+    _stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = time.perf_counter() - start
+        children = _stack.pop()
+        if _stack:
+            _stack[-1] += elapsed
+        if not already:
+            _self_times[fullname] = _self_times.get(fullname, 0.0) + elapsed - children
+
+
+def start():
+    if ENABLED and builtins.__import__ is not _profiled_import:
+        builtins.__import__ = _profiled_import
+
+
+def report(top: int = 20):
+    """import 시간 분석 결과를 출력하고 측정을 종료"""
+    if not ENABLED:
+        return
+    builtins.__import__ = _original_import
+
+    elapsed = time.perf_counter() - _T0
+    total = sum(_self_times.values())
+
+    by_package = {}
+    for name, t in _self_times.items():
+        root = name.split(".")[0]
+        by_package[root] = by_package.get(root, 0.0) + t
+
+    out = sys.stderr
+    print("\n[startup-profile] import 시간 분석", file=out)
+    print(f"  첫 프롬프트까지: {elapsed * 1000:8.1f} ms", file=out)
+    print(f"  import 합계    : {total * 1000:8.1f} ms ({len(_self_times)}개 모듈)", file=out)
+
+    print("\n  [패키지별]", file=out)
+    for root, t in sorted(by_package.items(), key=lambda x: x[1], reverse=True)[:top]:
+        print(f"  {t * 1000:8.1f} ms  {root}", file=out)
+
+    print(f"\n  [모듈별 상위 {top}개 (하위 import 제외)]", file=out)
+    for name, t in sorted(_self_times.items(), key=lambda x: x[1], reverse=True)[:top]:
+        print(f"  {t * 1000:8.1f} ms  {name}", file=out)
+    print(file=out)
@@ -4,14 +4,20 @@ import os
 import xml.etree.ElementTree as ET
 import json
 import re
+import shutil
+import tempfile
 from io import BytesIO
 from xml.etree.ElementTree import ElementTree
 from datetime import datetime
 from proto import message_pb2
 from cli_server.core.workspace.ws_manager import WsManager, getWorkspace
 from cli_server.common.utils.xml_utils import remove_empty_lines_from_str
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from cli_server.common.utils.transfer_utils import ChunkReceiver, iter_file_chunks, DEFAULT_CHUNK_SIZE
+from cli_server.common.utils.file_cache import FileCache
+from cli_server.settings import FILE_CACHE_MAX_BYTES
 from cli_server.ext.admincli_interface import AdminCliInterface
+from cli_server.common.fleet_runner import run_per_bts, prefetch_bts_ips
+from cli_server.common.utils.bts_ip_cache import is_valid_ip
 from cli_server.core.workspace.workspace import WorkSpace
 
 class ExecutionHelper(cmd2.Cmd):
@@ -28,17 +34,53 @@ class ExecutionHelper(cmd2.Cmd):
 
         self.admincli = AdminCliInterface()
 
+        # 자주 요청되는 파일(rulebook, PRODMAPTBL, dict, ref XML 등) 내용 캐시
+        self.file_cache = FileCache(FILE_CACHE_MAX_BYTES)
+
+    @staticmethod
+    def _read_text(path: str) -> str:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    @staticmethod
+    def _read_content(path: str) -> bytes:
+        # 엑셀 파일은 바이너리로 읽고, 나머지는 utf-8 텍스트로 읽어 바이트로 변환
+        if path.endswith(".xlsx"):
+            with open(path, "rb") as f:
+                return f.read()
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().encode("utf-8")
+
 
     def handle_commit(self, arg):
+        """
+        (호환용) SendCommand("commit") 처리
+        payload: command_type||filename||message||translate_flag||translate_mode||xml_base64
+        """
         try:
-            # payload: command_type||filename||message||translate_flag||translate_mode||xml_base64
             command_type, orig_filename, message, translate_flag, translate_mode, xml_base64 = arg.split("||", 5)
+            xml_data = base64.b64decode(xml_base64.encode("utf-8")).decode("utf-8")
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"[서버 오류] {str(e)}")
+        return self.commit_xml(command_type, orig_filename, message, translate_mode, xml_data)
+
+    def handle_commit_request(self, request) -> message_pb2.Response:
+        """Commit RPC 처리 (content는 UTF-8 bytes)"""
+        try:
+            data = request.content.decode("utf-8")
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"[서버 오류] {str(e)}")
 
+        if request.command_type == "commit-cli":
+            return self.commit_cli(request.filename, data)
+        return self.commit_xml(request.command_type, request.filename, request.message,
+                               request.translate_mode, data)
+
+    def commit_xml(self, command_type, orig_filename, message, translate_mode, xml_data: str):
+        try:
             ws = getWorkspace()
             bts_id = ws.get("bts_id")
 
-            # XML 복원
-            xml_data = base64.b64decode(xml_base64.encode("utf-8")).decode("utf-8")
             xml_data = remove_empty_lines_from_str(xml_data)
 
             # 기존 선언부 제거 및 새 선언부 추가
@@ -97,15 +139,21 @@ class ExecutionHelper(cmd2.Cmd):
         
     def handle_commit_cli(self, arg):
         """
-        클라이언트에서 전송한 CLI 텍스트 명령어 스크립트를 저장합니다.
+        (호환용) SendCommand("commit-cli") 처리
         payload: commit-cli||filename||cli_base64
         """
         try:
-            # payload 파싱
             command_type, filename, cli_base64 = arg.split("||", 2)
-
-            # 디코딩
             cli_data = base64.b64decode(cli_base64.encode("utf-8")).decode("utf-8")
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"[서버 오류] {str(e)}")
+        return self.commit_cli(filename, cli_data)
+
+    def commit_cli(self, filename, cli_data: str):
+        """
+        클라이언트에서 전송한 CLI 텍스트 명령어 스크립트를 저장합니다.
+        """
+        try:
             cli_data = cli_data.strip()
 
             # 저장 경로 설정
@@ -150,9 +198,8 @@ class ExecutionHelper(cmd2.Cmd):
             if not os.path.exists(xml_path):
                 return message_pb2.Response(success=False, result=f"{xml_path}에 {filename} 파일이 존재하지 않습니다.")
 
-            # 파일 그대로 읽기
-            with open(xml_path, "r", encoding="utf-8") as f:
-                xml_text = f.read()
+            # 파일 그대로 읽기 (변경이 없으면 캐시에서)
+            xml_text = self.file_cache.get(xml_path, "text", self._read_text)
 
             ws.set('final_file', xml_path)
 
@@ -173,8 +220,7 @@ class ExecutionHelper(cmd2.Cmd):
             return message_pb2.Response(success=False, result="참조 XML 파일이 존재하지 않습니다.")
 
         try:
-            with open(full_path, "r", encoding="utf-8") as f:
-                xml_str = f.read()
+            xml_str = self.file_cache.get(full_path, "text", self._read_text)
             return message_pb2.Response(success=True, result=xml_str)
         except Exception as e:
             return message_pb2.Response(success=False, result=f"[getRefXml] 파일 읽기 오류: {str(e)}")
@@ -251,7 +297,7 @@ class ExecutionHelper(cmd2.Cmd):
 
     def handle_save_file(self, payload: str) -> message_pb2.Response:
         """
-        클라이언트에서 파일 저장 요청 처리
+        (호환용) SendCommand("saveFile") 처리
         payload 형식: purpose||filename||base64_encoded_content
         """
         try:
@@ -261,43 +307,65 @@ class ExecutionHelper(cmd2.Cmd):
 
             purpose, filename, encoded_content = parts
             content = base64.b64decode(encoded_content)
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"[handle_save_file] 예외 발생: {e}")
+        return self.save_file(purpose, filename, content)
 
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-            date_str = datetime.now().strftime("%Y%m%d")
-
-            # 목적별 서브디렉토리 정의
-            purpose_dirs = {
-                "log": "logs",
-                "autocomm": "autocomm",
-                "rulebook": "rulebook",
-                "cli": "scripts",
-                "cfgTmpl": "scripts"
-            }
-
-            # 날짜 하위 디렉토리 여부 설정
-            use_date_dir = {
-                "log": True,
-                "autocomm": True,
-                "rulebook": False,
-                "cli": True,
-                "cfgTmpl": False
-            }
-
-            subdir = purpose_dirs.get(purpose)
-            if not subdir:
-                return message_pb2.Response(success=False, result=f"[handle_save_file] 정의되지 않은 purpose: {purpose}")
+    def handle_save_file_request(self, request) -> message_pb2.Response:
+        """SaveFile RPC 처리"""
+        return self.save_file(request.purpose, request.filename, request.content)
 
-            # 저장 경로 결정
-            if "/" in filename:
-                save_path = os.path.join(base_dir, "..", "data", subdir, filename)
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    def resolve_save_path(self, purpose: str, filename: str):
+        """
+        저장 요청의 purpose/filename으로 서버 저장 경로를 결정합니다. (디렉토리는 생성)
+        반환: 저장 경로 (정의되지 않은 purpose면 None)
+        """
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        date_str = datetime.now().strftime("%Y%m%d")
+
+        # 목적별 서브디렉토리 정의
+        purpose_dirs = {
+            "log": "logs",
+            "autocomm": "autocomm",
+            "rulebook": "rulebook",
+            "cli": "scripts",
+            "cfgTmpl": "scripts"
+        }
+
+        # 날짜 하위 디렉토리 여부 설정
+        use_date_dir = {
+            "log": True,
+            "autocomm": True,
+            "rulebook": False,
+            "cli": True,
+            "cfgTmpl": False
+        }
+
+        subdir = purpose_dirs.get(purpose)
+        if not subdir:
+            return None
+
+        # 저장 경로 결정
+        if "/" in filename:
+            save_path = os.path.join(base_dir, "..", "data", subdir, filename)
+            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        else:
+            if use_date_dir.get(purpose, False):
+                target_dir = os.path.join(base_dir, "..", "data", subdir, date_str)
             else:
-                if use_date_dir.get(purpose, False):
-                    target_dir = os.path.join(base_dir, "..", "data", subdir, date_str)
-                else:
-                    target_dir = os.path.join(base_dir, "..", "data", subdir)
-                os.makedirs(target_dir, exist_ok=True)
-                save_path = os.path.join(target_dir, filename)
+                target_dir = os.path.join(base_dir, "..", "data", subdir)
+            os.makedirs(target_dir, exist_ok=True)
+            save_path = os.path.join(target_dir, filename)
+        return save_path
+
+    def save_file(self, purpose: str, filename: str, content: bytes) -> message_pb2.Response:
+        """
+        클라이언트에서 파일 저장 요청 처리 (content는 원본 bytes)
+        """
+        try:
+            save_path = self.resolve_save_path(purpose, filename)
+            if not save_path:
+                return message_pb2.Response(success=False, result=f"[handle_save_file] 정의되지 않은 purpose: {purpose}")
 
             # 확장자 기반 바이너리 판단
             binary_extensions = (".xlsx", ".xls", ".zip")
@@ -316,61 +384,157 @@ class ExecutionHelper(cmd2.Cmd):
         except Exception as e:
             return message_pb2.Response(success=False, result=f"[handle_save_file] 예외 발생: {e}")
 
+    def handle_upload_file(self, request_iterator) -> message_pb2.Response:
+        """
+        UploadFile RPC 처리 (client-streaming)
+        - chunk를 같은 디렉토리의 임시 파일에 바로 기록하고, 체크섬 확인 후 최종 경로로 교체
+        - log는 기존과 같이 기존 파일 뒤에 이어 붙임
+        """
+        tmp_path = None
+        try:
+            receiver = ChunkReceiver()
+            first = next(request_iterator, None)
+            if first is None:
+                return message_pb2.Response(success=False, result="[handle_upload_file] 빈 요청")
+
+            purpose, filename = first.purpose, first.filename
+            save_path = self.resolve_save_path(purpose, filename)
+            if not save_path:
+                return message_pb2.Response(success=False, result=f"[handle_upload_file] 정의되지 않은 purpose: {purpose}")
+
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(save_path), suffix=".part")
+            with os.fdopen(fd, "wb") as f:
+                receiver.feed(first, f)
+                for chunk in request_iterator:
+                    receiver.feed(chunk, f)
+
+            error = receiver.verify()
+            if error:
+                return message_pb2.Response(success=False, result=f"[handle_upload_file] {filename}: {error}")
+
+            if purpose == "log":
+                with open(tmp_path, "rb") as src, open(save_path, "ab") as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                os.replace(tmp_path, save_path)
+                tmp_path = None
+
+            return message_pb2.Response(
+                success=True,
+                result=f"[handle_upload_file] 저장 완료: {save_path} ({receiver.size} bytes)"
+            )
+
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"[handle_upload_file] 예외 발생: {e}")
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def handle_get_file(self, payload: str) -> message_pb2.Response:
         """
-        'purpose::filename' 형식의 payload를 받아 목적에 따라 파일을 읽음.
+        (호환용) SendCommand("getFile") 처리
+        'purpose::filename' 형식의 payload를 받아 파일 내용을 base64 문자열로 반환
+        """
+        if "::" not in payload:
+            return message_pb2.Response(success=False, result="payload 형식 오류: <purpose>::<filename>")
+
+        purpose, filename = payload.split("::", 1)
+        ok, result, content = self.read_file(purpose, filename)
+        if not ok:
+            return message_pb2.Response(success=False, result=result)
+        # content는 read_file이 "content" 캐시에서 가져온 bytes → 요청마다 인코딩 (base64 문자열은 따로 캐시하지 않음)
+        return message_pb2.Response(success=True, result=base64.b64encode(content).decode("utf-8"))
+
+    def handle_get_file_request(self, request) -> message_pb2.FileResponse:
+        """GetFile RPC 처리 (파일 내용을 bytes 그대로 반환)"""
+        ok, result, content = self.read_file(request.purpose, request.filename)
+        return message_pb2.FileResponse(success=ok, result=result, content=content)
+
+    def resolve_read_path(self, purpose: str, filename: str) -> str:
+        """목적(purpose)에 따라 읽을 파일의 서버 경로를 결정합니다."""
+        base_dir = os.path.dirname(__file__)
+        data_root = os.path.abspath(os.path.join(base_dir, "..", "data"))
+
+        # 목적에 따른 경로 분기
+        if purpose == "prodmap":
+            file_path = os.path.join(data_root, "prodmaptbl", filename)
+        elif purpose == "template":
+            file_path = os.path.join(data_root, "template", filename)
+        elif purpose == "cli":
+            file_path = os.path.join(data_root, "scripts", filename)
+        elif purpose == "log":
+            today = datetime.now().strftime("%Y%m%d")
+            file_path = os.path.join(data_root, "logs", today, filename)
+        elif purpose == "autocomm":
+            today = datetime.now().strftime("%Y%m%d")
+            file_path = os.path.join(data_root, "autocomm", today, filename)
+        elif purpose == "rulebook":
+            file_path = os.path.join(data_root, "rulebook", filename)
+        elif purpose == "ruTemplate":
+            file_path = os.path.join(data_root, "scripts", "ru_templates", filename)
+        elif purpose == "dict":
+            file_path = os.path.join(data_root, "dict", filename)
+        elif purpose == "cablink":
+            file_path = os.path.join(data_root, "cablink", filename)
+        else:
+            file_path = os.path.join(data_root, filename)  # fallback
+        return file_path
+
+    def read_file(self, purpose: str, filename: str):
+        """
+        목적(purpose)에 따라 파일을 읽음.
         엑셀 파일(.xlsx)은 바이너리로 처리하고, 나머지는 utf-8 텍스트 파일로 처리.
+        반환: (성공 여부, 파일 경로 또는 오류 메시지, 내용 bytes)
         """
         try:
-            if "::" not in payload:
-                return message_pb2.Response(success=False, result="payload 형식 오류: <purpose>::<filename>")
-
-            purpose, filename = payload.split("::", 1)
-            base_dir = os.path.dirname(__file__)
-            data_root = os.path.abspath(os.path.join(base_dir, "..", "data"))
-
-            # 목적에 따른 경로 분기
-            if purpose == "prodmap":
-                file_path = os.path.join(data_root, "prodmaptbl", filename)
-            elif purpose == "template":
-                file_path = os.path.join(data_root, "template", filename)
-            elif purpose == "cli":
-                file_path = os.path.join(data_root, "scripts", filename)
-            elif purpose == "log":
-                today = datetime.now().strftime("%Y%m%d")
-                file_path = os.path.join(data_root, "logs", today, filename)
-            elif purpose == "autocomm":
-                today = datetime.now().strftime("%Y%m%d")
-                file_path = os.path.join(data_root, "autocomm", today, filename)
-            elif purpose == "rulebook":
-                file_path = os.path.join(data_root, "rulebook", filename)
-            elif purpose == "ruTemplate":
-                file_path = os.path.join(data_root, "scripts", "ru_templates", filename)
-            elif purpose == "dict":
-                file_path = os.path.join(data_root, "dict", filename)
-            elif purpose == "cablink":
-                file_path = os.path.join(data_root, "cablink", filename)
-            else:
-                file_path = os.path.join(data_root, filename)  # fallback
+            file_path = self.resolve_read_path(purpose, filename)
 
             if not os.path.exists(file_path):
-                return message_pb2.Response(success=False, result=f"[서버] 파일 없음: {file_path}")
+                return False, f"[서버] 파일 없음: {file_path}", b""
+
+            content = self.file_cache.get(file_path, "content", self._read_content)
+            return True, file_path, content
 
-            # 엑셀 파일은 바이너리로 읽기
-            if filename.endswith(".xlsx"):
-                with open(file_path, "rb") as f:
-                    content = f.read()
+        except Exception as e:
+            return False, f"[서버 오류] get-file 실패: {e}", b""
+
+    def handle_download_file(self, request):
+        """
+        DownloadFile RPC 처리 (server-streaming)
+        파일 전체를 메모리에 올리지 않고 chunk 단위로 읽어 전송 (read_file과 같은 텍스트/바이너리 처리)
+        if_none_match가 현재 파일 etag와 같으면 내용 없이 not_modified만 응답
+        """
+        try:
+            file_path = self.resolve_read_path(request.purpose, request.filename)
+            if not os.path.exists(file_path):
+                yield message_pb2.FileChunk(last=True, error=f"[서버] 파일 없음: {file_path}")
+                return
+
+            st = os.stat(file_path)
+            etag = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+            if request.if_none_match and request.if_none_match == etag:
+                yield message_pb2.FileChunk(last=True, not_modified=True, etag=etag)
+                return
+
+            chunk_size = request.chunk_size or DEFAULT_CHUNK_SIZE
+            if st.st_size <= self.file_cache.max_bytes // 8:
+                # 참조 파일 크기면 캐시된 내용에서 전송
+                f = BytesIO(self.file_cache.get(file_path, "content", self._read_content))
+                read = f.read
+            elif request.filename.endswith(".xlsx"):
+                f = open(file_path, "rb")
+                read = f.read
             else:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    content = content.encode("utf-8")  # 텍스트는 바이트로 변환
+                f = open(file_path, "r", encoding="utf-8")
+                read = lambda n: f.read(n).encode("utf-8")
 
-            encoded = base64.b64encode(content).decode("utf-8")
-            return message_pb2.Response(success=True, result=encoded)
+            with f:
+                yield from iter_file_chunks(read, request.purpose, request.filename,
+                                            compress=request.compress, chunk_size=chunk_size, etag=etag)
 
         except Exception as e:
-            return message_pb2.Response(success=False, result=f"[서버 오류] get-file 실패: {e}")
-        
+            yield message_pb2.FileChunk(last=True, error=f"[서버 오류] download-file 실패: {e}")
+
     def handle_delete_file(self, payload: str) -> message_pb2.Response:
         """
         삭제 요청을 처리하는 헬퍼 메서드
@@ -431,83 +595,46 @@ class ExecutionHelper(cmd2.Cmd):
     def handle_init_sw_ver(self, entries):
         """
         entries: list of (bts_id, sw_ver)
+        BTS마다 별도 세션/AdminCliInterface에서 병렬 처리 (fleet_runner.run_per_bts)
         """
-        results = []
-        seen_bts = set()
-
-        def update_fn(bts_id, sw_ver):
-            try:
-                self.ws_manager.setActive(bts_id)
-                self.ws_manager.set("bts_id", bts_id)
+        # IP는 일괄 조회 결과만 사용 (조회 실패 시 테스트용 IP로 대신하지 않음)
+        ips = prefetch_bts_ips(bts_id for bts_id, *_ in entries)
 
-                ip = self.admincli.getBtsIpFromNaQuery(bts_id)
-                if not ip:
-                    return {"bts_id": bts_id, "status": "fail", "message": "IP 조회 실패"}
+        def update_one(admincli, bts_id, sw_ver):
+            ip = ips.get(str(bts_id).strip())
+            if not is_valid_ip(ip):
+                return {"bts_id": bts_id, "status": "fail", "message": "IP 조회 실패"}
 
-                self.ws_manager.set("bts_ip", ip)
+            self.ws_manager.set("bts_ip", ip)
 
-                file_path = self._resolve_sw_file_path(sw_ver)
-                if not os.path.isfile(file_path):
-                    return {"bts_id": bts_id, "status": "fail", "message": f"파일 없음: {file_path}"}
-
-                result = self.admincli.softwareUpdate(
-                    bts_id=bts_id,
-                    input_file_path=file_path,
-                    shouldActivate=False,
-                    overrideIndependentRUSW=False
-                )
+            file_path = self._resolve_sw_file_path(sw_ver)
+            if not os.path.isfile(file_path):
+                return {"bts_id": bts_id, "status": "fail", "message": f"파일 없음: {file_path}"}
 
-                if isinstance(result, str):
-                    # 실패 여부 판단
-                    if re.search(r'"requestStatus"\s*:\s*"failed"', result):
-                        # 실패 이유 추출 (마지막 메시지를 기준으로)
-                        matches = re.findall(r'"requestMessage"\s*:\s*"([^"]*)"', result)
-                        reason = matches[-1] if matches else "알 수 없는 오류"
-                        return {
-                            "bts_id": bts_id,
-                            "status": "fail",
-                            "message": f"소프트웨어 업데이트 실패 - {reason}",
-                            "raw": result
-                        }
-
-                return {"bts_id": bts_id, "status": "success", "message": result}
-
-            except Exception as e:
-                import traceback
-                return {
-                    "bts_id": bts_id,
-                    "status": "fail",
-                    "message": f"{e}",
-                    "trace": traceback.format_exc()
-                }
+            result = admincli.softwareUpdate(
+                bts_id=bts_id,
+                input_file_path=file_path,
+                shouldActivate=False,
+                overrideIndependentRUSW=False
+            )
 
-        try:
-            filtered_entries = []
-            for bts_id, sw_ver in entries:
-                if bts_id not in seen_bts:
-                    seen_bts.add(bts_id)
-                    filtered_entries.append((bts_id, sw_ver))
-                else:
-                    results.append({
+            if isinstance(result, str):
+                # 실패 여부 판단
+                if re.search(r'"requestStatus"\s*:\s*"failed"', result):
+                    # 실패 이유 추출 (마지막 메시지를 기준으로)
+                    matches = re.findall(r'"requestMessage"\s*:\s*"([^"]*)"', result)
+                    reason = matches[-1] if matches else "알 수 없는 오류"
+                    return {
                         "bts_id": bts_id,
-                        "status": "skipped",
-                        "message": "중복 건 생략"
-                    })
+                        "status": "fail",
+                        "message": f"소프트웨어 업데이트 실패 - {reason}",
+                        "raw": result
+                    }
 
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                futures = {
-                    executor.submit(update_fn, bts_id, sw_ver): bts_id
-                    for bts_id, sw_ver in filtered_entries
-                }
-                for future in as_completed(futures):
-                    results.append(future.result())
+            return {"bts_id": bts_id, "status": "success", "message": result}
 
-            return json.dumps(results, ensure_ascii=False)
-
-        finally:
-            self.ws_manager.set("bts_ip", None)
-            self.ws_manager.set("bts_id", None)
+        results = run_per_bts(entries, update_one, tag="init-sw-ver", max_workers=5)
+        return json.dumps(results, ensure_ascii=False)
 
 
     def _resolve_sw_file_path(self, sw_ver):
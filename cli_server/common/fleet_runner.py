@@ -0,0 +1,362 @@
+import json
+import os
+import re
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from cli_server.core.workspace.ws_manager import WsManager, current_session_id
+from cli_server.core.job.job_manager import current_job, bind_job
+from cli_server.ext.admincli_interface import AdminCliInterface, bts_ip_cache
+from cli_server.common.utils.bts_ip_cache import is_valid_ip
+from cli_server.settings import FLEET_MAX_PARALLEL
+
+# 여러 BTS 대상 병렬 작업 (init-sw-ver, fleet-commission)
+# - BTS마다 전용 workspace 세션과 전용 AdminCliInterface로 처리 (요청 세션/다른 BTS와 상태를 공유하지 않음)
+# - 같은 BTS는 서버 전체에서 동시에 하나의 작업만 실행 (bts_lock, 대화형 commission/recommission도 같은 lock 사용)
+# - 백그라운드 작업(job) 안에서 실행되면 BTS별 출력에 [BTS_ID]를 붙여 작업 이벤트로 전달하고,
+#   작업 취소 시 아직 시작하지 않은 BTS는 건너뛰고 실행 중인 admin-cli는 모두 종료
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+RECEIVED_DIR = os.path.join(DATA_DIR, "received")
+REPORT_DIR = os.path.join(DATA_DIR, "autocomm")  # 클라이언트는 purpose="autocomm"으로 보고서를 받음
+
+BTS_LOCK_TIMEOUT = 600.0
+MAX_BACKOFF = 300.0
+
+_bts_locks = {}
+_bts_locks_guard = threading.Lock()
+
+
+class BtsBusy(Exception):
+    pass
+
+
+@contextmanager
+def bts_lock(bts_id, timeout: float = BTS_LOCK_TIMEOUT):
+    """같은 BTS에 대한 admin-cli 작업을 서버 전체에서 하나씩만 실행"""
+    with _bts_locks_guard:
+        lock = _bts_locks.setdefault(str(bts_id), threading.Lock())
+    if not lock.acquire(timeout=timeout):
+        raise BtsBusy(f"BTS {bts_id}에 다른 작업이 실행 중입니다. ({int(timeout)}s 대기 후 포기)")
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+class _BtsJobView:
+    """작업 안에서 BTS 하나를 처리하는 스레드가 current_job()으로 보는 대리 객체"""
+
+    def __init__(self, job, bts_id, cancellers, lock):
+        self.job = job
+        self.bts_id = bts_id
+        self._cancellers = cancellers
+        self._lock = lock
+
+    @property
+    def cancel_requested(self):
+        return self.job.cancel_requested
+
+    def emit(self, text: str):
+        for line in str(text).splitlines():
+            self.job.emit(f"[{self.bts_id}] {line}")
+
+    def set_canceller(self, fn):
+        with self._lock:
+            if fn is None:
+                self._cancellers.pop(self.bts_id, None)
+            else:
+                self._cancellers[self.bts_id] = fn
+        if fn is not None and self.job.cancel_requested:
+            fn()
+
+    def check_cancelled(self):
+        self.job.check_cancelled()
+
+
+def progress(message: str):
+    """작업 안이면 진행 메시지를 작업 출력으로 전달"""
+    job = current_job()
+    if job is not None:
+        job.emit(message)
+
+
+def cancelled() -> bool:
+    job = current_job()
+    return job is not None and job.cancel_requested
+
+
+def run_per_bts(entries, fn, tag: str, max_workers: int = FLEET_MAX_PARALLEL):
+    """
+    entries: [(bts_id, 인자...)], fn(admincli, bts_id, 인자...) → 결과 dict
+    BTS마다 별도 세션(active BTS = bts_id)에서 fn을 실행하고 entries 순서대로 결과 목록을 반환
+    중복 BTS는 "skipped", 취소된 작업의 미실행 BTS는 "cancelled"
+    """
+    ws_manager = WsManager()
+    parent_session = current_session_id()
+    job = current_job()
+    cancellers = {}
+    cancellers_lock = threading.Lock()
+
+    def cancel_all():
+        with cancellers_lock:
+            fns = list(cancellers.values())
+        for cancel in fns:
+            cancel()
+
+    def worker(bts_id, args):
+        if job is not None and job.cancel_requested:
+            return {"bts_id": bts_id, "status": "cancelled", "message": "작업 취소로 실행하지 않음"}
+        view = _BtsJobView(job, bts_id, cancellers, cancellers_lock) if job is not None else None
+        session_id = f"{parent_session}#{tag}#{bts_id}"
+        try:
+            with bts_lock(bts_id), ws_manager.use_session(session_id), bind_job(view):
+                ws_manager.setActive(bts_id)
+                ws_manager.set("bts_id", bts_id)
+                return fn(AdminCliInterface(), bts_id, *args)
+        except BtsBusy as e:
+            return {"bts_id": bts_id, "status": "fail", "message": str(e)}
+        except Exception as e:
+            return {"bts_id": bts_id, "status": "fail", "message": f"{e}", "trace": traceback.format_exc()}
+        finally:
+            ws_manager.drop_session(session_id)
+
+    results = [None] * len(entries)
+    seen = set()
+    todo = []
+    for i, (bts_id, *args) in enumerate(entries):
+        bts_id = str(bts_id).strip()
+        if bts_id in seen:
+            results[i] = {"bts_id": bts_id, "status": "skipped", "message": "중복 건 생략"}
+        else:
+            seen.add(bts_id)
+            todo.append((i, bts_id, args))
+
+    if job is not None:
+        job.set_canceller(cancel_all)
+    try:
+        workers = max(1, min(max_workers, FLEET_MAX_PARALLEL, len(todo) or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=tag) as executor:
+            futures = [(i, executor.submit(worker, bts_id, args)) for i, bts_id, args in todo]
+            for i, future in futures:
+                results[i] = future.result()
+    finally:
+        if job is not None:
+            job.set_canceller(None)
+    return results
+
+
+def prefetch_bts_ips(bts_ids):
+    """
+    BTS IP를 na_query로 미리 병렬 조회해 캐시에 채움 (이후 BTS별 getBtsIpFromNaQuery는 캐시에서 바로 반환)
+    반환: {bts_id: IP} (조회 실패는 None)
+    """
+    ids = [str(b).strip() for b in bts_ids if b]
+    if not ids:
+        return {}
+    start = time.monotonic()
+    ips = bts_ip_cache().resolve_many(ids)
+    found = sum(1 for ip in ips.values() if is_valid_ip(ip))
+    progress(f"IP 조회 {found}/{len(ips)}개 ({time.monotonic() - start:.1f}s)")
+    return ips
+
+
+# ─── admin-cli 결과 해석 ───
+def admincli_outcome(result):
+    """
+    admin-cli 결과 문자열 → (성공 여부, 사유, 재시도 가능 여부)
+    응답의 마지막 requestStatus 기준 (failed는 재시도, rejected는 요청 자체 거부라 재시도하지 않음)
+    """
+    if not isinstance(result, str) or not result.strip():
+        return False, "admin-cli 응답 없음", True
+    if result.startswith("[AdminCLI 오류]"):
+        return False, result, True
+    statuses = re.findall(r'"requestStatus"\s*:\s*"([^"]*)"', result)
+    messages = re.findall(r'"requestMessage"\s*:\s*"([^"]*)"', result)
+    reason = messages[-1] if messages else ""
+    status = statuses[-1] if statuses else ""
+    if status == "failed":
+        return False, reason or "requestStatus: failed", True
+    if status == "rejected":
+        return False, reason or "requestStatus: rejected", False
+    return True, reason, False
+
+
+def find_delta_dn(result: str):
+    """commission 응답에서 activatePlan에 넘길 deltaDN 추출 (없으면 None)"""
+    matches = re.findall(r'"deltaDN"\s*:\s*"([^"]+)"', result or "", re.IGNORECASE)
+    return matches[-1] if matches else None
+
+
+def _retry(step: str, call, retries: int, backoff: float):
+    """
+    call() → admin-cli 결과 문자열. 실패하면 backoff * 2^n초 (최대 MAX_BACKOFF) 기다렸다 다시 시도
+    반환: (성공 여부, 사유, 마지막 결과, 시도 횟수)
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        progress(f"{step} 시작 (시도 {attempt}/{retries + 1})")
+        result = call()
+        ok, reason, retryable = admincli_outcome(result)
+        if ok:
+            progress(f"{step} 완료")
+            return True, reason, result, attempt
+        if cancelled():
+            return False, "작업 취소", result, attempt
+        if not retryable or attempt > retries:
+            progress(f"{step} 실패: {reason}")
+            return False, reason, result, attempt
+
+        delay = min(backoff * (2 ** (attempt - 1)), MAX_BACKOFF)
+        progress(f"{step} 실패: {reason} → {delay:g}s 후 재시도")
+        deadline = time.monotonic() + delay
+        while time.monotonic() < deadline:
+            if cancelled():
+                return False, "작업 취소", result, attempt
+            time.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
+
+
+# ─── fleet-commission ───
+FLEET_DEFAULTS = {
+    "max_parallel": 4,
+    "retries": 2,
+    "backoff": 10.0,
+    "skip": False,
+    "activate": True,
+    "recommission": False,
+}
+
+
+def resolve_scf(bts_id: str, filename: str = None, recommission: bool = False):
+    """
+    data/received/<bts_id>/ 에서 commission할 SCF 경로를 찾음
+    filename이 없으면 가장 최근 커밋 파일 (commission: __commit_, recommission: __cellcommit_)
+    """
+    bts_dir = os.path.join(RECEIVED_DIR, str(bts_id))
+    if filename:
+        path = os.path.join(bts_dir, os.path.basename(filename))
+        return path if os.path.isfile(path) else None
+    if not os.path.isdir(bts_dir):
+        return None
+
+    marker = "__cellcommit_" if recommission else "__commit_"
+    candidates = [
+        os.path.join(bts_dir, name) for name in os.listdir(bts_dir)
+        if name.endswith(".xml") and marker in name
+    ]
+    return max(candidates, key=os.path.getmtime) if candidates else None
+
+
+def _commission_one(admincli, bts_id, filename, ip, options):
+    ws_manager = WsManager()
+    started = time.time()
+    step = "recommission" if options["recommission"] else "commission"
+    row = {
+        "bts_id": bts_id, "ip": "", "file": "", "status": "fail", "message": "",
+        "commission": "", "activate": "", "delta_dn": "", "attempts": 0,
+        "started_at": datetime.fromtimestamp(started).strftime("%Y-%m-%d %H:%M:%S"), "elapsed_s": 0.0,
+    }
+
+    def done(status, message):
+        row["status"] = status
+        row["message"] = message
+        row["elapsed_s"] = round(time.time() - started, 1)
+        progress(f"결과: {status} {message}")
+        return row
+
+    path = resolve_scf(bts_id, filename, options["recommission"])
+    if not path:
+        return done("fail", f"커밋된 SCF 없음 (data/received/{bts_id}/{filename or ''})")
+    row["file"] = os.path.basename(path)
+
+    # ip는 run_fleet_commission에서 일괄 조회한 값 (조회 실패 시 테스트용 IP로 대신하지 않음)
+    if not is_valid_ip(ip):
+        return done("fail", "IP 조회 실패")
+    row["ip"] = ip
+    ws_manager.set("bts_ip", ip)
+    ws_manager.set("final_file", path)
+    progress(f"{step} 대상 {ip}, 파일 {row['file']}")
+
+    run = admincli.recommission if options["recommission"] else admincli.commission
+    ok, reason, result, attempts = _retry(
+        step, lambda: run(path, skipParameterRelationErrors=options["skip"], shouldBeActivated=False),
+        options["retries"], options["backoff"])
+    row["attempts"] = attempts
+    row["commission"] = "ok" if ok else "fail"
+    if not ok:
+        return done("cancelled" if cancelled() else "fail", f"{step} 실패: {reason}")
+    if not options["activate"]:
+        return done("success", f"{step} 완료 (활성화 생략)")
+
+    delta_dn = find_delta_dn(result)
+    if not delta_dn:
+        row["activate"] = "skipped"
+        return done("partial", f"{step} 완료, 응답에 deltaDN이 없어 activatePlan 생략 (activateplan으로 수동 활성화 필요)")
+    row["delta_dn"] = delta_dn
+
+    ok, reason, _, attempts = _retry(
+        "activatePlan", lambda: admincli.activatePlan(delta_dn), options["retries"], options["backoff"])
+    row["attempts"] += attempts
+    row["activate"] = "ok" if ok else "fail"
+    if not ok:
+        return done("cancelled" if cancelled() else "partial", f"{step} 완료, activatePlan 실패: {reason}")
+    return done("success", f"{step} + activatePlan 완료")
+
+
+def run_fleet_commission(entries, options: dict = None):
+    """
+    entries: [{"bts_id": ..., "file": SCF 파일명(생략 시 최근 커밋), "ip": IP(생략 시 na_query)}]
+    BTS별 commission(recommission) + activatePlan을 병렬 실행하고 결과/보고서 파일명을 반환
+    """
+    options = dict(FLEET_DEFAULTS, **(options or {}))
+    options["retries"] = max(0, int(options["retries"]))
+    options["backoff"] = max(0.0, float(options["backoff"]))
+
+    rows = [(str(e["bts_id"]).strip(), e.get("file") or None, e.get("ip") or None) for e in entries]
+    ips = prefetch_bts_ips(bts_id for bts_id, _, ip in rows if not ip)
+    rows = [(bts_id, filename, ip or ips.get(bts_id), options) for bts_id, filename, ip in rows]
+    progress(f"fleet-commission 시작: BTS {len(rows)}개, 동시 {min(int(options['max_parallel']), FLEET_MAX_PARALLEL)}개")
+    results = run_per_bts(rows, _commission_one, tag="fleet", max_workers=int(options["max_parallel"]))
+
+    summary = {}
+    for row in results:
+        summary[row["status"]] = summary.get(row["status"], 0) + 1
+    report = write_report(results, options)
+    progress("fleet-commission 종료: " + ", ".join(f"{k} {v}" for k, v in summary.items()))
+    return {"summary": summary, "results": results, "report": report}
+
+
+def write_report(results, options):
+    """결과를 data/autocomm/<오늘>/fleet_commission_<시각>.json / .xlsx로 저장하고 파일명을 반환"""
+    now = datetime.now()
+    report_dir = os.path.join(REPORT_DIR, now.strftime("%Y%m%d"))
+    os.makedirs(report_dir, exist_ok=True)
+    base = f"fleet_commission_{now.strftime('%Y%m%d_%H%M%S')}"
+    report = {}
+
+    with open(os.path.join(report_dir, base + ".json"), "w", encoding="utf-8") as f:
+        json.dump({"created_at": now.isoformat(timespec="seconds"), "options": options, "results": results},
+                  f, ensure_ascii=False, indent=2)
+    report["json"] = base + ".json"
+
+    try:
+        import openpyxl
+    except ImportError:
+        return report
+
+    columns = ["bts_id", "ip", "file", "status", "commission", "activate", "delta_dn",
+               "attempts", "started_at", "elapsed_s", "message"]
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.title = "fleet-commission"
+    sheet.append(columns)
+    for row in results:
+        sheet.append([row.get(c, "") for c in columns])
+    sheet.freeze_panes = "A2"
+    wb.save(os.path.join(report_dir, base + ".xlsx"))
+    report["xlsx"] = base + ".xlsx"
+    return report
@@ -0,0 +1,162 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from cli_server.common.utils.net_tools import ping_rtt, check_ssh
+from cli_server.common.fleet_runner import progress, cancelled, prefetch_bts_ips, DATA_DIR
+from cli_server.core.job.job_manager import current_job, bind_job
+from cli_server.settings import SSH_USER, SWEEP_MAX_PARALLEL, SWEEP_PROBE_TIMEOUT
+
+# 여러 BTS 연결 상태 일괄 확인 (sweep)
+# - BTS IP는 na_query 캐시로 한 번에 병렬 조회 (prefetch_bts_ips)
+# - BTS마다 ping(ICMP)과 ssh 로그인을 확인, 최대 max_parallel개 BTS를 동시에 처리
+# - ssh는 ControlMaster로 연결을 재사용하므로 같은 BTS를 다시 sweep하면 로그인 없이 바로 확인
+# - 작업(job) 안에서 실행되면 BTS가 끝날 때마다 결과 한 줄을 작업 출력으로 전달
+
+SWEEP_DEFAULTS = {
+    "ping": True,
+    "ssh": True,
+    "timeout": SWEEP_PROBE_TIMEOUT,
+    "max_parallel": 32,
+    "user": SSH_USER,
+}
+
+
+def find_workbook(filename: str):
+    """autocomm 엑셀 경로 (오늘 날짜 폴더 우선, 없으면 가장 최근 날짜 폴더에서 찾음)"""
+    base = os.path.join(DATA_DIR, "autocomm")
+    today = datetime.now().strftime("%Y%m%d")
+    dates = sorted((d for d in os.listdir(base) if d.isdigit()), reverse=True) if os.path.isdir(base) else []
+    for date_dir in [today] + [d for d in dates if d != today]:
+        path = os.path.join(base, date_dir, filename)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def bts_ids_from_workbook(filename: str):
+    """
+    autocomm 엑셀의 INITBTS 시트에서 MRBTS.id 목록을 읽음 (show-bts-entry와 같은 헤더 규칙)
+    'CLI SCENARIO' 헤더(D열) 아래 MO/파라미터 행, '#####' 행 전까지가 데이터
+    """
+    path = find_workbook(filename)
+    if path is None:
+        raise FileNotFoundError(f"autocomm 엑셀 없음: {filename}")
+
+    import openpyxl
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    sheet_name = next((name for name in wb.sheetnames if "INITBTS" in name.upper()), None)
+    if sheet_name is None:
+        raise KeyError("INITBTS 시트를 찾을 수 없습니다.")
+    rows = [list(r) for r in wb[sheet_name].iter_rows(values_only=True)]
+
+    header_idx = next((i for i, r in enumerate(rows)
+                       if len(r) > 3 and r[3] and str(r[3]).strip().upper() == "CLI SCENARIO"), None)
+    if header_idx is None or header_idx + 1 >= len(rows):
+        raise KeyError("엑셀에서 'CLI SCENARIO' 헤더를 찾을 수 없습니다.")
+
+    mo_headers = list(rows[header_idx])
+    param_keys = rows[header_idx + 1]
+    for i in range(1, len(mo_headers)):
+        if mo_headers[i] is None:
+            mo_headers[i] = mo_headers[i - 1]
+    btsid_col = next((c for c in range(min(len(mo_headers), len(param_keys)))
+                      if mo_headers[c] == "MRBTS" and param_keys[c] == "id"), None)
+    if btsid_col is None:
+        raise KeyError("엑셀에서 MRBTS.id 열을 찾을 수 없습니다.")
+
+    bts_ids = []
+    for row in rows[header_idx + 2:]:
+        if len(row) > 3 and row[3] and str(row[3]).strip().startswith("#####"):
+            break
+        value = row[btsid_col] if btsid_col < len(row) else None
+        bts_id = str(value).strip() if value is not None else ""
+        if bts_id.isdigit() and bts_id not in bts_ids:
+            bts_ids.append(bts_id)
+    return bts_ids
+
+
+def _probe_one(job, bts_id, ip, options):
+    with bind_job(job):
+        return _probe(bts_id, ip, options)
+
+
+def _probe(bts_id, ip, options):
+    row = {"bts_id": bts_id, "ip": ip or "", "ping": "", "ping_ms": None, "ssh": "", "status": "", "message": ""}
+    started = time.monotonic()
+    if not ip or ip == "0.0.0.0":
+        row.update(status="no_ip", message="IP 조회 실패")
+        return row
+    if cancelled():
+        row.update(status="cancelled", message="작업 취소로 확인하지 않음")
+        return row
+
+    timeout = options["timeout"]
+    checks = []
+    if options["ping"]:
+        row["ping_ms"] = ping_rtt(ip, timeout=timeout)
+        row["ping"] = "ok" if row["ping_ms"] is not None else "fail"
+        checks.append(row["ping"] == "ok")
+    if options["ssh"] and not cancelled():
+        ok, message = check_ssh(ip, user=options["user"], timeout=timeout)
+        row["ssh"] = "ok" if ok else "fail"
+        if not ok:
+            row["message"] = message
+        checks.append(ok)
+
+    if all(checks):
+        row["status"] = "reachable"
+    elif any(checks):
+        row["status"] = "partial"
+    else:
+        row["status"] = "unreachable"
+    row["elapsed_s"] = round(time.monotonic() - started, 2)
+    return row
+
+
+def _format_row(row):
+    parts = [row["ip"] or "-"]
+    if row["ping"]:
+        parts.append(f"ping {row['ping']}" + (f" {row['ping_ms']}ms" if row["ping_ms"] is not None else ""))
+    if row["ssh"]:
+        parts.append(f"ssh {row['ssh']}")
+    return f"[{row['bts_id']}] {row['status']}: " + ", ".join(parts) + (f" ({row['message']})" if row["message"] else "")
+
+
+def run_sweep(entries, options: dict = None):
+    """
+    entries: [{"bts_id": ..., "ip": IP(생략 시 na_query)}]
+    BTS별 ping/ssh 연결 확인 결과를 입력 순서대로 반환 (중복 BTS는 한 번만 확인)
+    """
+    options = dict(SWEEP_DEFAULTS, **(options or {}))
+    options["timeout"] = max(0.5, float(options["timeout"]))
+    workers = max(1, min(int(options["max_parallel"]), SWEEP_MAX_PARALLEL))
+
+    targets = {}
+    for entry in entries:
+        bts_id = str(entry["bts_id"]).strip()
+        if bts_id and bts_id not in targets:
+            targets[bts_id] = entry.get("ip") or None
+
+    start = time.monotonic()
+    progress(f"sweep 시작: BTS {len(targets)}개, 동시 {workers}개, 제한 시간 {options['timeout']:g}s")
+    ips = prefetch_bts_ips(bts_id for bts_id, ip in targets.items() if not ip)
+    for bts_id, ip in targets.items():
+        targets[bts_id] = ip or ips.get(bts_id)
+
+    job = current_job()
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(targets) or 1), thread_name_prefix="sweep") as executor:
+        futures = {executor.submit(_probe_one, job, bts_id, ip, options): bts_id for bts_id, ip in targets.items()}
+        for future in as_completed(futures):
+            row = future.result()
+            results[futures[future]] = row
+            progress(_format_row(row))
+
+    ordered = [results[bts_id] for bts_id in targets]
+    summary = {}
+    for row in ordered:
+        summary[row["status"]] = summary.get(row["status"], 0) + 1
+    elapsed = round(time.monotonic() - start, 1)
+    progress(f"sweep 종료 ({elapsed}s): " + ", ".join(f"{k} {v}" for k, v in summary.items()))
+    return {"summary": summary, "results": ordered, "elapsed_s": elapsed}
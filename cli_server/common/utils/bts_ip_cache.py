@@ -0,0 +1,126 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# BTS ID → IP 조회 결과 캐시 (na_query get-bts-ip는 호출마다 NetAct에 새로 접속하므로 결과를 재사용)
+# - 조회 성공은 ttl, 조회 실패(IP 없음/"0.0.0.0")는 negative_ttl 동안 보관 (실행 오류/예외는 보관하지 않음)
+# - 같은 BTS를 여러 스레드가 동시에 조회하면 하나만 실제로 조회하고 나머지는 그 결과를 기다림
+# - resolve_many()는 여러 BTS를 최대 max_parallel개씩 동시에 조회
+
+
+def is_valid_ip(ip) -> bool:
+    return bool(ip) and ip != "0.0.0.0"
+
+
+class _Pending:
+    """진행 중인 조회 하나 (같은 BTS를 기다리는 스레드가 결과를 나눠 받음)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class BtsIpCache:
+    def __init__(self, loader, ttl: float = 600.0, negative_ttl: float = 60.0, max_parallel: int = 8):
+        """loader(bts_id) → IP 문자열 (조회 결과 없음: None/""/"0.0.0.0", 실행 실패: 예외)"""
+        self.loader = loader
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_parallel = max(1, max_parallel)
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0  # 다른 스레드의 진행 중 조회 결과를 받은 횟수
+        self.errors = 0
+        self._entries = {}  # bts_id → (만료 시각, IP)
+        self._pending = {}  # bts_id → _Pending
+        self._lock = threading.Lock()
+
+    def get(self, bts_id, refresh: bool = False):
+        """bts_id의 IP (캐시에 없거나 만료됐거나 refresh=True면 loader로 조회)"""
+        key = str(bts_id).strip()
+        with self._lock:
+            if not refresh:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    self.hits += 1
+                    return entry[1]
+            pending = self._pending.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._pending[key] = _Pending()
+                self.misses += 1
+            else:
+                self.shared += 1
+
+        if not owner:
+            pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+
+        try:
+            pending.value = self.loader(key)
+        except Exception as e:
+            pending.error = e
+            with self._lock:
+                self.errors += 1
+            raise
+        else:
+            ttl = self.ttl if is_valid_ip(pending.value) else self.negative_ttl
+            with self._lock:
+                if ttl > 0:
+                    self._entries[key] = (time.monotonic() + ttl, pending.value)
+                else:
+                    self._entries.pop(key, None)
+            return pending.value
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.event.set()
+
+    def resolve_many(self, bts_ids, refresh: bool = False) -> dict:
+        """
+        여러 BTS IP를 한 번에 조회 (중복 ID는 한 번만, 최대 max_parallel개 동시 조회)
+        반환: {bts_id: IP} (조회 실패/예외는 None)
+        """
+        keys = list(dict.fromkeys(str(b).strip() for b in bts_ids if str(b).strip()))
+        if not keys:
+            return {}
+
+        def lookup(key):
+            try:
+                return self.get(key, refresh=refresh)
+            except Exception:
+                return None
+
+        workers = min(self.max_parallel, len(keys))
+        if workers == 1:
+            return {key: lookup(key) for key in keys}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="na_query") as executor:
+            return dict(zip(keys, executor.map(lookup, keys)))
+
+    def invalidate(self, bts_id=None):
+        """bts_id 항목만 (None이면 전체) 캐시에서 제거"""
+        with self._lock:
+            if bts_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(bts_id).strip(), None)
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            live = [ip for expires, ip in self._entries.values() if expires > now]
+            total = self.hits + self.misses + self.shared
+            return {
+                "entries": len(live),
+                "negative": sum(1 for ip in live if not is_valid_ip(ip)),
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared": self.shared,
+                "errors": self.errors,
+                "hit_rate": round((self.hits + self.shared) / total, 3) if total else 0.0,
+                "ttl": self.ttl,
+                "negative_ttl": self.negative_ttl,
+            }
@@ -0,0 +1,104 @@
+import threading
+import time
+
+# 서버 명령별 처리 시간 통계
+# - 명령 이름 단위로 호출 수/실패 수/누적·최대 시간과 처리 시간 분포(히스토그램)를 기록
+# - 분포 구간(ms)은 LATENCY_BUCKETS_MS, 마지막 구간은 그 이상 전체
+# - p50/p95/p99는 히스토그램 구간 상한으로 추정 (정확한 값이 아닌 "이 시간 이하")
+
+LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000, 30000)
+
+
+class _CommandStat:
+    __slots__ = ("count", "errors", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, elapsed_ms: float, ok: bool):
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        self.total += elapsed_ms
+        if elapsed_ms > self.max:
+            self.max = elapsed_ms
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, p: float) -> float:
+        """히스토그램 기준 p(0~1) 백분위수의 구간 상한(ms). 최대값을 넘지 않음"""
+        if not self.count:
+            return 0.0
+        target = p * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return min(float(LATENCY_BUCKETS_MS[i]), self.max) if i < len(LATENCY_BUCKETS_MS) else self.max
+        return self.max
+
+
+class CommandStats:
+    def __init__(self):
+        self.started_at = time.time()
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elapsed: float, ok: bool = True):
+        """명령 하나의 처리 결과를 기록 (elapsed: 초)"""
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                stat = self._stats[name] = _CommandStat()
+            stat.add(elapsed * 1000, ok)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+    def snapshot(self) -> dict:
+        """명령 이름 → 통계 dict (누적 시간이 큰 순서)"""
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda x: x[1].total, reverse=True)
+            return {
+                name: {
+                    "count": s.count,
+                    "errors": s.errors,
+                    "total_ms": round(s.total, 1),
+                    "avg_ms": round(s.total / s.count, 1) if s.count else 0.0,
+                    "max_ms": round(s.max, 1),
+                    "p50_ms": round(s.percentile(0.50), 1),
+                    "p95_ms": round(s.percentile(0.95), 1),
+                    "p99_ms": round(s.percentile(0.99), 1),
+                    "histogram": dict(zip([f"<={b}ms" for b in LATENCY_BUCKETS_MS] + ["more"], s.buckets)),
+                }
+                for name, s in items
+            }
+
+    def format_table(self) -> str:
+        snap = self.snapshot()
+        uptime = int(time.time() - self.started_at)
+        total_ms = sum(s["total_ms"] for s in snap.values()) or 1.0
+
+        lines = [
+            f"[서버 명령 통계] 집계 기간 {uptime}s, 명령 {len(snap)}종",
+            f"{'command':<22}{'count':>8}{'err':>6}{'total(s)':>10}{'share':>7}"
+            f"{'avg':>9}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>9}",
+        ]
+        for name, s in snap.items():
+            lines.append(
+                f"{name:<22}{s['count']:>8}{s['errors']:>6}{s['total_ms'] / 1000:>10.2f}"
+                f"{s['total_ms'] / total_ms * 100:>6.1f}%"
+                f"{s['avg_ms']:>9.1f}{s['p50_ms']:>8.1f}{s['p95_ms']:>8.1f}{s['p99_ms']:>8.1f}{s['max_ms']:>9.1f}"
+            )
+        lines.append("(시간 단위 ms, p50/p95/p99는 히스토그램 구간 상한 기준)")
+        return "\n".join(lines)
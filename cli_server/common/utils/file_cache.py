@@ -0,0 +1,80 @@
+import os
+import threading
+from collections import OrderedDict
+
+# 서버 파일 내용 LRU 캐시
+# - (경로, 종류) 단위로 읽어서 가공한 결과(bytes/str)를 보관 (종류: 원본 bytes, 텍스트 등)
+# - 요청마다 os.stat()으로 mtime/size를 비교하여 바뀌었으면 다시 읽음
+# - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+
+
+class FileCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # (path, kind) → (stamp, value, size)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp(path: str):
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    def get(self, path: str, kind: str, loader):
+        """
+        path 파일을 loader(path)로 읽은 결과를 반환 (파일이 바뀌지 않았으면 캐시에서 반환)
+        파일이 없으면 FileNotFoundError
+        """
+        key = (os.path.abspath(path), kind)
+        stamp = self._stamp(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader(path)
+
+        # 읽는 도중 파일이 바뀌었으면 캐시에 넣지 않음
+        if self._stamp(path) != stamp:
+            return value
+
+        size = len(value)
+        if size > self.max_bytes:
+            return value
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[2]
+            self._entries[key] = (stamp, value, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and self._entries:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
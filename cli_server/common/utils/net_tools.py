@@ -1,8 +1,11 @@
+import os
+import subprocess
 from ping3 import ping
+from cli_server.settings import SSH_USER, SSH_CONTROL_DIR, SSH_CONTROL_PERSIST
 
-def check_ping(dest):
+def check_ping(dest, timeout: float = 4):
     try:
-        response = ping(dest)
+        response = ping(dest, timeout=timeout)
         if not response:
             return False, f"{dest} is down."
         else:
@@ -10,3 +13,47 @@ def check_ping(dest):
     except Exception as e:
         return False, f"Exception: {e}"
 
+def ping_rtt(dest, timeout: float = 4):
+    """ICMP echo 한 번 → 응답 시간(ms), 응답 없음/오류는 None"""
+    try:
+        response = ping(dest, timeout=timeout)
+    except Exception:
+        return None
+    return round(response * 1000, 1) if response else None
+
+def ssh_command(ip, user: str = SSH_USER, timeout: float = 5):
+    """
+    연결 확인용 ssh 명령 (ControlMaster로 같은 BTS 연결을 SSH_CONTROL_PERSIST초 동안 재사용)
+    ControlPath는 %C(연결 정보 해시)로 짧게 만들어 unix socket 경로 길이 제한을 피함
+    """
+    return [
+        "ssh", "-o", "BatchMode=yes", "-o", f"ConnectTimeout={max(1, int(timeout))}",
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={os.path.join(SSH_CONTROL_DIR, '%C')}",
+        "-o", f"ControlPersist={int(SSH_CONTROL_PERSIST)}",
+        f"{user}@{ip}", "exit"
+    ]
+
+def check_ssh(ip, user: str = SSH_USER, timeout: float = 5):
+    """
+    ssh 로그인 확인 → (성공 여부, 메시지)
+    stdout/stderr는 DEVNULL (ControlPersist로 남는 master 프로세스가 파이프를 잡고 있으면 끝나지 않음)
+    """
+    os.makedirs(SSH_CONTROL_DIR, mode=0o700, exist_ok=True)
+    cmd = ssh_command(ip, user, timeout)
+    try:
+        result = subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout + 5
+        )
+    except subprocess.TimeoutExpired:
+        return False, f"{ip} SSH 응답 없음 ({timeout}s)"
+    except Exception as e:
+        return False, f"Exception: {e}"
+
+    if result.returncode == 0:
+        return True, f"{ip} SSH 연결 성공"
+    return False, f"{ip} SSH 연결 실패 (rc={result.returncode})"
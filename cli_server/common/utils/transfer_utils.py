@@ -0,0 +1,109 @@
+import hashlib
+import zlib
+
+from proto import message_pb2
+
+# chunk 단위 파일 전송 (DownloadFile / UploadFile 공통)
+# - 첫 chunk에 purpose/filename/compressed/etag, 마지막 chunk에 원본 크기/SHA-256
+# - compressed이면 data를 이어 붙인 전체가 하나의 gzip 스트림
+# - 송수신 모두 chunk_size 단위로만 메모리를 사용
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def iter_file_chunks(read, purpose: str = "", filename: str = "", compress: bool = False,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE, etag: str = ""):
+    """
+    read(n) → bytes 함수로 원본을 읽어 FileChunk를 순서대로 생성
+    """
+    sha = hashlib.sha256()
+    size = 0
+    comp = zlib.compressobj(6, zlib.DEFLATED, _GZIP_WBITS) if compress else None
+    first = True
+
+    def make(data: bytes, **fields):
+        nonlocal first
+        if first:
+            fields.update(purpose=purpose, filename=filename, compressed=compress, etag=etag)
+            first = False
+        return message_pb2.FileChunk(data=data, **fields)
+
+    while True:
+        raw = read(chunk_size)
+        if not raw:
+            break
+        sha.update(raw)
+        size += len(raw)
+        data = comp.compress(raw) if comp else raw
+        if data:
+            yield make(data)
+
+    tail = comp.flush() if comp else b""
+    yield make(tail, last=True, sha256=sha.hexdigest(), size=size)
+
+
+class ChunkReceiver:
+    """
+    FileChunk를 순서대로 받아 원본 내용을 파일 객체에 기록하고 체크섬을 확인
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.purpose = None
+        self.filename = None
+        self.size = 0
+        self.error = None
+        self.etag = ""
+        self.not_modified = False
+        self._sha = hashlib.sha256()
+        self._decomp = None
+        self._started = False
+        self._last = None
+
+    def _write(self, fp, raw: bytes):
+        if raw:
+            self._sha.update(raw)
+            self.size += len(raw)
+            fp.write(raw)
+
+    def feed(self, chunk, fp):
+        if not self._started:
+            self._started = True
+            self.purpose = chunk.purpose
+            self.filename = chunk.filename
+            self.etag = chunk.etag
+            self.not_modified = chunk.not_modified
+            if chunk.compressed:
+                self._decomp = zlib.decompressobj(_GZIP_WBITS)
+
+        if chunk.error:
+            self.error = chunk.error
+
+        if self._decomp is None:
+            self._write(fp, chunk.data)
+        else:
+            # 압축 해제 결과도 chunk_size 단위로 나눠 기록 (압축률이 높은 파일 대비)
+            data = chunk.data
+            while data:
+                self._write(fp, self._decomp.decompress(data, self.chunk_size))
+                data = self._decomp.unconsumed_tail
+            if chunk.last:
+                self._write(fp, self._decomp.flush())
+
+        if chunk.last:
+            self._last = chunk
+
+    def verify(self):
+        """전송 결과 확인. 문제가 없으면 None, 있으면 오류 메시지를 반환"""
+        if self.error:
+            return self.error
+        if self.not_modified:
+            return None
+        if self._last is None:
+            return "전송이 완료되지 않았습니다. (마지막 chunk 없음)"
+        if self._last.size != self.size:
+            return f"크기 불일치 (기대 {self._last.size}, 수신 {self.size})"
+        if self._last.sha256 != self._sha.hexdigest():
+            return "체크섬(SHA-256) 불일치"
+        return None
@@ -1,316 +1,587 @@
 import json
 import os
 import shlex
-import subprocess
+import time
+import grpc
 from proto import message_pb2, message_pb2_grpc
-from cli_server.core.workspace.ws_manager import WsManager, getWorkspace
-from cli_server.common.utils.net_tools import check_ping
+from cli_server.settings import IS_DEBUG
+from cli_server.core.workspace.ws_manager import WsManager, getWorkspace, session_id_from_context
+from cli_server.core.job.job_manager import JobManager, FINAL_STATES, current_job
+from cli_server.common.utils.net_tools import check_ping, check_ssh, ssh_command
+from cli_server.common.utils.command_stats import CommandStats
 from cli_server.common.execution_helper import ExecutionHelper
-from cli_server.ext.admincli_interface import AdminCliInterface
+from cli_server.common.fleet_runner import bts_lock, run_fleet_commission
+from cli_server.common.sweep_runner import run_sweep, bts_ids_from_workbook
+from cli_server.ext.admincli_interface import AdminCliInterface, bts_ip_cache
+from cli_server.ext.admincli_pool import admincli_pool_stats
+
+# 등록되지 않은 명령은 handle_default로 처리하고 통계는 이 이름으로 묶어서 기록
+DEFAULT_COMMAND = "(default)"
+
+# ExecutionHelper에 그대로 넘기는 명령 (request.command → 메서드 이름)
+HELPER_COMMANDS = {
+    "tgt_bts": "handle_tgt_bts",
+    "no_tgt_bts": "handle_no_tgt_bts",
+    "default": "handle_default",
+    "list": "handle_list",
+    "commit": "handle_commit",
+    "commit-cli": "handle_commit_cli",
+    "show_cfg": "handle_show_cfg",
+    "set-cfg-scf": "handle_set_cfg_scf",
+    "show-glb": "handle_show_glb",
+    "show_sib": "handle_show_sib",
+    "delmo": "handle_delmo",
+    "go_top": "handle_go_top",
+    "getRefXml": "handle_get_ref_xml",
+    "updateCurrentXml": "handle_update_current_xml",
+    "rulebook": "handle_rulebook_file",
+    "saveFile": "handle_save_file",
+    "getFile": "handle_get_file",
+    "deleteFile": "handle_delete_file",
+    "listTmpl": "handle_list_tmpl",
+    "listScript": "handle_list_script",
+}
+
+# SubmitJob으로 백그라운드 실행할 수 있는 명령 (admin-cli가 끝날 때까지 오래 걸리는 명령)
+JOB_COMMANDS = ("commission", "recommission", "generateScf", "update-sw-ver", "init-sw-ver", "fleet-commission",
+                "sweep")
 
 class CommandServiceServicer(message_pb2_grpc.CommandServiceServicer):
     def __init__(self):
         self.ws_manager = WsManager()
         self.helper = ExecutionHelper()
         self.admincli = AdminCliInterface()
+        self.stats = CommandStats()
+        self.jobs = JobManager()
+        self.commands = self._build_command_table()
+
+    def _build_command_table(self):
+        """
+        request.command → 처리 함수(payload) 테이블 (서버 시작 시 한 번 생성)
+        self.admincli는 dest-bts/set-bts에서 새로 만들어지므로 admincli를 쓰는 명령은 _cmd_* 메서드를 거침
+        ExecutionHelper에 구현되지 않은 명령은 등록하지 않음 (기본 처리로 넘어감)
+        """
+        commands = {
+            # BTS 대상 설정 / 연결 확인
+            "dest-bts": self._cmd_dest_bts,
+            "set-bts": self._cmd_set_bts,
+            "dest-bts-ip": self._cmd_dest_bts_ip,
+            "check-ping": self._cmd_check_ping,
+            "check-ssh": self._cmd_check_ssh,
+            "check-soam": self._cmd_check_soam,
+            "resolve-bts-ip": self._cmd_resolve_bts_ip,
+            "sweep": self._cmd_sweep,
+            # admincli 연동
+            "auto-inte": self._cmd_auto_inte,
+            "auto-deinte": self._cmd_auto_deinte,
+            "update-sw-ver": self._cmd_update_sw_ver,
+            "getHwInfo": self._cmd_get_hw_info,
+            "commission": self._cmd_commission,
+            "recommission": self._cmd_recommission,
+            "activateplan": self._cmd_activateplan,
+            "generateScf": self._cmd_generate_scf,
+            "init-sw-ver": self._cmd_init_sw_ver,
+            "fleet-commission": self._cmd_fleet_commission,
+            # 서버 상태
+            "server-stats": self._cmd_server_stats,
+        }
+        # 설정 트리 / 파일 처리
+        for command, method_name in HELPER_COMMANDS.items():
+            method = getattr(self.helper, method_name, None)
+            if method is not None:
+                commands[command] = method
+        return commands
 
     def SendCommand(self, request, context):
-        #if not request.command == "set-cfg-scf":
-            #print(f"[Server] Received: {request.command} - {request.payload}")
+        if IS_DEBUG:
+            print(f"command: {request.command}")
 
+        handler = self.commands.get(request.command)
+        name = request.command if handler is not None else DEFAULT_COMMAND
+        ok = False
+        start = time.perf_counter()
         try:
-            print(f"command: {request.command}")
-            if request.command == "dest-bts":
-                bts_id = request.payload.strip()
-
-                # workspace 세팅
-                self.ws_manager.setActive(bts_id)
-
-                # na_query 실행
-                self.admincli = AdminCliInterface()
-                ip = self.admincli.getBtsIpFromNaQuery(bts_id)
-
-                # 디버깅 출력
-                print(f"[DEBUG] 실제 getBtsIpFromNaQuery 결과: {ip}")
-                print(f"[DEBUG] 현재 active_ws bts_id: {self.ws_manager.get('bts_id')}")
-
-                # set-bts로 이미 입력된 IP 가져오기
-                manual_ip = self.ws_manager.get("bts_ip")
-
-                # 조회 실패 판정: ip가 None, 빈 문자열, "0.0.0.0"일 때
-                if not ip or ip == "0.0.0.0":
-                    if manual_ip:
-                        return message_pb2.Response(
-                            success=True,
-                            result=f"BTS {bts_id} 설정됨 (조회 실패, 수동 입력 IP {manual_ip} 유지)"
-                        )
-                    else:
-                        return message_pb2.Response(
-                            success=False,
-                            result=f"BTS {bts_id} 설정됨 (IP 조회 실패, 수동 입력 없음)"
-                        )
-
-                # 조회 성공한 경우
-                if manual_ip and manual_ip != ip:
-                    # 수동 입력과 조회 결과가 다르면 경고 (입력값 유지)
-                    msg = (f"[경고] 수동 입력 IP({manual_ip})와 조회된 IP({ip})가 다릅니다. "
-                        f"입력값({manual_ip})을 유지합니다.")
-                    print("[DEBUG]", msg)
-                    return message_pb2.Response(success=True, result=msg)
+            # 요청한 클라이언트 세션의 workspace 기준으로 처리
+            with self.ws_manager.use_session(session_id_from_context(context)):
+                if handler is None:
+                    response = self._handle_default(request)
                 else:
-                    # 수동 입력 없거나 일치 → 조회값 세팅
-                    self.ws_manager.set("bts_ip", ip)
-                    return message_pb2.Response(success=True, result=f"BTS {bts_id} 설정 -> IP: {ip}")
-
-            elif request.command == "set-bts":
-                try:
-                    tokens = shlex.split(request.payload.strip())
-                except Exception as e:
-                    return message_pb2.Response(success=False, result=f"인자 파싱 오류: {e}")
-
-                if len(tokens) != 2:
-                    return message_pb2.Response(success=False, result="인자 오류: BTS_ID, IP가 필요합니다.")
-
-                bts_id, ip = tokens
-
-                # workspace 세팅 (dest-bts와 동일하게)
-                self.ws_manager.setActive(bts_id)
-                self.ws_manager.set("bts_ip", ip)
-
-                # dest-bts와 동일하게 admincli 초기화 (추후 동작 일관성 보장)
-                self.admincli = AdminCliInterface()
-
-                print(f"[DEBUG] 수동 세팅된 bts_id: {bts_id}, bts_ip: {ip}")
-                print(f"[DEBUG] 현재 active_ws bts_id: {self.ws_manager.get('bts_id')}")
-
-                return message_pb2.Response(success=True, result=f"BTS {bts_id} 설정 -> IP: {ip}")
-
-            elif request.command == "auto-inte":
-                # payload: "<BTS_ID> <VER> <MR> <NE_NAME> <BTS_IP>"  (shlex-quoted)
-                try:
-                    tokens = shlex.split(request.payload.strip())
-                except Exception as e:
-                    return message_pb2.Response(success=False, result=f"인자 파싱 오류: {e}")
-
-                if len(tokens) != 5:
-                    return message_pb2.Response(success=False, result="인자 오류: BTS_ID, VER, MR, NE_NAME, BTS_IP가 필요합니다.")
-
-                bts_id, ver, mr, ne_name, bts_ip = tokens
-                success, msg = self.admincli.executeBtsIntegration(bts_id, ver, mr, ne_name, bts_ip)
-                return message_pb2.Response(success=success, result=msg)
-            
-            elif request.command == "auto-deinte":
-                # payload: "<BTS_ID>" (shlex-quoted)
-                try:
-                    tokens = shlex.split(request.payload.strip())
-                except Exception as e:
-                    return message_pb2.Response(success=False, result=f"인자 파싱 오류: {e}")
-
-                if len(tokens) != 1:
-                    return message_pb2.Response(success=False, result="인자 오류: BTS_ID가 필요합니다.")
-
-                bts_id = tokens[0]
-                success, msg = self.admincli.executeBtsDeintegration(bts_id)
-                return message_pb2.Response(success=success, result=msg)
-            
-            elif request.command == "dest-bts-ip":
-                try:
-                    ret = self.ws_manager.set("bts_ip", request.payload)  # 메시지 or True
-                    success = True if ret else False
-                    return message_pb2.Response(success=success, result=ret)
-                except Exception as e:
-                    return message_pb2.Response(success=False, result=f"Exception: {e}")
-
-            elif request.command == "check-ping":
-                ip = self.ws_manager.getBtsIp(request.payload)
-                success, result = check_ping(ip)
-                return message_pb2.Response(success=success, result=result)
-            
-            elif request.command == "update-sw-ver":
-                try:
-                    print(f"[디버그] 수신한 payload 원본: {request.payload}")
-                    payload = json.loads(request.payload)
-                    print(f"[디버그] 파싱된 payload: {payload} (type: {type(payload)})")
-
-                    bts_id = payload["bts_id"]
-                    input_file_name = payload["input_file"]  # 클라이언트는 파일명만 전달함
-
-                    server_base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data", "sw_files")
-                    full_file_path = os.path.abspath(os.path.join(server_base_dir, input_file_name))
-
-                    if not os.path.isfile(full_file_path):
-                        error_msg = f"[서버 오류] 파일이 존재하지 않습니다: {full_file_path}"
-                        print(error_msg)
-                        return message_pb2.Response(success=False, result=error_msg)
-
-                    should_activate = payload.get("shouldActivate", True)
-                    override_ru = payload.get("overrideIndependentRUSW", True)
-
-                    result = self.admincli.softwareUpdate(
-                        bts_id=bts_id,
-                        input_file_path=full_file_path,
-                        shouldActivate=should_activate,
-                        overrideIndependentRUSW=override_ru
-                    )
-
-                    return message_pb2.Response(success=True, result=result)
-
-                except Exception as e:
-                    import traceback
-                    tb_str = traceback.format_exc()
-                    error_msg = f"[update-sw-ver 오류] {str(e)}\n\n[서버 Traceback]\n{tb_str}"
-                    print(error_msg)
-                    return message_pb2.Response(success=False, result=error_msg)
-                    
-            elif request.command == "check-soam":
-                try:
-                    bts_id = request.payload.strip()
-
-                    result = self.admincli.getSwVersionStatus(bts_id)
-                    return message_pb2.Response(success=True, result=result)
-
-                except Exception as e:
-                    return message_pb2.Response(success=False, result=f"[check-soam 오류] {str(e)}")
-                
-            elif request.command == "check-ssh":
-                try:
-                    bts_id = request.payload.strip()
-                    ws = getWorkspace()
-                    bts_ip = ws.get("bts_ip")
-
-                    if not bts_ip:
-                        return message_pb2.Response(success=False, result=f"[{bts_id}]의 IP가 설정되어 있지 않습니다.")
-
-                    ssh_user = "nokia"
-                    cmd = [
-                        "ssh", "-o", "BatchMode=yes", "-o", "ConnectTimeout=5",
-                        f"{ssh_user}@{bts_ip}", "exit"
-                    ]
-
-                    print("[디버그] 실행 명령어:", " ".join(cmd))  # 실제 SSH 명령어 출력
-
-                    result = subprocess.run(
-                        cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-
-                    if result.returncode == 0:
-                        return message_pb2.Response(success=True, result=f"[{bts_id}] SSH 연결 성공 (IP: {bts_ip})")
-                    else:
-                        return message_pb2.Response(success=False, result=f"[{bts_id}] SSH 연결 실패 (IP: {bts_ip})")
-
-                except Exception as e:
-                    return message_pb2.Response(success=False, result=f"[check-ssh 오류] {str(e)}")
-
-            elif request.command == "tgt_bts":
-                return self.helper.handle_tgt_bts(request.payload)
-
-            elif request.command == "no_tgt_bts":
-                return self.helper.handle_no_tgt_bts(request.payload)
-
-            elif request.command == "default":
-                return self.helper.handle_default(request.payload)
-            
-            elif request.command == "list":
-                return self.helper.handle_list(request.payload)
-
-            elif request.command == "commit":
-                return self.helper.handle_commit(request.payload)
-            
-            elif request.command == "commit-cli":
-                return self.helper.handle_commit_cli(request.payload)
-
-            elif request.command == "show_cfg":
-                return self.helper.handle_show_cfg(request.payload)
-            
-            elif request.command == "set-cfg-scf":
-                print("tmpl!!!!!")
-                return self.helper.handle_set_cfg_scf(request.payload)
-
-            elif request.command == "show-glb":
-                return self.helper.handle_show_glb(request.payload)
-
-            elif request.command == "show_sib":
-                return self.helper.handle_show_sib(request.payload)
-
-            elif request.command == "delmo":
-                return self.helper.handle_delmo(request.payload)
-
-            elif request.command == "go_top":
-                return self.helper.handle_go_top(request.payload)
-            
-            elif request.command == "getHwInfo":
-                print("hwinfo!!!!!")
-                data = json.loads(request.payload)
-                result = self.admincli.getHwInfo()
-                return message_pb2.Response(success=True, result=result)
-
-            elif request.command == "commission":
-                print("commission!!!!")
-                data = json.loads(request.payload)
-                ws = getWorkspace()
-                file = ws.get('final_file')
-                skip = data.get("skip", False)
-                activate = data.get("activate", False)
-                result = self.admincli.commission(file, skipParameterRelationErrors=skip, shouldBeActivated=activate)
-                return message_pb2.Response(success=True, result=result)
-
-            elif request.command == "recommission":
-                data = json.loads(request.payload)
-                ws = getWorkspace()
-                file = ws.get('final_file')
-                skip = data.get("skip", False)
-                activate = data.get("activate", False)
-
-                result = self.admincli.recommission(file, skipParameterRelationErrors=skip, shouldBeActivated=activate)
-                return message_pb2.Response(success=True, result=result)
-
-            elif request.command == "activateplan":
-                result = self.admincli.activatePlan(request.payload.strip())
-                return message_pb2.Response(success=True, result=result)
-
-            elif request.command == "generateScf":
-                ws = getWorkspace()
-
-                # 실행 직전 디버깅 출력
-                print(f"[DEBUG] generateScf 실행 직전 workspace 객체: {ws}")
-                if ws:
-                    print(f"[DEBUG] generateScf 실행 직전 bts_id: {ws.get('bts_id')}")
-
-                bts_id = ws.get("bts_id") if ws else None
-                print("bts_id : ", bts_id)
-
-                result = self.admincli.generateScf(bts_id=bts_id)
-                return message_pb2.Response(success=True, result=result)
-            elif request.command == "getRefXml":
-                return self.helper.handle_get_ref_xml(request.payload)
-            elif request.command == "updateCurrentXml":
-                return self.helper.handle_update_current_xml(request.payload)
-            elif request.command == "rulebook":
-                return self.helper.handle_rulebook_file(request.payload)
-            elif request.command == "saveFile":
-                return self.helper.handle_save_file(request.payload)
-            elif request.command == "getFile":
-                return self.helper.handle_get_file(request.payload)
-            elif request.command == "deleteFile":
-                return self.helper.handle_delete_file(request.payload)
-            elif request.command == "listTmpl":
-                return self.helper.handle_list_tmpl(request.payload)
-            elif request.command == "listScript":
-                return self.helper.handle_list_script(request.payload)
-            if request.command == "init-sw-ver":
-                try:
-                    entries = json.loads(request.payload)  # list of [bts_id, sw_ver]
-                    result_text = self.helper.handle_init_sw_ver(entries)
-                    return message_pb2.Response(success=True, result=result_text)
-                except Exception as e:
-                    return message_pb2.Response(success=False, result=f"[init-sw-ver 실패] {e}")
+                    response = handler(request.payload)
+            ok = bool(response.success)
+            return response
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"Exception: {e}")
+        finally:
+            self.stats.record(name, time.perf_counter() - start, ok)
+
+    def _handle_default(self, request):
+        default = self.commands.get("default")
+        if default is None:
+            return message_pb2.Response(success=False, result=f"지원하지 않는 명령입니다: {request.command}")
+        default_line = f"{request.command} {request.payload}".strip()
+        return default(default_line)
+
+    def _timed(self, name: str, context, fn, *args):
+        """전용 RPC를 요청 세션 기준으로 처리하고 처리 시간 기록 (Response/FileResponse의 success로 성공 여부 판단)"""
+        ok = False
+        start = time.perf_counter()
+        try:
+            with self.ws_manager.use_session(session_id_from_context(context)):
+                response = fn(*args)
+            ok = bool(response.success)
+            return response
+        finally:
+            self.stats.record(name, time.perf_counter() - start, ok)
 
+    # ─── BTS 대상 설정 / 연결 확인 ───
+    def _cmd_dest_bts(self, payload):
+        bts_id = payload.strip()
+
+        # workspace 세팅
+        self.ws_manager.setActive(bts_id)
+
+        # na_query 실행
+        self.admincli = AdminCliInterface()
+        ip = self.admincli.getBtsIpFromNaQuery(bts_id)
+
+        # 디버깅 출력
+        if IS_DEBUG:
+            print(f"[DEBUG] 실제 getBtsIpFromNaQuery 결과: {ip}")
+            print(f"[DEBUG] 현재 active_ws bts_id: {self.ws_manager.get('bts_id')}")
+
+        # set-bts로 이미 입력된 IP 가져오기
+        manual_ip = self.ws_manager.get("bts_ip")
+
+        # 조회 실패 판정: ip가 None, 빈 문자열, "0.0.0.0"일 때
+        if not ip or ip == "0.0.0.0":
+            if manual_ip:
+                return message_pb2.Response(
+                    success=True,
+                    result=f"BTS {bts_id} 설정됨 (조회 실패, 수동 입력 IP {manual_ip} 유지)"
+                )
             else:
-                print("else!!!!")
-                default_line = f"{request.command} {request.payload}".strip()
-                return self.helper.handle_default(default_line)
+                return message_pb2.Response(
+                    success=False,
+                    result=f"BTS {bts_id} 설정됨 (IP 조회 실패, 수동 입력 없음)"
+                )
+
+        # 조회 성공한 경우
+        if manual_ip and manual_ip != ip:
+            # 수동 입력과 조회 결과가 다르면 경고 (입력값 유지)
+            msg = (f"[경고] 수동 입력 IP({manual_ip})와 조회된 IP({ip})가 다릅니다. "
+                f"입력값({manual_ip})을 유지합니다.")
+            if IS_DEBUG:
+                print("[DEBUG]", msg)
+            return message_pb2.Response(success=True, result=msg)
+        else:
+            # 수동 입력 없거나 일치 → 조회값 세팅
+            self.ws_manager.set("bts_ip", ip)
+            return message_pb2.Response(success=True, result=f"BTS {bts_id} 설정 -> IP: {ip}")
+
+    def _cmd_resolve_bts_ip(self, payload):
+        """
+        payload: BTS ID 목록 (공백 구분, "--refresh"가 있으면 캐시 무시)
+        여러 BTS IP를 한 번에 병렬 조회 → {bts_id: IP} JSON (조회 실패는 null)
+        """
+        tokens = payload.split()
+        refresh = "--refresh" in tokens
+        bts_ids = [t for t in tokens if t != "--refresh"]
+        if not bts_ids:
+            return message_pb2.Response(success=False, result="조회할 BTS ID가 없습니다.")
+        ips = self.admincli.resolveBtsIps(bts_ids, refresh=refresh)
+        return message_pb2.Response(success=True, result=json.dumps(ips, ensure_ascii=False))
+
+    def _cmd_sweep(self, payload):
+        """
+        payload: {"bts_ids": [...] 또는 "entries": [{"bts_id", "ip"(생략 가능)}], "workbook": autocomm 엑셀 파일명(선택),
+                  "options": {"ping", "ssh", "timeout", "max_parallel", "user"}}
+        결과: 요약/BTS별 결과 JSON (성공 여부는 모든 BTS가 reachable인지)
+        """
+        try:
+            data = json.loads(payload)
+            entries = list(data.get("entries") or [])
+            entries += [{"bts_id": bts_id} for bts_id in data.get("bts_ids") or []]
+            if data.get("workbook"):
+                entries += [{"bts_id": bts_id} for bts_id in bts_ids_from_workbook(data["workbook"])]
+            if not entries:
+                return message_pb2.Response(success=False, result="[sweep 실패] 대상 BTS가 없습니다.")
+            report = run_sweep(entries, data.get("options"))
+            ok = all(row["status"] == "reachable" for row in report["results"])
+            return message_pb2.Response(success=ok, result=json.dumps(report, ensure_ascii=False))
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"[sweep 실패] {e}")
+
+    def _cmd_set_bts(self, payload):
+        try:
+            tokens = shlex.split(payload.strip())
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"인자 파싱 오류: {e}")
+
+        if len(tokens) != 2:
+            return message_pb2.Response(success=False, result="인자 오류: BTS_ID, IP가 필요합니다.")
+
+        bts_id, ip = tokens
+
+        # workspace 세팅 (dest-bts와 동일하게)
+        self.ws_manager.setActive(bts_id)
+        self.ws_manager.set("bts_ip", ip)
+
+        # dest-bts와 동일하게 admincli 초기화 (추후 동작 일관성 보장)
+        self.admincli = AdminCliInterface()
+
+        if IS_DEBUG:
+            print(f"[DEBUG] 수동 세팅된 bts_id: {bts_id}, bts_ip: {ip}")
+            print(f"[DEBUG] 현재 active_ws bts_id: {self.ws_manager.get('bts_id')}")
 
+        return message_pb2.Response(success=True, result=f"BTS {bts_id} 설정 -> IP: {ip}")
+
+    def _cmd_dest_bts_ip(self, payload):
+        try:
+            ret = self.ws_manager.set("bts_ip", payload)  # 메시지 or True
+            success = True if ret else False
+            return message_pb2.Response(success=success, result=ret)
         except Exception as e:
             return message_pb2.Response(success=False, result=f"Exception: {e}")
+
+    def _cmd_check_ping(self, payload):
+        ip = self.ws_manager.getBtsIp(payload)
+        success, result = check_ping(ip)
+        return message_pb2.Response(success=success, result=result)
+
+    def _cmd_check_ssh(self, payload):
+        try:
+            bts_id = payload.strip()
+            ws = getWorkspace()
+            bts_ip = ws.get("bts_ip")
+
+            if not bts_ip:
+                return message_pb2.Response(success=False, result=f"[{bts_id}]의 IP가 설정되어 있지 않습니다.")
+
+            if IS_DEBUG:
+                print("[디버그] 실행 명령어:", " ".join(ssh_command(bts_ip)))  # 실제 SSH 명령어 출력
+
+            ok, _ = check_ssh(bts_ip)
+            if ok:
+                return message_pb2.Response(success=True, result=f"[{bts_id}] SSH 연결 성공 (IP: {bts_ip})")
+            else:
+                return message_pb2.Response(success=False, result=f"[{bts_id}] SSH 연결 실패 (IP: {bts_ip})")
+
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"[check-ssh 오류] {str(e)}")
+
+    def _cmd_check_soam(self, payload):
+        try:
+            bts_id = payload.strip()
+
+            result = self.admincli.getSwVersionStatus(bts_id)
+            return message_pb2.Response(success=True, result=result)
+
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"[check-soam 오류] {str(e)}")
+
+    # ─── admincli 연동 ───
+    def _cmd_auto_inte(self, payload):
+        # payload: "<BTS_ID> <VER> <MR> <NE_NAME> <BTS_IP>"  (shlex-quoted)
+        try:
+            tokens = shlex.split(payload.strip())
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"인자 파싱 오류: {e}")
+
+        if len(tokens) != 5:
+            return message_pb2.Response(success=False, result="인자 오류: BTS_ID, VER, MR, NE_NAME, BTS_IP가 필요합니다.")
+
+        bts_id, ver, mr, ne_name, bts_ip = tokens
+        success, msg = self.admincli.executeBtsIntegration(bts_id, ver, mr, ne_name, bts_ip)
+        return message_pb2.Response(success=success, result=msg)
+
+    def _cmd_auto_deinte(self, payload):
+        # payload: "<BTS_ID>" (shlex-quoted)
+        try:
+            tokens = shlex.split(payload.strip())
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"인자 파싱 오류: {e}")
+
+        if len(tokens) != 1:
+            return message_pb2.Response(success=False, result="인자 오류: BTS_ID가 필요합니다.")
+
+        bts_id = tokens[0]
+        success, msg = self.admincli.executeBtsDeintegration(bts_id)
+        return message_pb2.Response(success=success, result=msg)
+
+    def _cmd_update_sw_ver(self, payload):
+        try:
+            if IS_DEBUG:
+                print(f"[디버그] 수신한 payload 원본: {payload}")
+            payload = json.loads(payload)
+            if IS_DEBUG:
+                print(f"[디버그] 파싱된 payload: {payload} (type: {type(payload)})")
+
+            bts_id = payload["bts_id"]
+            input_file_name = payload["input_file"]  # 클라이언트는 파일명만 전달함
+
+            server_base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data", "sw_files")
+            full_file_path = os.path.abspath(os.path.join(server_base_dir, input_file_name))
+
+            if not os.path.isfile(full_file_path):
+                error_msg = f"[서버 오류] 파일이 존재하지 않습니다: {full_file_path}"
+                print(error_msg)
+                return message_pb2.Response(success=False, result=error_msg)
+
+            should_activate = payload.get("shouldActivate", True)
+            override_ru = payload.get("overrideIndependentRUSW", True)
+
+            result = self.admincli.softwareUpdate(
+                bts_id=bts_id,
+                input_file_path=full_file_path,
+                shouldActivate=should_activate,
+                overrideIndependentRUSW=override_ru
+            )
+
+            return message_pb2.Response(success=True, result=result)
+
+        except Exception as e:
+            import traceback
+            tb_str = traceback.format_exc()
+            error_msg = f"[update-sw-ver 오류] {str(e)}\n\n[서버 Traceback]\n{tb_str}"
+            print(error_msg)
+            return message_pb2.Response(success=False, result=error_msg)
+
+    def _cmd_get_hw_info(self, payload):
+        json.loads(payload)
+        result = self.admincli.getHwInfo()
+        return message_pb2.Response(success=True, result=result)
+
+    def _cmd_commission(self, payload):
+        data = json.loads(payload)
+        ws = getWorkspace()
+        file = ws.get('final_file')
+        skip = data.get("skip", False)
+        activate = data.get("activate", False)
+        with bts_lock(ws.get('bts_id')):
+            result = self.admincli.commission(file, skipParameterRelationErrors=skip, shouldBeActivated=activate)
+        return message_pb2.Response(success=True, result=result)
+
+    def _cmd_recommission(self, payload):
+        data = json.loads(payload)
+        ws = getWorkspace()
+        file = ws.get('final_file')
+        skip = data.get("skip", False)
+        activate = data.get("activate", False)
+
+        with bts_lock(ws.get('bts_id')):
+            result = self.admincli.recommission(file, skipParameterRelationErrors=skip, shouldBeActivated=activate)
+        return message_pb2.Response(success=True, result=result)
+
+    def _cmd_activateplan(self, payload):
+        result = self.admincli.activatePlan(payload.strip())
+        return message_pb2.Response(success=True, result=result)
+
+    def _cmd_generate_scf(self, payload):
+        ws = getWorkspace()
+
+        bts_id = ws.get("bts_id") if ws else None
+
+        # 실행 직전 디버깅 출력
+        if IS_DEBUG:
+            print(f"[DEBUG] generateScf 실행 직전 workspace 객체: {ws}")
+            print(f"[DEBUG] generateScf 실행 직전 bts_id: {bts_id}")
+
+        result = self.admincli.generateScf(bts_id=bts_id)
+        return message_pb2.Response(success=True, result=result)
+
+    def _cmd_init_sw_ver(self, payload):
+        try:
+            entries = json.loads(payload)  # list of [bts_id, sw_ver]
+            result_text = self.helper.handle_init_sw_ver(entries)
+            return message_pb2.Response(success=True, result=result_text)
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"[init-sw-ver 실패] {e}")
+
+    def _cmd_fleet_commission(self, payload):
+        """
+        payload: {"entries": [{"bts_id", "file"(생략 가능), "ip"(생략 가능)}, ...],
+                  "options": {"max_parallel", "retries", "backoff", "skip", "activate", "recommission"}}
+        결과: 요약/BTS별 결과/보고서 파일명 JSON (성공 여부는 모든 BTS가 success인지)
+        """
+        try:
+            data = json.loads(payload)
+            entries = data.get("entries") or []
+            if not entries:
+                return message_pb2.Response(success=False, result="[fleet-commission 실패] 대상 BTS가 없습니다.")
+            report = run_fleet_commission(entries, data.get("options"))
+            ok = all(row.get("status") in ("success", "skipped") for row in report["results"])
+            return message_pb2.Response(success=ok, result=json.dumps(report, ensure_ascii=False))
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"[fleet-commission 실패] {e}")
+
+    # ─── 서버 상태 ───
+    def _cmd_server_stats(self, payload):
+        """
+        payload: "" → 명령별 처리 시간 표, "json" → 통계 JSON, "reset" → 통계 초기화
+        """
+        option = payload.strip().lower()
+        if option == "reset":
+            self.stats.reset()
+            return message_pb2.Response(success=True, result="서버 명령 통계를 초기화했습니다.")
+
+        cache_stats = self.helper.file_cache.stats()
+        pool_stats = admincli_pool_stats()
+        job_stats = self.jobs.stats()
+        ip_stats = bts_ip_cache().stats()
+        if option == "json":
+            data = {"commands": self.stats.snapshot(), "file_cache": cache_stats, "admincli_pool": pool_stats,
+                    "jobs": job_stats, "bts_ip_cache": ip_stats}
+            return message_pb2.Response(success=True, result=json.dumps(data, ensure_ascii=False))
+
+        cache_line = (
+            f"[파일 캐시] {cache_stats['entries']}개 항목, {cache_stats['bytes']}/{cache_stats['max_bytes']} bytes, "
+            f"hit {cache_stats['hits']} / miss {cache_stats['misses']} (hit율 {cache_stats['hit_rate']}), "
+            f"제거 {cache_stats['evictions']}"
+        )
+        pool_line = f"[admin-cli pool] worker {len(pool_stats)}개" + "".join(
+            f"\n  {target}: {'alive' if w['alive'] else 'dead'}{', busy' if w['busy'] else ''}, "
+            f"요청 {w['requests']}, 기동 {w['starts']}, idle {w['idle_s']}s"
+            for target, w in pool_stats.items()
+        )
+        job_line = "[작업] " + (", ".join(f"{state} {n}" for state, n in job_stats.items()) or "없음")
+        ip_line = (
+            f"[IP 캐시] {ip_stats['entries']}개 항목 (조회 실패 {ip_stats['negative']}), "
+            f"hit {ip_stats['hits']} / miss {ip_stats['misses']} / 동시 조회 공유 {ip_stats['shared']} "
+            f"(hit율 {ip_stats['hit_rate']}), 오류 {ip_stats['errors']}"
+        )
+        return message_pb2.Response(
+            success=True,
+            result=f"{self.stats.format_table()}\n{cache_line}\n{pool_line}\n{job_line}\n{ip_line}")
+
+    # ─── 파일 전송 전용 RPC (bytes 그대로 송수신, base64/"||" 파싱 없음) ───
+    def GetFile(self, request, context):
+        if IS_DEBUG:
+            print(f"command: GetFile ({request.purpose}) {request.filename}")
+        try:
+            return self._timed("GetFile", context, self.helper.handle_get_file_request, request)
+        except Exception as e:
+            return message_pb2.FileResponse(success=False, result=f"Exception: {e}")
+
+    def SaveFile(self, request, context):
+        if IS_DEBUG:
+            print(f"command: SaveFile ({request.purpose}) {request.filename}")
+        try:
+            return self._timed("SaveFile", context, self.helper.handle_save_file_request, request)
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"Exception: {e}")
+
+    def Commit(self, request, context):
+        if IS_DEBUG:
+            print(f"command: Commit ({request.command_type}) {request.filename}")
+        try:
+            return self._timed("Commit", context, self.helper.handle_commit_request, request)
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"Exception: {e}")
+
+    def DownloadFile(self, request, context):
+        if IS_DEBUG:
+            print(f"command: DownloadFile ({request.purpose}) {request.filename}")
+        # 스트림 전체(마지막 chunk 전송까지)를 한 번의 처리 시간으로 기록
+        ok = False
+        start = time.perf_counter()
+        try:
+            with self.ws_manager.use_session(session_id_from_context(context)):
+                for chunk in self.helper.handle_download_file(request):
+                    if chunk.error:
+                        ok = False
+                    elif chunk.last:
+                        ok = True
+                    yield chunk
+        finally:
+            self.stats.record("DownloadFile", time.perf_counter() - start, ok)
+
+    def UploadFile(self, request_iterator, context):
+        if IS_DEBUG:
+            print("command: UploadFile")
+        try:
+            return self._timed("UploadFile", context, self.helper.handle_upload_file, request_iterator)
+        except Exception as e:
+            return message_pb2.Response(success=False, result=f"Exception: {e}")
+
+    # ─── 백그라운드 작업 (commission 등 오래 걸리는 admin-cli 명령) ───
+    def SubmitJob(self, request, context):
+        if IS_DEBUG:
+            print(f"command: SubmitJob ({request.command})")
+        if request.command not in JOB_COMMANDS:
+            return message_pb2.JobInfo(
+                command=request.command, state="rejected",
+                result=f"백그라운드 작업으로 실행할 수 없는 명령입니다: {request.command}")
+
+        session_id = session_id_from_context(context)
+        with self.ws_manager.use_session(session_id):
+            ws = getWorkspace()
+            bts_id = str(ws.get("bts_id") or "") if ws else ""
+
+        handler = self.commands[request.command]
+        payload = request.payload
+
+        def run():
+            # 등록 시점 workspace를 복사한 작업 전용 세션에서 실행 (실행 중 dest-bts를 바꿔도 영향 없음)
+            job_session = f"{session_id}#job#{current_job().job_id}"
+            self.ws_manager.fork_session(session_id, job_session)
+            try:
+                with self.ws_manager.use_session(job_session):
+                    response = handler(payload)
+                return response.success, response.result
+            finally:
+                self.ws_manager.drop_session(job_session)
+
+        def on_done(job):
+            elapsed = (job.finished_at - job.started_at) if job.started_at else 0.0
+            self.stats.record(f"job:{job.command}", elapsed, job.success)
+
+        job = self.jobs.submit(request.command, run, session_id=session_id, bts_id=bts_id, on_done=on_done)
+        return self._job_info(job)
+
+    def PollJob(self, request, context):
+        job = self.jobs.get(request.job_id)
+        polled = self.jobs.poll(request.job_id, request.from_seq) if job else None
+        if polled is None:
+            return message_pb2.JobEvents(
+                events=[message_pb2.JobEvent(kind="error", line=f"작업이 없습니다: {request.job_id}")], done=True)
+        events, done, waited = polled
+        response = message_pb2.JobEvents(done=done)
+        for event in events:
+            response.events.append(self._job_event(job, *event))
+        if not waited and not events:
+            # 대기 자리가 없어 바로 반환 → 클라이언트가 잠시 쉬었다가 다시 요청
+            response.retry_after = 1.0
+        return response
+
+    def WatchJob(self, request, context):
+        job = self.jobs.get(request.job_id)
+        if job is None:
+            yield message_pb2.JobEvent(kind="error", line=f"작업이 없습니다: {request.job_id}")
+            return
+        with self.jobs.wait_slot() as acquired:
+            if not acquired:
+                context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "작업 출력 수신 요청이 너무 많습니다. 잠시 후 다시 시도하세요.")
+            for event in self.jobs.watch(request.job_id, request.from_seq, context.is_active):
+                yield self._job_event(job, *event)
+
+    def CancelJob(self, request, context):
+        job = self.jobs.cancel(request.job_id)
+        if job is None:
+            return message_pb2.JobInfo(job_id=request.job_id, state="rejected",
+                                       result=f"작업이 없습니다: {request.job_id}")
+        return self._job_info(job)
+
+    def ListJobs(self, request, context):
+        session_id = None if request.all_sessions else session_id_from_context(context)
+        return message_pb2.JobList(jobs=[self._job_info(job) for job in self.jobs.list(session_id)])
+
+    @staticmethod
+    def _job_info(job):
+        return message_pb2.JobInfo(**job.info())
+
+    @classmethod
+    def _job_event(cls, job, seq, kind, state, line):
+        event = message_pb2.JobEvent(seq=seq, kind=kind, state=state, line=line)
+        if kind == "state" and state in FINAL_STATES:
+            event.job.CopyFrom(cls._job_info(job))
+        return event
@@ -0,0 +1,262 @@
+import contextvars
+import itertools
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from cli_server.common.utils.singleton import Singleton
+from cli_server.settings import JOB_MAX_WORKERS, JOB_RETENTION, JOB_MAX_EVENTS, JOB_POLL_WAIT, JOB_WATCH_MAX_WAITERS
+
+# 오래 걸리는 명령(commission/recommission/generateScf/update-sw-ver)의 백그라운드 작업 관리
+# - submit()은 작업을 등록만 하고 바로 반환, 실제 실행은 gRPC 스레드가 아닌 작업 전용 스레드 풀에서 처리
+# - 작업마다 출력 줄/상태 변화를 순번(seq)이 붙은 이벤트로 쌓고, poll()/watch()로 이어서 받아 감
+#   (클라이언트 연결이 끊겨도 작업은 계속 실행, from_seq로 다시 붙어서 이어 받기 가능)
+# - poll()은 최대 JOB_POLL_WAIT초만 기다리고 반환 (gRPC 스레드를 작업이 끝날 때까지 붙잡지 않음)
+# - 이벤트를 기다리는 poll()/watch()는 동시에 JOB_WATCH_MAX_WAITERS개까지만 (나머지 gRPC 스레드는 SendCommand용)
+# - 실행 중인 코드는 current_job()으로 자기 작업을 찾아 emit()으로 출력 전달,
+#   set_canceller()로 취소 시 호출할 함수(admin-cli 프로세스 종료 등)를 등록
+# - 끝난 작업은 JOB_RETENTION 동안만 보관
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINAL_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+_current_job = contextvars.ContextVar("nocli_job", default=None)
+
+
+def current_job():
+    """현재 스레드가 실행 중인 작업 (작업 밖이면 None)"""
+    return _current_job.get()
+
+
+@contextmanager
+def bind_job(job):
+    """with 블록 안에서 current_job()이 job을 반환 (작업이 직접 만든 스레드에서 작업을 이어받을 때)"""
+    token = _current_job.set(job)
+    try:
+        yield job
+    finally:
+        _current_job.reset(token)
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, job_id: str, command: str, session_id: str, bts_id: str = ""):
+        self.job_id = job_id
+        self.command = command
+        self.session_id = session_id
+        self.bts_id = bts_id or ""
+        self.state = QUEUED
+        self.success = False
+        self.result = ""
+        self.created_at = time.time()
+        self.started_at = 0.0
+        self.finished_at = 0.0
+        self.cancel_requested = False
+        self.events = []  # (seq, kind, state, line)
+        self._seq = itertools.count(1)
+        self._cond = threading.Condition()
+        self._canceller = None
+        self._add_event("state", QUEUED, "")
+
+    # ---------- 이벤트 ----------
+    def _add_event(self, kind: str, state: str, line: str):
+        """self._cond 밖에서 호출"""
+        with self._cond:
+            self.events.append((next(self._seq), kind, state, line))
+            if len(self.events) > JOB_MAX_EVENTS:
+                del self.events[:len(self.events) - JOB_MAX_EVENTS]
+            self._cond.notify_all()
+
+    def emit(self, text: str):
+        """실행 중 출력 전달 (여러 줄이면 줄 단위로 나눠서 기록)"""
+        for line in str(text).splitlines():
+            self._add_event("output", self.state, line)
+
+    def set_state(self, state: str, success: bool = False, result: str = ""):
+        if state in FINAL_STATES:
+            self.success = success
+            self.result = result
+            self.finished_at = time.time()
+        elif state == RUNNING:
+            self.started_at = time.time()
+        self.state = state
+        self._add_event("state", state, "")
+
+    @property
+    def done(self) -> bool:
+        return self.state in FINAL_STATES
+
+    def wait_events(self, from_seq: int, timeout: float):
+        """from_seq 이후 이벤트를 반환 (없으면 timeout까지 대기). 반환: (이벤트 목록, 종료 여부)"""
+        with self._cond:
+            if not self._events_after(from_seq) and not self.done:
+                self._cond.wait(timeout)
+            return self._events_after(from_seq), self.done
+
+    def _events_after(self, from_seq: int):
+        return [e for e in self.events if e[0] > from_seq]
+
+    # ---------- 취소 ----------
+    def set_canceller(self, fn):
+        """취소 시 호출할 함수 등록 (None이면 해제). 이미 취소 요청된 상태면 바로 호출"""
+        with self._cond:
+            self._canceller = fn
+            call_now = fn is not None and self.cancel_requested
+        if call_now:
+            fn()
+
+    def cancel(self):
+        with self._cond:
+            self.cancel_requested = True
+            fn = self._canceller
+        if fn is not None:
+            fn()
+
+    def check_cancelled(self):
+        if self.cancel_requested:
+            raise JobCancelled()
+
+    def info(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "command": self.command,
+            "state": self.state,
+            "success": self.success,
+            "result": self.result,
+            "bts_id": self.bts_id,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager(metaclass=Singleton):
+    def __init__(self, max_workers: int = JOB_MAX_WORKERS, retention: float = JOB_RETENTION):
+        self.retention = retention
+        self.jobs = {}  # job_id → Job (등록 순서)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="job")
+        self._waiters = threading.BoundedSemaphore(max(1, JOB_WATCH_MAX_WAITERS))
+
+    def submit(self, command: str, fn, session_id: str = "", bts_id: str = "", on_done=None) -> Job:
+        """
+        fn()을 작업 스레드에서 실행하고 바로 Job을 반환
+        fn은 (success, result)를 반환, on_done(job)은 작업이 끝난 뒤 호출 (통계 기록 등)
+        """
+        job = Job(uuid.uuid4().hex[:12], command, session_id, bts_id)
+        with self._lock:
+            self._cleanup()
+            self.jobs[job.job_id] = job
+        self._executor.submit(self._run, job, fn, on_done)
+        return job
+
+    def _run(self, job: Job, fn, on_done):
+        try:
+            if job.cancel_requested:
+                job.set_state(CANCELLED, result="실행 전에 취소되었습니다.")
+                return
+            job.set_state(RUNNING)
+            try:
+                with bind_job(job):
+                    success, result = fn()
+            except JobCancelled:
+                job.set_state(CANCELLED, result="작업이 취소되었습니다.")
+                return
+            except Exception as e:
+                job.set_state(FAILED, result=f"Exception: {e}")
+                return
+            if job.cancel_requested:
+                job.set_state(CANCELLED, result=f"작업이 취소되었습니다.\n{result}")
+            else:
+                job.set_state(SUCCEEDED if success else FAILED, success=bool(success), result=result)
+        finally:
+            job.set_canceller(None)
+            if on_done is not None:
+                try:
+                    on_done(job)
+                except Exception as e:
+                    print(f"[job] {job.job_id} 완료 처리 오류: {e}")
+
+    def get(self, job_id: str):
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str):
+        """작업 취소 요청. 대기 중이면 실행하지 않고, 실행 중이면 등록된 취소 함수를 호출"""
+        job = self.get(job_id)
+        if job is not None and not job.done:
+            job.cancel()
+        return job
+
+    def list(self, session_id: str = None):
+        """등록 순서대로 작업 목록 (session_id를 주면 그 세션이 등록한 작업만)"""
+        with self._lock:
+            self._cleanup()
+            jobs = list(self.jobs.values())
+        if session_id is not None:
+            jobs = [j for j in jobs if j.session_id == session_id]
+        return jobs
+
+    @contextmanager
+    def wait_slot(self):
+        """이벤트 대기 자리 하나를 잡음 (with 블록 값: 잡았으면 True, 자리가 없으면 바로 False)"""
+        acquired = self._waiters.acquire(blocking=False)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self._waiters.release()
+
+    def poll(self, job_id: str, from_seq: int = 0, wait: float = JOB_POLL_WAIT):
+        """
+        from_seq 이후 이벤트를 한 번에 반환 (없으면 최대 wait초 기다림, 대기 자리가 없으면 기다리지 않음)
+        반환: (이벤트 목록, 종료 여부, 기다렸는지) / 작업이 없으면 None
+        """
+        job = self.get(job_id)
+        if job is None:
+            return None
+        with self.wait_slot() as waited:
+            events, done = job.wait_events(from_seq, wait if waited else 0)
+        return events, done, waited
+
+    def watch(self, job_id: str, from_seq: int = 0, is_active=None, poll: float = 5.0):
+        """
+        from_seq 이후 이벤트를 생성 (작업이 끝나고 남은 이벤트를 모두 보내면 종료)
+        is_active()가 False가 되면 (클라이언트 연결 끊김) 작업은 그대로 두고 중단
+        """
+        job = self.get(job_id)
+        if job is None:
+            return
+        seq = from_seq
+        while True:
+            events, done = job.wait_events(seq, poll)
+            for event in events:
+                seq = event[0]
+                yield event
+            if done and not events:
+                return
+            if is_active is not None and not is_active():
+                return
+
+    def stats(self) -> dict:
+        with self._lock:
+            jobs = list(self.jobs.values())
+        counts = {}
+        for job in jobs:
+            counts[job.state] = counts.get(job.state, 0) + 1
+        return counts
+
+    def _cleanup(self):
+        """보관 시간이 지난 끝난 작업 정리 (self._lock 안에서 호출)"""
+        now = time.time()
+        for job_id, job in list(self.jobs.items()):
+            if job.done and now - job.finished_at > self.retention:
+                del self.jobs[job_id]
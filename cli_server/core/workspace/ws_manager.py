@@ -1,53 +1,165 @@
+import contextvars
+import copy
+import threading
+import time
+from contextlib import contextmanager
 from cli_server.common.utils.singleton import Singleton
 from cli_server.core.workspace.workspace import WorkSpace
 
-class WsManager(metaclass=Singleton):
-    ws_list = {}
-    active_ws = None
-    active_id = None
+# 클라이언트 세션별 workspace 관리
+# - 클라이언트는 gRPC metadata(SESSION_METADATA_KEY)에 세션 ID를 실어 보냄
+# - 서버는 RPC마다 use_session()으로 현재 스레드의 세션을 지정하고,
+#   WsManager/getWorkspace()는 그 세션의 ws_list/active_ws만 사용 (다른 운용자의 dest-bts에 영향 없음)
+# - 세션 ID가 없는 요청(구버전 클라이언트)은 DEFAULT_SESSION 하나를 함께 사용
+# - 세션별 lock으로 같은 세션 안의 동시 변경도 보호, 오래 사용하지 않은 세션은 정리
+
+SESSION_METADATA_KEY = "x-nocli-session"
+DEFAULT_SESSION = ""
+SESSION_IDLE_TIMEOUT = 12 * 60 * 60
+
+_current_session = contextvars.ContextVar("nocli_session", default=DEFAULT_SESSION)
+
+
+def session_id_from_context(context) -> str:
+    """gRPC context의 metadata에서 세션 ID를 꺼냄 (없으면 DEFAULT_SESSION)"""
+    if context is None:
+        return DEFAULT_SESSION
+    for key, value in context.invocation_metadata() or ():
+        if key == SESSION_METADATA_KEY:
+            return value
+    return DEFAULT_SESSION
 
+
+def current_session_id() -> str:
+    return _current_session.get()
+
+
+class _Session:
     def __init__(self):
-        self.ws_list={}
+        self.ws_list = {}
         self.active_ws = None
         self.active_id = None
+        self.last_used = time.monotonic()
+        self.lock = threading.RLock()
+
+
+class WsManager(metaclass=Singleton):
+    def __init__(self):
+        self.sessions = {}
+        self._lock = threading.Lock()
+        self._last_cleanup = time.monotonic()
+
+    @contextmanager
+    def use_session(self, session_id: str = DEFAULT_SESSION):
+        """with 블록 안에서 현재 스레드가 session_id 세션의 workspace를 사용"""
+        token = _current_session.set(session_id or DEFAULT_SESSION)
+        try:
+            yield self._session()
+        finally:
+            _current_session.reset(token)
+
+    def fork_session(self, source_id: str, session_id: str):
+        """
+        source_id 세션의 active workspace를 복사해 session_id 세션을 만듦
+        (백그라운드 작업이 등록 시점의 BTS 설정으로 실행되고, 이후 dest-bts 변경의 영향을 받지 않도록)
+        """
+        with self._lock:
+            source = self.sessions.get(source_id)
+            session = self.sessions[session_id] = _Session()
+        if source is None:
+            return
+        with source.lock:
+            active_ws, active_id = source.active_ws, source.active_id
+            if active_ws is None:
+                return
+            ws = copy.copy(active_ws)
+            ws.bts = dict(active_ws.bts)
+        session.ws_list[active_id] = ws
+        session.active_ws = ws
+        session.active_id = active_id
+
+    def drop_session(self, session_id: str):
+        with self._lock:
+            self.sessions.pop(session_id, None)
+
+    def _session(self) -> _Session:
+        session_id = _current_session.get()
+        now = time.monotonic()
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is None:
+                session = self.sessions[session_id] = _Session()
+            session.last_used = now
+            if now - self._last_cleanup > 60:
+                self._cleanup(now)
+        return session
+
+    def _cleanup(self, now):
+        self._last_cleanup = now
+        for session_id, session in list(self.sessions.items()):
+            if session_id != DEFAULT_SESSION and now - session.last_used > SESSION_IDLE_TIMEOUT:
+                del self.sessions[session_id]
+
+    # ─── 현재 세션 기준 (기존 인터페이스 유지) ───
+    @property
+    def ws_list(self):
+        return self._session().ws_list
+
+    @property
+    def active_ws(self):
+        return self._session().active_ws
+
+    @property
+    def active_id(self):
+        return self._session().active_id
 
     def setActive(self, id):
         print("setActive Entered")
-        if self.ws_list and id in self.ws_list:
-            self.active_ws = self.ws_list[id]
-        else:
-            temp_ws = WorkSpace()
-            temp_ws.set('bts_id', id)
-            self.ws_list[id] = temp_ws
-            self.active_ws = temp_ws
-        self.active_id = id
+        session = self._session()
+        with session.lock:
+            if session.ws_list and id in session.ws_list:
+                session.active_ws = session.ws_list[id]
+            else:
+                temp_ws = WorkSpace()
+                temp_ws.set('bts_id', id)
+                session.ws_list[id] = temp_ws
+                session.active_ws = temp_ws
+            session.active_id = id
         return 'RESULT::OK'
 
     def getActive(self, id):
-        if id in self.ws_list:
-            return self.ws_list[id]
+        ws_list = self.ws_list
+        if id in ws_list:
+            return ws_list[id]
 
     def getBtsIp(self, id=None):
-        if not id:
-            id = self.active_id
+        session = self._session()
+        with session.lock:
+            if not id:
+                id = session.active_id
 
-        if id:
-            ws =  self.ws_list[id]
-            return ws.get('bts_ip')
+            if id:
+                ws = session.ws_list[id]
+                return ws.get('bts_ip')
 
     def set(self, key, val):
-        if self.active_ws:
-            self.active_ws.set(key,val)
+        session = self._session()
+        with session.lock:
+            if session.active_ws:
+                session.active_ws.set(key, val)
 
         return 'RESULT::OK'
 
     def get(self, key):
-        if self.active_ws:
-            return self.active_ws.get(key)
+        active_ws = self.active_ws
+        if active_ws:
+            return active_ws.get(key)
         return 'RESULT::OK'
 
     def remove_ws(self, id):
-        self.ws_list[id] = None
+        session = self._session()
+        with session.lock:
+            session.ws_list[id] = None
         return 'RESULT::OK'
 
 def getWorkspace():
@@ -1,9 +1,16 @@
+import copy
 import subprocess
+import threading
 import json
 import os
 import toml
 import re
 from cli_server.core.workspace.ws_manager import getWorkspace, WsManager
+from cli_server.settings import ADMINCLI_COMMAND, ADMINCLI_POOL, IS_DEBUG
+from cli_server.settings import NA_QUERY_TIMEOUT, NA_QUERY_CACHE_TTL, NA_QUERY_NEGATIVE_TTL, NA_QUERY_MAX_PARALLEL
+from cli_server.common.utils.bts_ip_cache import BtsIpCache
+from cli_server.ext.admincli_pool import get_admincli_pool, AdminCliStartError, AdminCliWorkerError
+from cli_server.core.job.job_manager import current_job
 
 class AdminCliInterface:
     request_id = 1
@@ -13,7 +20,7 @@ class AdminCliInterface:
     bts_host_port = 443
     delteDN = None
     admincli_result = None
-    base_command = './bin/admincli/admin-cli.sh --bts-username={} --bts-password={} --bts-host={} --bts-port={} --format=human'
+    base_command = ADMINCLI_COMMAND + ' --bts-username={} --bts-password={} --bts-host={} --bts-port={} --format=human'
     command_ext = '--input-file={}'
     command_ext_output = '--output-file={}'
     command_data_simple_prefix = '--data='
@@ -37,166 +44,137 @@ class AdminCliInterface:
         ws = getWorkspace()
         return ws.get("bts_ip")
 
-    def getHwInfo(self):
-        command_data = ''
-        command_new = self.base_command.format(self.admincli_id, self.admincli_pw, self.bts_host_ip, self.bts_host_port)
-        command_data_ext = self.command_data_simple_dict
-        command_data_ext['requestId'] = self.request_id
-        command_data_ext['parameters']['name'] = 'getHwInfo'
-        command_data = json.dumps(command_data_ext)
-        command_final = command_new + ' ' + self.command_data_simple_prefix + '\'' + command_data + '\''
-        print(command_final)
-        self.request_id += 1
-        ret = subprocess.run(command_final.split(), capture_output=True )
-        ret_str = ret.stdout.decode()
-        #self.admincli_result = AdminCliResult(ret_str)
-        return ret_str
+    def _run_admincli(self, request: dict, input_file: str = None, output_file: str = None, with_stderr: bool = False) -> str:
+        """
+        admin-cli 요청 실행. 상주 worker pool을 우선 사용하고,
+        worker를 띄울 수 없을 때(요청 전송 전)만 기존처럼 admin-cli를 1회 실행
+        백그라운드 작업 안에서 호출되면 응답/출력을 받는 즉시 작업 이벤트로 전달하고, 작업 취소 시 admin-cli를 종료
+        """
+        job = current_job()
+        if ADMINCLI_POOL:
+            try:
+                responses = get_admincli_pool().execute(
+                    self.bts_host_ip, self.bts_host_port, self.admincli_id, self.admincli_pw, request,
+                    input_file=input_file, output_file=output_file,
+                    on_response=(lambda body: job.emit(json.dumps(body, ensure_ascii=False))) if job else None,
+                    set_canceller=job.set_canceller if job else None,
+                )
+                ret_str = "\n".join(json.dumps(r, indent=2, ensure_ascii=False) for r in responses)
+                print(ret_str)
+                return ret_str
+            except AdminCliStartError as e:
+                print(f"[AdminCLI pool] {e} → 1회 실행으로 처리")
+            except AdminCliWorkerError as e:
+                print(f"[AdminCLI pool] {e}")
+                return f"[AdminCLI 오류] {e}"
+
+        return self._run_admincli_once(request, input_file, output_file, with_stderr)
+
+    def _run_admincli_once(self, request: dict, input_file: str = None, output_file: str = None, with_stderr: bool = False) -> str:
+        command = self.base_command.format(self.admincli_id, self.admincli_pw, self.bts_host_ip, self.bts_host_port).split()
+        if input_file:
+            command.append(self.command_ext.format(input_file))
+        if output_file:
+            command.append(self.command_ext_output.format(output_file))
+        command.append(self.command_data_simple_prefix + json.dumps(request))
+        print(" ".join(command))
+
+        job = current_job()
+        if job is None:
+            ret = subprocess.run(command, capture_output=True)
+            stdout_str = ret.stdout.decode()
+            stderr_str = ret.stderr.decode()
+        else:
+            stdout_str, stderr_str = self._run_streaming(command, job)
+        print(stdout_str)
 
-    def commission(self, file, skipParameterRelationErrors=False, shouldBeActivated=False):
-        command_data = ''
-        command_new = self.base_command.format(self.admincli_id, self.admincli_pw, self.bts_host_ip, self.bts_host_port)
-        command_ext = self.command_ext.format(file)
-        command_data_ext = self.command_data_commission_dict
-        command_data_ext['requestId'] = self.request_id
-        command_data_ext['parameters']['parameters']['skipParameterRelationErrors'] = skipParameterRelationErrors
-        command_data_ext['parameters']['parameters']['shouldBeActivated'] = shouldBeActivated
-        command_data = json.dumps(command_data_ext)
-        command_final = command_new + ' ' + command_ext + ' ' +  self.command_data_simple_prefix + '\'' + command_data + '\''
+        if with_stderr and stderr_str:
+            print("[AdminCLI] 오류 내용 (stderr):")
+            print(stderr_str)
+            return stdout_str + "\n[stderr]\n" + stderr_str
+        return stdout_str
+
+    def _run_streaming(self, command: list, job):
+        """admin-cli stdout을 줄 단위로 작업 이벤트에 전달하면서 실행 (작업 취소 시 프로세스 kill)"""
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stderr_parts = []
+        reader = threading.Thread(target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True)
+        reader.start()
+        job.set_canceller(proc.kill)
+        lines = []
+        try:
+            for raw in proc.stdout:
+                line = raw.decode(errors="replace")
+                lines.append(line)
+                job.emit(line)
+            proc.wait()
+            reader.join()
+        finally:
+            job.set_canceller(None)
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+        return "".join(lines), b"".join(stderr_parts).decode(errors="replace")
+
+    def _next_request(self, template: dict) -> dict:
+        # 클래스 속성 dict는 공유되므로 요청마다 복사해서 사용 (동시 요청 간 값 섞임 방지)
+        request = copy.deepcopy(template)
+        request['requestId'] = self.request_id
         self.request_id += 1
-        print(command_final)
-        ret = subprocess.run(command_final, capture_output=True, shell=True)
-        ret_str = ret.stdout.decode()
-        print(ret_str)
+        return request
 
-        #self.admincli_result = AdminCliResult(ret_str)
-        return ret_str
+    def getHwInfo(self):
+        request = self._next_request(self.command_data_simple_dict)
+        request['parameters']['name'] = 'getHwInfo'
+        return self._run_admincli(request)
 
-    def recommission(self, file, skipParameterRelationErrors=False, shouldBeActivated=False):
-        command_data = ''
-        command_new = self.base_command.format(self.admincli_id, self.admincli_pw, self.bts_host_ip, self.bts_host_port)
-        command_ext = self.command_ext.format(file)
-        command_data_ext = self.command_data_recommission_dict
-        command_data_ext['requestId'] = self.request_id
-        command_data_ext['parameters']['parameters']['skipParameterRelationErrors'] = skipParameterRelationErrors
-        command_data_ext['parameters']['parameters']['shouldBeActivated'] = shouldBeActivated
-        command_data = json.dumps(command_data_ext)
-        command_final = command_new + ' ' + command_ext + ' ' +  self.command_data_simple_prefix + '\'' + command_data + '\''
-        self.request_id += 1
-        print(command_final)
-        ret = subprocess.run(command_final, capture_output=True, shell=True)
-        ret_str = ret.stdout.decode()
-        print(ret_str)
+    def commission(self, file, skipParameterRelationErrors=False, shouldBeActivated=False):
+        request = self._next_request(self.command_data_commission_dict)
+        request['parameters']['parameters']['skipParameterRelationErrors'] = skipParameterRelationErrors
+        request['parameters']['parameters']['shouldBeActivated'] = shouldBeActivated
+        return self._run_admincli(request, input_file=file)
 
-        #self.admincli_result = AdminCliResult(ret_str)
-        return ret_str
+    def recommission(self, file, skipParameterRelationErrors=False, shouldBeActivated=False):
+        request = self._next_request(self.command_data_recommission_dict)
+        request['parameters']['parameters']['skipParameterRelationErrors'] = skipParameterRelationErrors
+        request['parameters']['parameters']['shouldBeActivated'] = shouldBeActivated
+        return self._run_admincli(request, input_file=file)
 
     def activatePlan(self, deltaDN):
-        command_data = ''
-        command_new = self.base_command.format(self.admincli_id, self.admincli_pw, self.bts_host_ip, self.bts_host_port)
-        command_data_ext = self.command_data_activateplan_dict
-        command_data_ext['requestId'] = self.request_id
-        command_data_ext['parameters']['parameters']['deltaDN'] = deltaDN
-        command_data = json.dumps(command_data_ext)
-        command_final = command_new + ' ' + self.command_data_simple_prefix + '\'' + command_data + '\''
-        self.request_id += 1
-        print(command_final)
-        ret = subprocess.run(command_final, capture_output=True, shell=True )
-        ret_str = ret.stdout.decode()
-        print(ret_str)
-
-        #self.admincli_result = AdminCliResult(ret_str)
-        return ret_str
+        request = self._next_request(self.command_data_activateplan_dict)
+        request['parameters']['parameters']['deltaDN'] = deltaDN
+        return self._run_admincli(request)
 
     def generateScf(self, bts_id):
         folder_path = f'./cli_server/data/received/{bts_id}'
         os.makedirs(folder_path, exist_ok=True)
         file_path = os.path.join(folder_path, 'genScf.xml')
-        
-        command_data = ''
-        command_new = self.base_command.format(self.admincli_id, self.admincli_pw, self.bts_host_ip, self.bts_host_port)
-        command_ext = self.command_ext_output.format(file_path)
-        print("command_ext : ", command_ext)
-        
-        command_data_ext = self.command_data_generatescf_dict
-        command_data_ext['requestId'] = self.request_id
-        command_data = json.dumps(command_data_ext)
-        
-        command_final = command_new + ' ' + command_ext + ' ' +  self.command_data_simple_prefix + '\'' + command_data + '\''
-        self.request_id += 1
-        
-        print(json.dumps(command_final, indent=2))
-        print("commnad_final : ", command_final)
-        
-        ret = subprocess.run(["bash", "-c", command_final], capture_output=True)
-        ret_str = ret.stdout.decode()
-        print("ret_str : ", ret_str)
 
-        return ret_str
+        request = self._next_request(self.command_data_generatescf_dict)
+        return self._run_admincli(request, output_file=file_path)
 
     def softwareUpdate(self, bts_id, input_file_path, shouldActivate=True, overrideIndependentRUSW=True):
-        # 기본 명령어 조립
-        command_new = self.base_command.format(self.admincli_id, self.admincli_pw, self.bts_host_ip, self.bts_host_port)
-        # 실제 zip 파일 경로를 input-file에 넣음
-        command_ext = self.command_ext.format(input_file_path)
+        request = self._next_request(self.command_data_softwareupdate_dict)
+        request["parameters"]["parameters"]["shouldActivate"] = shouldActivate
+        request["parameters"]["parameters"]["overrideIndependentRUSW"] = overrideIndependentRUSW
 
-        # dict 복사 후 값 주입
-        command_data_ext = self.command_data_softwareupdate_dict.copy()
-        command_data_ext["requestId"] = self.request_id
-        command_data_ext["parameters"]["parameters"]["shouldActivate"] = shouldActivate
-        command_data_ext["parameters"]["parameters"]["overrideIndependentRUSW"] = overrideIndependentRUSW
+        print(f"[AdminCLI] softwareUpdate 실행: {bts_id} ({input_file_path})")
+        return self._run_admincli(request, input_file=input_file_path, with_stderr=True)
 
-        self.request_id += 1
-        # JSON 문자열로 변환
-        command_data = json.dumps(command_data_ext)
-
-        # 최종 명령어 조합
-        command_final = f"{command_new} {command_ext} {self.command_data_simple_prefix}'{command_data}'"
-
-        print("[AdminCLI] 실행 명령어:")
-        print(command_final)
-
-        ret = subprocess.run(command_final, capture_output=True, shell=True)
-        stdout_str = ret.stdout.decode()
-        stderr_str = ret.stderr.decode()
-
-        print("[AdminCLI] 결과 (stdout):")
-        print(stdout_str)
-
-        if stderr_str:
-            print("[AdminCLI] 오류 내용 (stderr):")
-            print(stderr_str)
-
-        return stdout_str + ("\n[stderr]\n" + stderr_str if stderr_str else "")
-
-    def getBtsIpFromNaQuery(self, bts_id: str) -> str:
+    def getBtsIpFromNaQuery(self, bts_id: str, refresh: bool = False) -> str:
+        """na_query로 BTS IP 조회 (bts_ip_cache()에 보관된 결과가 있으면 NetAct에 다시 묻지 않음)"""
         try:
-            bin_path = "./bin/na_query/na_query"
-            config_path = os.getcwd() + "/bin/na_query/na_query.toml"
-
-            print(f"[디버그] 실행 경로: {bin_path}")
-            print(f"[디버그] 설정 파일: {config_path}")
-            print(f"[디버그] bts id: {bts_id}")
-            print(f"[디버그] 현재 경로: {os.getcwd()}")
-
-            command_final = bin_path + " --config-file " + config_path + " get-bts-ip " + str(bts_id)
-            print(command_final)
-
-            ret = subprocess.run(command_final.split(), capture_output=True)
-            ret_str = ret.stdout.decode()
-            print(ret_str)
-
-            nq_ret = NqQueryResult(ret_str)
-            query = nq_ret.getValue("query")
-            result = nq_ret.getValue("result")
-
-            print(f"[디버그] na_query 결과: query={query}, result={result}")
-            return result
+            return bts_ip_cache().get(bts_id, refresh=refresh)
 
         except Exception as e:
             print(f"[디버그] 예외 발생: {str(e)}")
 
             # 테스트용 임시 IP 반환
             return "4.5.13.5"
+
+    def resolveBtsIps(self, bts_ids, refresh: bool = False) -> dict:
+        """여러 BTS IP를 병렬로 한 번에 조회 → {bts_id: IP} (조회 실패는 None)"""
+        return bts_ip_cache().resolve_many(bts_ids, refresh=refresh)
         
       # tomllib 대신 toml 사용 중인 경우
 
@@ -368,6 +346,47 @@ class AdminCliResult:
 
         return blocks
 
+def query_bts_ip(bts_id) -> str:
+    """na_query get-bts-ip 실행 (캐시 없이 매번 NetAct 조회, 실행 실패 시 예외)"""
+    bin_path = "./bin/na_query/na_query"
+    config_path = os.getcwd() + "/bin/na_query/na_query.toml"
+
+    # resolve_many()로 여러 BTS를 동시에 조회하므로 디버그 모드에서만 출력 (조회마다 출력하면 로그가 뒤섞임)
+    if IS_DEBUG:
+        print(f"[디버그] 실행 경로: {bin_path}")
+        print(f"[디버그] 설정 파일: {config_path}")
+        print(f"[디버그] bts id: {bts_id}")
+        print(f"[디버그] 현재 경로: {os.getcwd()}")
+
+    command_final = bin_path + " --config-file " + config_path + " get-bts-ip " + str(bts_id)
+    if IS_DEBUG:
+        print(command_final)
+
+    ret = subprocess.run(command_final.split(), capture_output=True, timeout=NA_QUERY_TIMEOUT)
+    ret_str = ret.stdout.decode()
+    if IS_DEBUG:
+        print(ret_str)
+
+    nq_ret = NqQueryResult(ret_str)
+    query = nq_ret.getValue("query")
+    result = nq_ret.getValue("result")
+
+    if IS_DEBUG:
+        print(f"[디버그] na_query 결과: query={query}, result={result}")
+    return result
+
+_ip_cache = None
+_ip_cache_lock = threading.Lock()
+
+def bts_ip_cache() -> BtsIpCache:
+    """서버 프로세스 전체에서 하나의 BTS IP 캐시를 공유 (처음 호출 시 생성)"""
+    global _ip_cache
+    with _ip_cache_lock:
+        if _ip_cache is None:
+            _ip_cache = BtsIpCache(query_bts_ip, ttl=NA_QUERY_CACHE_TTL,
+                                   negative_ttl=NA_QUERY_NEGATIVE_TTL, max_parallel=NA_QUERY_MAX_PARALLEL)
+        return _ip_cache
+
 class NqQueryResult:
     def __init__(self, in_str: str):
         self.orgStr = in_str
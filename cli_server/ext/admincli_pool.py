@@ -0,0 +1,496 @@
+import atexit
+import base64
+import json
+import os
+import socket
+import struct
+import subprocess
+import threading
+import time
+
+from cli_server.settings import (
+    ADMINCLI_COMMAND, ADMINCLI_POOL_SIZE, ADMINCLI_IDLE_TIMEOUT,
+    ADMINCLI_START_TIMEOUT, ADMINCLI_REQUEST_TIMEOUT,
+)
+
+# admin-cli 상주 프로세스 풀
+# - admin-cli를 서버 모드(--cli-host/--cli-port)로 BTS별 하나씩 띄워 두고 로컬 websocket으로 요청을 보냄
+#   (호출마다 node 런타임 기동 + BTS 접속을 반복하지 않음)
+# - 요청/응답은 README의 "CLI server mode" 메시지 형식 (ADMIN_API / FILE_TRANSFER)
+#   --input-file/--output-file 대신 FILE_TRANSFER 메시지로 로컬 파일을 읽고 씀
+# - 같은 BTS 요청은 worker lock으로 순서대로, 다른 BTS 요청은 동시에 처리
+# - 사용 전 프로세스 생존/ping 확인, 죽었으면 다시 띄움. 오래 쓰지 않은 worker는 정리
+# - ADMINCLI_COMMAND를 바꾸면 같은 인자를 받는 가짜 admin-cli 스크립트로도 동작 확인 가능
+
+FINAL_STATUSES = ("completed", "rejected", "failed")
+HEALTH_CHECK_INTERVAL = 30.0
+_REAP_INTERVAL = 30.0
+
+
+class AdminCliStartError(Exception):
+    """worker를 띄우지 못함 (요청은 보내지 않았으므로 1회 실행 방식으로 대신 처리 가능)"""
+
+
+class AdminCliWorkerError(Exception):
+    """요청을 보낸 뒤 worker 연결이 끊김/시간 초과 (BTS 쪽 실행 여부를 알 수 없으므로 재시도하지 않음)"""
+
+
+class _WebSocket:
+    """로컬 admin-cli 서버 모드 접속용 최소 websocket 클라이언트 (text/ping/pong/close)"""
+
+    def __init__(self, host: str, port: int, timeout: float = 5.0):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self._buf = b""
+        self.closed = False
+        try:
+            self._handshake(host, port)
+        except Exception:
+            self.sock.close()
+            raise
+
+    def _handshake(self, host, port):
+        key = base64.b64encode(os.urandom(16)).decode()
+        self.sock.sendall((
+            f"GET / HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+        ).encode())
+        while b"\r\n\r\n" not in self._buf:
+            data = self.sock.recv(4096)
+            if not data:
+                raise ConnectionError("websocket handshake 중 연결 종료")
+            self._buf += data
+        header, self._buf = self._buf.split(b"\r\n\r\n", 1)
+        status = header.split(b"\r\n", 1)[0]
+        if b" 101 " not in status + b" ":
+            raise ConnectionError(f"websocket handshake 실패: {status.decode(errors='replace')}")
+
+    def _send_frame(self, opcode: int, payload: bytes):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, 0x80 | length)
+        elif length < 65536:
+            header = struct.pack("!BBH", 0x80 | opcode, 0x80 | 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 0x80 | 127, length)
+        mask = os.urandom(4)
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        self.sock.sendall(header + mask + masked)
+
+    def _recv_exact(self, n: int) -> bytes:
+        while len(self._buf) < n:
+            data = self.sock.recv(max(65536, n - len(self._buf)))
+            if not data:
+                self.closed = True
+                raise ConnectionError("admin-cli 연결이 끊어졌습니다.")
+            self._buf += data
+        data, self._buf = self._buf[:n], self._buf[n:]
+        return data
+
+    def _recv_frame(self):
+        b1, b2 = self._recv_exact(2)
+        opcode = b1 & 0x0F
+        length = b2 & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self._recv_exact(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self._recv_exact(8))[0]
+        mask = self._recv_exact(4) if b2 & 0x80 else None
+        payload = self._recv_exact(length)
+        if mask:
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return bool(b1 & 0x80), opcode, payload
+
+    def send_text(self, text: str):
+        self._send_frame(0x1, text.encode("utf-8"))
+
+    def recv_text(self, timeout: float) -> str:
+        """text 메시지 하나를 받음 (ping에는 pong으로 응답). timeout이 지나면 socket.timeout"""
+        self.sock.settimeout(timeout)
+        parts = []
+        while True:
+            fin, opcode, payload = self._recv_frame()
+            if opcode == 0x9:
+                self._send_frame(0xA, payload)
+                continue
+            if opcode == 0xA:
+                continue
+            if opcode == 0x8:
+                self.closed = True
+                raise ConnectionError("admin-cli가 연결을 종료했습니다.")
+            parts.append(payload)
+            if fin:
+                return b"".join(parts).decode("utf-8")
+
+    def ping(self, timeout: float = 5.0) -> bool:
+        self.sock.settimeout(timeout)
+        self._send_frame(0x9, b"hc")
+        while True:
+            fin, opcode, payload = self._recv_frame()
+            if opcode == 0xA:
+                return True
+            if opcode == 0x9:
+                self._send_frame(0xA, payload)
+            elif opcode == 0x8:
+                self.closed = True
+                return False
+            # 요청이 없는 상태에서 온 다른 메시지는 무시
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            try:
+                self._send_frame(0x8, b"")
+            except OSError:
+                pass
+        self.sock.close()
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class AdminCliWorker:
+    """BTS 하나에 연결된 상주 admin-cli 프로세스"""
+
+    def __init__(self, command: str, host: str, port: int, username: str, password: str):
+        self.command = command
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.proc = None
+        self.ws = None
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self.last_checked = 0.0
+        self.requests = 0
+        self.restarts = 0
+        self.aborted = False
+        self.retired = False  # pool에서 제거됨 (다시 띄우지 않음)
+        self._request_id = 0
+
+    # ---------- 프로세스 관리 ----------
+    def is_alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None and self.ws is not None and not self.ws.closed
+
+    def start(self, timeout: float = ADMINCLI_START_TIMEOUT):
+        self.stop()
+        if self.retired:
+            raise AdminCliStartError("pool에서 제거된 admin-cli worker입니다.")
+        cli_port = _free_port()
+        args = [
+            self.command,
+            f"--bts-username={self.username}", f"--bts-password={self.password}",
+            f"--bts-host={self.host}", f"--bts-port={self.port}",
+            "--cli-host=127.0.0.1", f"--cli-port={cli_port}",
+            "--format=compact",
+        ]
+        try:
+            self.proc = subprocess.Popen(args, stdin=subprocess.DEVNULL,
+                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            raise AdminCliStartError(f"admin-cli 실행 실패: {e}")
+        if self.retired:
+            # 띄우는 사이 pool에서 제거됨 (close 등) → pool이 모르는 프로세스를 남기지 않음
+            self.stop()
+            raise AdminCliStartError("pool에서 제거된 admin-cli worker입니다.")
+
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.proc.poll() is not None:
+                raise AdminCliStartError(f"admin-cli가 시작 중 종료됨 (exit {self.proc.returncode})")
+            try:
+                self.ws = _WebSocket("127.0.0.1", cli_port)
+                break
+            except (OSError, ConnectionError):
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise AdminCliStartError(f"admin-cli 서버 모드 접속 시간 초과 ({timeout}s)")
+                time.sleep(0.2)
+        self.last_checked = time.monotonic()
+        self.restarts += 1
+
+    def stop(self):
+        if self.ws is not None:
+            self.ws.close()
+            self.ws = None
+        if self.proc is not None:
+            if self.proc.poll() is None:
+                self.proc.terminate()
+                try:
+                    self.proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self.proc.kill()
+                    self.proc.wait()
+            self.proc = None
+
+    def abort(self):
+        """
+        다른 스레드에서 진행 중인 요청을 중단 (작업 취소용)
+        프로세스를 종료하면 execute()의 수신이 연결 끊김으로 끝나고 AdminCliWorkerError가 발생
+        """
+        self.aborted = True
+        proc, ws = self.proc, self.ws
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+        if ws is not None:
+            try:
+                ws.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def ensure_ready(self):
+        """죽었거나 응답이 없으면 다시 띄움 (lock을 잡은 상태에서 호출)"""
+        if self.is_alive() and time.monotonic() - self.last_checked > HEALTH_CHECK_INTERVAL:
+            try:
+                healthy = self.ws.ping()
+            except (OSError, ConnectionError):
+                healthy = False
+            if healthy:
+                self.last_checked = time.monotonic()
+            else:
+                print(f"[AdminCLI pool] {self.host} worker 응답 없음 → 재시작")
+                self.stop()
+        if not self.is_alive():
+            self.start()
+
+    # ---------- 요청 처리 ----------
+    def execute(self, payload: dict, input_file: str = None, output_file: str = None,
+                timeout: float = ADMINCLI_REQUEST_TIMEOUT, on_response=None):
+        """
+        ADMIN_API 요청을 보내고 최종 상태(completed/rejected/failed)까지의 응답 payload 목록을 반환
+        on_response(body)는 응답(진행 상태 포함)을 받을 때마다 호출 (lock을 잡은 상태에서 호출)
+        """
+        if self.aborted:
+            self.stop()
+            raise AdminCliWorkerError("요청이 취소되었습니다.")
+        self._request_id += 1
+        request_id = self._request_id
+        payload = dict(payload, requestId=request_id)
+
+        # 파일은 FILE_TRANSFER 메시지로 주고받음 (content ""는 내부 전송 사용 의미)
+        if input_file or output_file:
+            procedure = payload.setdefault("parameters", {})
+            params = procedure.setdefault("parameters", {})
+            if input_file:
+                params["inputFileName"] = os.path.basename(input_file)
+                params["inputFileContent"] = ""
+            if output_file:
+                params["outputFileContent"] = ""
+
+        try:
+            self.ws.send_text(json.dumps({"type": "ADMIN_API", "payload": payload}))
+        except OSError as e:
+            # 전송 자체가 실패 → BTS로 요청이 가지 않았으므로 다시 띄워서 한 번 더 보냄 (취소된 경우 제외)
+            self.stop()
+            if self.aborted:
+                raise AdminCliWorkerError("요청이 취소되었습니다.")
+            self.start()
+            try:
+                self.ws.send_text(json.dumps({"type": "ADMIN_API", "payload": payload}))
+            except OSError:
+                self.stop()
+                raise AdminCliWorkerError(f"admin-cli 요청 전송 실패: {e}")
+
+        self.requests += 1
+        responses = []
+        files = {}
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise socket.timeout()
+                message = json.loads(self.ws.recv_text(remaining))
+                kind = message.get("type")
+                body = message.get("payload") or {}
+
+                if kind == "FILE_TRANSFER":
+                    self._handle_file_transfer(body, files, input_file, output_file)
+                    continue
+                if kind != "ADMIN_API" or body.get("requestId") != request_id:
+                    continue
+
+                responses.append(body)
+                if on_response is not None:
+                    on_response(body)
+                if body.get("requestStatus") in FINAL_STATUSES:
+                    return responses
+        except socket.timeout:
+            self.stop()
+            raise AdminCliWorkerError(f"admin-cli 응답 시간 초과 ({timeout}s)")
+        except (OSError, ConnectionError, ValueError) as e:
+            self.stop()
+            if self.aborted:
+                raise AdminCliWorkerError("요청이 취소되었습니다.")
+            raise AdminCliWorkerError(f"admin-cli 연결 오류: {e}")
+        finally:
+            for fp in files.values():
+                fp.close()
+            self.last_used = time.monotonic()
+            self.last_checked = self.last_used
+
+    def _handle_file_transfer(self, body, files, input_file, output_file):
+        transfer_id = body.get("id")
+        kind = body.get("type")
+
+        if kind == "SIZE":
+            size = os.path.getsize(input_file) if input_file else 0
+            self._reply_file(transfer_id, "SIZE", size)
+        elif kind == "READ":
+            fp = files.get(("r", transfer_id))
+            if fp is None:
+                fp = files[("r", transfer_id)] = open(input_file, "rb")
+            fp.seek(body.get("offset", 0))
+            data = fp.read(body.get("length", 0))
+            self._reply_file(transfer_id, "READ", base64.b64encode(data).decode())
+        elif kind == "WRITE":
+            fp = files.get(("w", transfer_id))
+            if fp is None:
+                os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+                fp = files[("w", transfer_id)] = open(output_file, "wb")
+            fp.write(base64.b64decode(body.get("data", "")))
+        elif kind == "CLOSE_READER":
+            fp = files.pop(("r", transfer_id), None)
+            if fp:
+                fp.close()
+        elif kind == "CLOSE_WRITER":
+            fp = files.pop(("w", transfer_id), None)
+            if fp:
+                fp.close()
+
+    def _reply_file(self, transfer_id, kind, data):
+        self.ws.send_text(json.dumps({
+            "type": "FILE_TRANSFER",
+            "payload": {"id": transfer_id, "type": kind, "data": data},
+        }))
+
+
+class AdminCliPool:
+    def __init__(self, command: str = ADMINCLI_COMMAND, max_workers: int = ADMINCLI_POOL_SIZE,
+                 idle_timeout: float = ADMINCLI_IDLE_TIMEOUT):
+        self.command = command
+        self.max_workers = max(1, max_workers)
+        self.idle_timeout = idle_timeout
+        self.workers = {}  # (host, port, username) → AdminCliWorker
+        self._lock = threading.Lock()
+        self._closed = False
+        self._reaper = threading.Thread(target=self._reap_loop, name="admincli-reaper", daemon=True)
+        self._reaper.start()
+
+    def execute(self, host: str, port: int, username: str, password: str, payload: dict,
+                input_file: str = None, output_file: str = None, timeout: float = ADMINCLI_REQUEST_TIMEOUT,
+                on_response=None, set_canceller=None):
+        """
+        해당 BTS의 worker로 요청을 처리하고 응답 payload 목록을 반환
+        worker를 띄울 수 없으면 AdminCliStartError, 요청 후 오류면 AdminCliWorkerError
+        set_canceller(fn)에는 요청 처리 중 worker.abort를 등록 (끝나면 None으로 해제)
+        """
+        worker = self._acquire(host, port, username, password)
+        try:
+            worker.ensure_ready()
+            worker.aborted = False
+            if set_canceller is not None:
+                set_canceller(worker.abort)
+            return worker.execute(payload, input_file=input_file, output_file=output_file,
+                                  timeout=timeout, on_response=on_response)
+        finally:
+            if set_canceller is not None:
+                set_canceller(None)
+            worker.lock.release()
+
+    def _acquire(self, host, port, username, password) -> AdminCliWorker:
+        """
+        해당 BTS worker의 lock을 잡아서 반환
+        lock을 기다리는 사이 다른 스레드가 그 worker를 정리(_evict_idle/_reap_loop/close)했으면 다시 찾음
+        """
+        key = (host, int(port), username)
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise AdminCliStartError("admin-cli pool이 종료되었습니다.")
+                worker = self.workers.get(key)
+                if worker is None:
+                    if len(self.workers) >= self.max_workers and not self._evict_idle():
+                        raise AdminCliStartError(f"admin-cli worker가 모두 사용 중입니다. ({self.max_workers}개)")
+                    worker = self.workers[key] = AdminCliWorker(self.command, host, int(port), username, password)
+                worker.password = password
+            worker.lock.acquire()
+            with self._lock:
+                if not self._closed and self.workers.get(key) is worker:
+                    return worker
+            worker.lock.release()
+
+    def _retire(self, key, worker):
+        """worker를 pool에서 제거하고 종료 (self._lock 안에서, worker.lock을 잡은 상태로 호출)"""
+        worker.retired = True
+        worker.stop()
+        del self.workers[key]
+
+    def _evict_idle(self) -> bool:
+        """사용 중이 아닌 worker 중 가장 오래 쓰지 않은 것을 종료 (self._lock 안에서 호출)"""
+        for key, worker in sorted(self.workers.items(), key=lambda x: x[1].last_used):
+            if worker.lock.acquire(blocking=False):
+                try:
+                    self._retire(key, worker)
+                finally:
+                    worker.lock.release()
+                return True
+        return False
+
+    def _reap_loop(self):
+        while not self._closed:
+            time.sleep(_REAP_INTERVAL)
+            now = time.monotonic()
+            with self._lock:
+                for key, worker in list(self.workers.items()):
+                    if now - worker.last_used < self.idle_timeout:
+                        continue
+                    if worker.lock.acquire(blocking=False):
+                        try:
+                            self._retire(key, worker)
+                        finally:
+                            worker.lock.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                f"{host}:{port}": {
+                    "alive": worker.is_alive(),
+                    "busy": worker.lock.locked(),
+                    "requests": worker.requests,
+                    "starts": worker.restarts,
+                    "idle_s": int(time.monotonic() - worker.last_used),
+                }
+                for (host, port, _), worker in self.workers.items()
+            }
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            workers, self.workers = list(self.workers.values()), {}
+            for worker in workers:
+                worker.retired = True
+        for worker in workers:
+            worker.stop()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_admincli_pool() -> AdminCliPool:
+    """서버 프로세스 전체에서 하나의 pool을 공유 (처음 호출 시 생성, 종료 시 worker 정리)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = AdminCliPool()
+            atexit.register(_pool.close)
+        return _pool
+
+
+def admincli_pool_stats() -> dict:
+    """pool이 만들어진 경우에만 worker 상태를 반환 (server-stats 용도)"""
+    return _pool.stats() if _pool is not None else {}
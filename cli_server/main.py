@@ -7,7 +7,7 @@ from cli_server import settings  # 서버 설정 가져오기
 
 def cli_serve():
     try:
-        server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=settings.GRPC_MAX_WORKERS))
         message_pb2_grpc.add_CommandServiceServicer_to_server(CommandServiceServicer(), server)
 
         if settings.USE_TLS:
@@ -23,7 +23,39 @@ def str2bool(s):
 ENV_TYPE = os.getenv("ENV_TYPE", "DEV").upper()
 IS_PROD = ENV_TYPE == "PROD"
 USE_TLS = str2bool(os.getenv("USE_TLS", "True"))
+IS_DEBUG = str2bool(os.getenv("SERVER_DEBUG", "False"))
 GRPC_BIND_ADDRESS = os.getenv("SERVER_GRPC_BIND_ADDRESS", "0.0.0.0:50051")
+FILE_CACHE_MAX_BYTES = int(os.getenv("SERVER_FILE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+GRPC_MAX_WORKERS = int(os.getenv("SERVER_GRPC_MAX_WORKERS", "32"))  # gRPC 요청 처리 스레드 수 (PollJob 대기/WatchJob 스트림도 하나씩 사용)
+
+# ─── admin-cli 실행 설정 ───────────────────────
+ADMINCLI_COMMAND = os.getenv("ADMINCLI_COMMAND", "./bin/admincli/admin-cli.sh")
+ADMINCLI_POOL = str2bool(os.getenv("ADMINCLI_POOL", "True"))           # False면 호출마다 admin-cli 실행
+ADMINCLI_POOL_SIZE = int(os.getenv("ADMINCLI_POOL_SIZE", "8"))           # 동시에 유지할 BTS 연결(worker) 수
+ADMINCLI_IDLE_TIMEOUT = float(os.getenv("ADMINCLI_IDLE_TIMEOUT", "300"))  # 이 시간 동안 안 쓴 worker 종료
+ADMINCLI_START_TIMEOUT = float(os.getenv("ADMINCLI_START_TIMEOUT", "30"))
+ADMINCLI_REQUEST_TIMEOUT = float(os.getenv("ADMINCLI_REQUEST_TIMEOUT", "1800"))
+
+# ─── na_query BTS IP 조회 설정 ──────────────────
+NA_QUERY_TIMEOUT = float(os.getenv("NA_QUERY_TIMEOUT", "60"))            # na_query 한 번 실행 제한 시간(초)
+NA_QUERY_CACHE_TTL = float(os.getenv("NA_QUERY_CACHE_TTL", "600"))       # 조회된 IP 보관 시간(초), 0이면 캐시 사용 안 함
+NA_QUERY_NEGATIVE_TTL = float(os.getenv("NA_QUERY_NEGATIVE_TTL", "60"))  # 조회 실패(IP 없음) 결과 보관 시간(초)
+NA_QUERY_MAX_PARALLEL = int(os.getenv("NA_QUERY_MAX_PARALLEL", "8"))     # 여러 BTS 일괄 조회 시 동시에 실행할 na_query 수
+
+# ─── 연결 확인(check-ssh / sweep) 설정 ──────────
+SSH_USER = os.getenv("SSH_USER", "nokia")
+SSH_CONTROL_DIR = os.getenv("SSH_CONTROL_DIR", os.path.join("/tmp", "nocli-ssh"))  # ssh ControlMaster 소켓 위치
+SSH_CONTROL_PERSIST = float(os.getenv("SSH_CONTROL_PERSIST", "300"))     # 마지막 사용 후 ssh 연결을 유지하는 시간(초)
+SWEEP_MAX_PARALLEL = int(os.getenv("SWEEP_MAX_PARALLEL", "64"))          # sweep에서 동시에 확인할 BTS 수 상한
+SWEEP_PROBE_TIMEOUT = float(os.getenv("SWEEP_PROBE_TIMEOUT", "3"))       # sweep ping/ssh 한 번의 기본 제한 시간(초)
+
+# ─── 백그라운드 작업(job) 설정 ──────────────────
+JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "16"))        # 동시에 실행할 작업 수 (나머지는 queued로 대기)
+JOB_RETENTION = float(os.getenv("JOB_RETENTION", "3600"))        # 끝난 작업을 job-list/job-watch로 조회할 수 있는 시간(초)
+JOB_MAX_EVENTS = int(os.getenv("JOB_MAX_EVENTS", "5000"))        # 작업별로 보관할 출력/상태 이벤트 수 (오래된 것부터 버림)
+JOB_POLL_WAIT = float(os.getenv("JOB_POLL_WAIT", "10"))          # PollJob이 새 이벤트를 기다리는 최대 시간(초)
+JOB_WATCH_MAX_WAITERS = int(os.getenv("JOB_WATCH_MAX_WAITERS", str(max(1, GRPC_MAX_WORKERS // 4))))  # 동시에 이벤트를 기다리는 PollJob/WatchJob 수 (gRPC 스레드를 SendCommand용으로 남겨 둠)
+FLEET_MAX_PARALLEL = int(os.getenv("FLEET_MAX_PARALLEL", "8"))   # 여러 BTS 대상 작업(fleet-commission/init-sw-ver)의 BTS 동시 처리 상한
 
 # ─── BASE_DIR 설정 (PyInstaller 대응) ─────────
 if getattr(sys, 'frozen', False):
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rmessage.proto\x12\x07message\"+\n\x07Request\x12\x0f\n\x07\x63ommand\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\t\"+\n\x08Response\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0e\n\x06result\x18\x02 \x01(\t2D\n\x0e\x43ommandService\x12\x32\n\x0bSendCommand\x12\x10.message.Request\x1a\x11.message.Responseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rmessage.proto\x12\x07message\"+\n\x07Request\x12\x0f\n\x07\x63ommand\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\t\"+\n\x08Response\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0e\n\x06result\x18\x02 \x01(\t\"3\n\x0eGetFileRequest\x12\x0f\n\x07purpose\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"@\n\x0c\x46ileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0e\n\x06result\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\x0c\"E\n\x0fSaveFileRequest\x12\x0f\n\x07purpose\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\x0c\"q\n\rCommitRequest\x12\x14\n\x0c\x63ommand_type\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x16\n\x0etranslate_mode\x18\x04 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x05 \x01(\x0c\"u\n\x13\x44ownloadFileRequest\x12\x0f\n\x07purpose\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x10\n\x08\x63ompress\x18\x03 \x01(\x08\x12\x12\n\nchunk_size\x18\x04 \x01(\r\x12\x15\n\rif_none_match\x18\x05 \x01(\t\"\xaf\x01\n\tFileChunk\x12\x0f\n\x07purpose\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x12\n\ncompressed\x18\x03 \x01(\x08\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\x12\x0c\n\x04last\x18\x05 \x01(\x08\x12\x0e\n\x06sha256\x18\x06 \x01(\t\x12\x0c\n\x04size\x18\x07 \x01(\x04\x12\r\n\x05\x65rror\x18\x08 \x01(\t\x12\x0c\n\x04\x65tag\x18\t \x01(\t\x12\x14\n\x0cnot_modified\x18\n \x01(\x08\"\x1c\n\nJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"3\n\x0fWatchJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x10\n\x08\x66rom_seq\x18\x02 \x01(\x04\"\'\n\x0fListJobsRequest\x12\x14\n\x0c\x61ll_sessions\x18\x01 \x01(\x08\"\xa7\x01\n\x07JobInfo\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0f\n\x07\x63ommand\x18\x02 \x01(\t\x12\r\n\x05state\x18\x03 \x01(\t\x12\x0f\n\x07success\x18\x04 \x01(\x08\x12\x0e\n\x06result\x18\x05 \x01(\t\x12\x0e\n\x06\x62ts_id\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\x01\x12\x12\n\nstarted_at\x18\x08 \x01(\x01\x12\x13\n\x0b\x66inished_at\x18\t \x01(\x01\"a\n\x08JobEvent\x12\x0b\n\x03seq\x18\x01 \x01(\x04\x12\x0c\n\x04kind\x18\x02 \x01(\t\x12\r\n\x05state\x18\x03 \x01(\t\x12\x0c\n\x04line\x18\x04 \x01(\t\x12\x1d\n\x03job\x18\x05 \x01(\x0b\x32\x10.message.JobInfo\"Q\n\tJobEvents\x12!\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x11.message.JobEvent\x12\x0c\n\x04\x64one\x18\x02 \x01(\x08\x12\x13\n\x0bretry_after\x18\x03 \x01(\x01\")\n\x07JobList\x12\x1e\n\x04jobs\x18\x01 \x03(\x0b\x32\x10.message.JobInfo2\xf9\x04\n\x0e\x43ommandService\x12\x32\n\x0bSendCommand\x12\x10.message.Request\x1a\x11.message.Response\x12\x39\n\x07GetFile\x12\x17.message.GetFileRequest\x1a\x15.message.FileResponse\x12\x37\n\x08SaveFile\x12\x18.message.SaveFileRequest\x1a\x11.message.Response\x12\x33\n\x06\x43ommit\x12\x16.message.CommitRequest\x1a\x11.message.Response\x12\x42\n\x0c\x44ownloadFile\x12\x1c.message.DownloadFileRequest\x1a\x12.message.FileChunk0\x01\x12\x35\n\nUploadFile\x12\x12.message.FileChunk\x1a\x11.message.Response(\x01\x12/\n\tSubmitJob\x12\x10.message.Request\x1a\x10.message.JobInfo\x12\x37\n\x07PollJob\x12\x18.message.WatchJobRequest\x1a\x12.message.JobEvents\x12\x39\n\x08WatchJob\x12\x18.message.WatchJobRequest\x1a\x11.message.JobEvent0\x01\x12\x32\n\tCancelJob\x12\x13.message.JobRequest\x1a\x10.message.JobInfo\x12\x36\n\x08ListJobs\x12\x18.message.ListJobsRequest\x1a\x10.message.JobListb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,6 +35,32 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_REQUEST']._serialized_end=69
   _globals['_RESPONSE']._serialized_start=71
   _globals['_RESPONSE']._serialized_end=114
-  _globals['_COMMANDSERVICE']._serialized_start=116
-  _globals['_COMMANDSERVICE']._serialized_end=184
+  _globals['_GETFILEREQUEST']._serialized_start=116
+  _globals['_GETFILEREQUEST']._serialized_end=167
+  _globals['_FILERESPONSE']._serialized_start=169
+  _globals['_FILERESPONSE']._serialized_end=233
+  _globals['_SAVEFILEREQUEST']._serialized_start=235
+  _globals['_SAVEFILEREQUEST']._serialized_end=304
+  _globals['_COMMITREQUEST']._serialized_start=306
+  _globals['_COMMITREQUEST']._serialized_end=419
+  _globals['_DOWNLOADFILEREQUEST']._serialized_start=421
+  _globals['_DOWNLOADFILEREQUEST']._serialized_end=538
+  _globals['_FILECHUNK']._serialized_start=541
+  _globals['_FILECHUNK']._serialized_end=716
+  _globals['_JOBREQUEST']._serialized_start=718
+  _globals['_JOBREQUEST']._serialized_end=746
+  _globals['_WATCHJOBREQUEST']._serialized_start=748
+  _globals['_WATCHJOBREQUEST']._serialized_end=799
+  _globals['_LISTJOBSREQUEST']._serialized_start=801
+  _globals['_LISTJOBSREQUEST']._serialized_end=840
+  _globals['_JOBINFO']._serialized_start=843
+  _globals['_JOBINFO']._serialized_end=1010
+  _globals['_JOBEVENT']._serialized_start=1012
+  _globals['_JOBEVENT']._serialized_end=1109
+  _globals['_JOBEVENTS']._serialized_start=1111
+  _globals['_JOBEVENTS']._serialized_end=1192
+  _globals['_JOBLIST']._serialized_start=1194
+  _globals['_JOBLIST']._serialized_end=1235
+  _globals['_COMMANDSERVICE']._serialized_start=1238
+  _globals['_COMMANDSERVICE']._serialized_end=1871
 # @@protoc_insertion_point(module_scope)
@@ -39,12 +39,129 @@ class CommandServiceStub(object):
                 request_serializer=message__pb2.Request.SerializeToString,
                 response_deserializer=message__pb2.Response.FromString,
                 _registered_method=True)
+        self.GetFile = channel.unary_unary(
+                '/message.CommandService/GetFile',
+                request_serializer=message__pb2.GetFileRequest.SerializeToString,
+                response_deserializer=message__pb2.FileResponse.FromString,
+                _registered_method=True)
+        self.SaveFile = channel.unary_unary(
+                '/message.CommandService/SaveFile',
+                request_serializer=message__pb2.SaveFileRequest.SerializeToString,
+                response_deserializer=message__pb2.Response.FromString,
+                _registered_method=True)
+        self.Commit = channel.unary_unary(
+                '/message.CommandService/Commit',
+                request_serializer=message__pb2.CommitRequest.SerializeToString,
+                response_deserializer=message__pb2.Response.FromString,
+                _registered_method=True)
+        self.DownloadFile = channel.unary_stream(
+                '/message.CommandService/DownloadFile',
+                request_serializer=message__pb2.DownloadFileRequest.SerializeToString,
+                response_deserializer=message__pb2.FileChunk.FromString,
+                _registered_method=True)
+        self.UploadFile = channel.stream_unary(
+                '/message.CommandService/UploadFile',
+                request_serializer=message__pb2.FileChunk.SerializeToString,
+                response_deserializer=message__pb2.Response.FromString,
+                _registered_method=True)
+        self.SubmitJob = channel.unary_unary(
+                '/message.CommandService/SubmitJob',
+                request_serializer=message__pb2.Request.SerializeToString,
+                response_deserializer=message__pb2.JobInfo.FromString,
+                _registered_method=True)
+        self.PollJob = channel.unary_unary(
+                '/message.CommandService/PollJob',
+                request_serializer=message__pb2.WatchJobRequest.SerializeToString,
+                response_deserializer=message__pb2.JobEvents.FromString,
+                _registered_method=True)
+        self.WatchJob = channel.unary_stream(
+                '/message.CommandService/WatchJob',
+                request_serializer=message__pb2.WatchJobRequest.SerializeToString,
+                response_deserializer=message__pb2.JobEvent.FromString,
+                _registered_method=True)
+        self.CancelJob = channel.unary_unary(
+                '/message.CommandService/CancelJob',
+                request_serializer=message__pb2.JobRequest.SerializeToString,
+                response_deserializer=message__pb2.JobInfo.FromString,
+                _registered_method=True)
+        self.ListJobs = channel.unary_unary(
+                '/message.CommandService/ListJobs',
+                request_serializer=message__pb2.ListJobsRequest.SerializeToString,
+                response_deserializer=message__pb2.JobList.FromString,
+                _registered_method=True)
 
 
 class CommandServiceServicer(object):
     """Missing associated documentation comment in .proto file."""
 
     def SendCommand(self, request, context):
+        """범용 명령 (payload 문자열). 파일 전송 명령(getFile/saveFile/commit/commit-cli)도 호환용으로 유지
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetFile(self, request, context):
+        """파일 전송 전용 RPC (base64 없이 bytes로 전달)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveFile(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Commit(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DownloadFile(self, request, context):
+        """대용량 파일 전송 (chunk 단위 스트리밍, 체크섬/선택적 gzip)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UploadFile(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubmitJob(self, request, context):
+        """오래 걸리는 명령(commission/recommission/generateScf/update-sw-ver)의 백그라운드 작업
+        SubmitJob은 job ID만 바로 반환하고, 출력 줄/상태 변화는 PollJob(long-poll)으로 이어서 받음
+        PollJob은 새 이벤트가 생기거나 최대 대기 시간(JOB_POLL_WAIT)이 지나면 바로 반환 (gRPC 스레드를 작업 끝까지 붙잡지 않음)
+        WatchJob 스트림은 구버전 클라이언트용 (동시 스트림 수 제한, 초과 시 RESOURCE_EXHAUSTED)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PollJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CancelJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListJobs(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -58,6 +175,56 @@ def add_CommandServiceServicer_to_server(servicer, server):
                     request_deserializer=message__pb2.Request.FromString,
                     response_serializer=message__pb2.Response.SerializeToString,
             ),
+            'GetFile': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetFile,
+                    request_deserializer=message__pb2.GetFileRequest.FromString,
+                    response_serializer=message__pb2.FileResponse.SerializeToString,
+            ),
+            'SaveFile': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveFile,
+                    request_deserializer=message__pb2.SaveFileRequest.FromString,
+                    response_serializer=message__pb2.Response.SerializeToString,
+            ),
+            'Commit': grpc.unary_unary_rpc_method_handler(
+                    servicer.Commit,
+                    request_deserializer=message__pb2.CommitRequest.FromString,
+                    response_serializer=message__pb2.Response.SerializeToString,
+            ),
+            'DownloadFile': grpc.unary_stream_rpc_method_handler(
+                    servicer.DownloadFile,
+                    request_deserializer=message__pb2.DownloadFileRequest.FromString,
+                    response_serializer=message__pb2.FileChunk.SerializeToString,
+            ),
+            'UploadFile': grpc.stream_unary_rpc_method_handler(
+                    servicer.UploadFile,
+                    request_deserializer=message__pb2.FileChunk.FromString,
+                    response_serializer=message__pb2.Response.SerializeToString,
+            ),
+            'SubmitJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.SubmitJob,
+                    request_deserializer=message__pb2.Request.FromString,
+                    response_serializer=message__pb2.JobInfo.SerializeToString,
+            ),
+            'PollJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.PollJob,
+                    request_deserializer=message__pb2.WatchJobRequest.FromString,
+                    response_serializer=message__pb2.JobEvents.SerializeToString,
+            ),
+            'WatchJob': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchJob,
+                    request_deserializer=message__pb2.WatchJobRequest.FromString,
+                    response_serializer=message__pb2.JobEvent.SerializeToString,
+            ),
+            'CancelJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.CancelJob,
+                    request_deserializer=message__pb2.JobRequest.FromString,
+                    response_serializer=message__pb2.JobInfo.SerializeToString,
+            ),
+            'ListJobs': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListJobs,
+                    request_deserializer=message__pb2.ListJobsRequest.FromString,
+                    response_serializer=message__pb2.JobList.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'message.CommandService', rpc_method_handlers)
@@ -95,3 +262,273 @@ class CommandService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetFile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/message.CommandService/GetFile',
+            message__pb2.GetFileRequest.SerializeToString,
+            message__pb2.FileResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SaveFile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/message.CommandService/SaveFile',
+            message__pb2.SaveFileRequest.SerializeToString,
+            message__pb2.Response.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Commit(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/message.CommandService/Commit',
+            message__pb2.CommitRequest.SerializeToString,
+            message__pb2.Response.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DownloadFile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/message.CommandService/DownloadFile',
+            message__pb2.DownloadFileRequest.SerializeToString,
+            message__pb2.FileChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UploadFile(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/message.CommandService/UploadFile',
+            message__pb2.FileChunk.SerializeToString,
+            message__pb2.Response.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SubmitJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/message.CommandService/SubmitJob',
+            message__pb2.Request.SerializeToString,
+            message__pb2.JobInfo.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def PollJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/message.CommandService/PollJob',
+            message__pb2.WatchJobRequest.SerializeToString,
+            message__pb2.JobEvents.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WatchJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/message.CommandService/WatchJob',
+            message__pb2.WatchJobRequest.SerializeToString,
+            message__pb2.JobEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CancelJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/message.CommandService/CancelJob',
+            message__pb2.JobRequest.SerializeToString,
+            message__pb2.JobInfo.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListJobs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/message.CommandService/ListJobs',
+            message__pb2.ListJobsRequest.SerializeToString,
+            message__pb2.JobList.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
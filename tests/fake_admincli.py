@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+admin-cli 서버 모드(--cli-host/--cli-port)를 흉내 내는 테스트용 스크립트 (AdminCliPool 테스트에서 ADMINCLI_COMMAND 대신 사용)
+- websocket 101 handshake 후 ADMIN_API 요청마다 ongoing → completed 응답
+- inputFileContent/outputFileContent가 있으면 FILE_TRANSFER SIZE/READ/WRITE로 파일을 주고받음
+- parameters.name이 "crash"면 바로 종료, "sleep"이면 parameters.seconds 동안 응답하지 않음
+- FAKE_ADMINCLI_PIDFILE이 있으면 시작할 때 pid를 한 줄씩 기록
+"""
+import base64
+import hashlib
+import json
+import os
+import socket
+import struct
+import sys
+import time
+
+WRITE_CONTENT = b"<scf>fake</scf>"
+
+
+def main():
+    args = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    pid_file = os.getenv("FAKE_ADMINCLI_PIDFILE")
+    if pid_file:
+        with open(pid_file, "a") as f:
+            f.write(f"{os.getpid()}\n")
+
+    srv = socket.socket()
+    srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    srv.bind((args.get("cli-host", "127.0.0.1"), int(args["cli-port"])))
+    srv.listen(1)
+    conn, _ = srv.accept()
+    srv.close()
+
+    buf = b""
+    while b"\r\n\r\n" not in buf:
+        data = conn.recv(4096)
+        if not data:
+            return
+        buf += data
+    key = [line.split(b":", 1)[1].strip() for line in buf.split(b"\r\n")
+           if line.lower().startswith(b"sec-websocket-key")][0]
+    accept = base64.b64encode(hashlib.sha1(key + b"258EAFA5-E914-47DA-95CA-C5AB0DC11B85").digest())
+    conn.sendall(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                 b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+
+    def read_exact(n):
+        data = b""
+        while len(data) < n:
+            chunk = conn.recv(n - len(data))
+            if not chunk:
+                sys.exit(0)
+            data += chunk
+        return data
+
+    def send(obj, opcode=1):
+        payload = obj if isinstance(obj, bytes) else json.dumps(obj).encode()
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 65536:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        conn.sendall(header + payload)
+
+    def recv():
+        while True:
+            b1, b2 = read_exact(2)
+            opcode, length = b1 & 0x0F, b2 & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", read_exact(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", read_exact(8))[0]
+            mask = read_exact(4) if b2 & 0x80 else b"\0\0\0\0"
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(read_exact(length)))
+            if opcode == 9:
+                send(payload, 10)
+                continue
+            if opcode == 8:
+                sys.exit(0)
+            return json.loads(payload)
+
+    def transfer(request_id, kind, **extra):
+        send({"type": "FILE_TRANSFER", "payload": dict({"id": request_id, "type": kind}, **extra)})
+
+    while True:
+        payload = recv()["payload"]
+        request_id = payload["requestId"]
+        procedure = payload.get("parameters", {})
+        name = procedure.get("name")
+        params = procedure.get("parameters", {})
+
+        if name == "crash":
+            os._exit(1)
+        send({"type": "ADMIN_API", "payload": {"requestId": request_id, "requestStatus": "ongoing"}})
+        if name == "sleep":
+            time.sleep(float(params.get("seconds", 30)))
+
+        result = {"requestId": request_id, "requestStatus": "completed",
+                  "requestMessage": f"{name} ok", "pid": os.getpid(), "host": args.get("bts-host")}
+        if "inputFileContent" in params:
+            transfer(request_id, "SIZE")
+            size = recv()["payload"]["data"]
+            transfer(request_id, "READ", offset=0, length=size)
+            data = base64.b64decode(recv()["payload"]["data"])
+            transfer(request_id, "CLOSE_READER")
+            result["readBytes"] = len(data)
+        if "outputFileContent" in params:
+            transfer(request_id, "WRITE", data=base64.b64encode(WRITE_CONTENT).decode())
+            transfer(request_id, "CLOSE_WRITER")
+        send({"type": "ADMIN_API", "payload": result})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# cli_server.settings는 import 시 .env를 읽고 TLS 인증서를 확인하므로 테스트에서는 TLS를 끔
+os.environ.setdefault("USE_TLS", "False")
+os.environ.setdefault("SERVER_CERT_PATH", "server.crt")
+os.environ.setdefault("SERVER_KEY_PATH", "server.key")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from cli_server.ext.admincli_pool import AdminCliPool, AdminCliWorkerError  # noqa: E402
+
+FAKE_ADMINCLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_admincli.py")
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # 종료됐지만 아직 회수되지 않은 프로세스(zombie)는 살아 있지 않은 것으로 봄
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split()[2] != "Z"
+    except OSError:
+        return True
+
+
+class _RacyLock:
+    """처음 blocking acquire 직전에 다른 스레드가 pool을 정리하도록 하는 lock (_acquire 경쟁 재현용)"""
+
+    def __init__(self, on_first_acquire):
+        self._lock = threading.Lock()
+        self._hook = on_first_acquire
+
+    def acquire(self, blocking=True, timeout=-1):
+        if blocking and self._hook is not None:
+            hook, self._hook = self._hook, None
+            t = threading.Thread(target=hook)
+            t.start()
+            t.join()
+        return self._lock.acquire(blocking, timeout)
+
+    def release(self):
+        self._lock.release()
+
+    def locked(self):
+        return self._lock.locked()
+
+
+class AdminCliPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pid_file = os.path.join(self.tmp.name, "pids")
+        os.environ["FAKE_ADMINCLI_PIDFILE"] = self.pid_file
+        self.pool = AdminCliPool(command=FAKE_ADMINCLI, max_workers=1, idle_timeout=3600)
+
+    def tearDown(self):
+        self.pool.close()
+        leaked = [pid for pid in self._pids() if _alive(pid)]
+        self.tmp.cleanup()
+        self.assertEqual(leaked, [], "pool.close() 후에도 남아 있는 admin-cli 프로세스")
+
+    def _pids(self):
+        if not os.path.exists(self.pid_file):
+            return []
+        with open(self.pid_file) as f:
+            return [int(line) for line in f if line.strip()]
+
+    def _execute(self, name, host="10.0.0.1", **kwargs):
+        parameters = kwargs.pop("parameters", {})
+        payload = {"parameters": {"name": name, "parameters": parameters}}
+        return self.pool.execute(host, 443, "user", "pw", payload, **kwargs)
+
+    def test_execute(self):
+        seen = []
+        responses = self._execute("generateScf", on_response=seen.append)
+        self.assertEqual([r["requestStatus"] for r in responses], ["ongoing", "completed"])
+        self.assertEqual(seen, responses)
+        # 같은 BTS는 같은 worker(프로세스)를 재사용
+        again = self._execute("generateScf")
+        self.assertEqual(again[-1]["pid"], responses[-1]["pid"])
+        self.assertEqual(len(self._pids()), 1)
+
+    def test_file_transfer(self):
+        input_file = os.path.join(self.tmp.name, "in.xml")
+        output_file = os.path.join(self.tmp.name, "out", "scf.xml")
+        with open(input_file, "wb") as f:
+            f.write(b"x" * 100000)
+        responses = self._execute("commission", input_file=input_file, output_file=output_file)
+        self.assertEqual(responses[-1]["readBytes"], 100000)
+        with open(output_file, "rb") as f:
+            self.assertEqual(f.read(), b"<scf>fake</scf>")
+
+    def test_restart_after_crash(self):
+        first = self._execute("generateScf")[-1]["pid"]
+        with self.assertRaises(AdminCliWorkerError):
+            self._execute("crash")
+        second = self._execute("generateScf")[-1]["pid"]
+        self.assertNotEqual(first, second)
+        self.assertFalse(_alive(first))
+
+    def test_abort(self):
+        self._execute("generateScf")
+        worker = next(iter(self.pool.workers.values()))
+        errors = []
+
+        def run():
+            try:
+                self._execute("sleep", parameters={"seconds": 30})
+            except AdminCliWorkerError as e:
+                errors.append(str(e))
+
+        t = threading.Thread(target=run)
+        t.start()
+        time.sleep(0.5)
+        worker.abort()
+        t.join(10)
+        self.assertFalse(t.is_alive())
+        self.assertEqual(errors, ["요청이 취소되었습니다."])
+        # 취소 뒤 같은 worker로 다시 요청하면 새로 띄워서 처리
+        self.assertEqual(self._execute("generateScf")[-1]["requestStatus"], "completed")
+
+    def test_evict_idle_worker(self):
+        first = self._execute("generateScf", host="10.0.0.1")[-1]["pid"]
+        second = self._execute("generateScf", host="10.0.0.2")[-1]["pid"]
+        self.assertEqual([key[0] for key in self.pool.workers], ["10.0.0.2"])
+        self.assertFalse(_alive(first))
+        self.assertTrue(_alive(second))
+
+    def test_worker_evicted_while_acquiring(self):
+        self._execute("generateScf")
+        key, worker = next(iter(self.pool.workers.items()))
+
+        def evict():
+            with self.pool._lock:
+                self.pool._evict_idle()
+
+        worker.lock = _RacyLock(evict)
+        # lock을 기다리는 사이 정리된 worker는 쓰지 않고, pool에 다시 등록된 새 worker로 처리
+        self._execute("generateScf")
+        self.assertIsNot(self.pool.workers[key], worker)
+        self.assertIsNone(worker.proc)
+
+
+if __name__ == "__main__":
+    unittest.main()